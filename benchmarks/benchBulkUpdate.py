@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of applying a telemetry frame, one voltage by instance, to
+    instances of a columnar class: setting each instance property, or
+    using setColumn. One instance in a hundred is observed.
+
+Execute from the repository root:
+$ python benchmarks/benchBulkUpdate.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable  # noqa: E402
+
+
+class Battery(Observable, columns={"voltage": "l", "level": "d"}):
+    pass
+
+
+def noop(*args):
+    pass
+
+
+def main(count=50000):
+    batteries = [Battery() for _ in range(count)]
+    for battery in batteries[::100]:
+        battery.observeElement("voltage", noop)
+    Battery.observeColumn("voltage", noop)
+    rows = [battery.getRow() for battery in batteries]
+    frames = ([3000 + index for index in range(count)],
+              [3001 + index for index in range(count)])
+    frame = [0]
+
+    def setInstances():
+        frame[0] ^= 1
+        for battery, voltage in zip(batteries, frames[frame[0]]):
+            battery.voltage = voltage
+
+    def setColumn():
+        frame[0] ^= 1
+        Battery.setColumn("voltage", rows, frames[frame[0]])
+
+    for name, statement in (("set each instance", setInstances),
+                            ("setColumn", setColumn)):
+        duration = min(timeit.repeat(statement, number=1, repeat=5))
+        print("{0:<30} {1:8.1f} ms".format(name, duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Micro benchmark of the per notification overhead of the diffusion.
+
+Execute from the repository root:
+$ python benchmarks/benchDispatch.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable, observable_property  # noqa: E402
+
+
+class Battery(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__voltage = 0
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+
+def measure(statement, number):
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def main(observerCount=10, number=20000):
+    battery = Battery()
+    for _ in range(observerCount):
+        battery.observeElement("voltage", lambda previous, actual: None)
+
+    def setProperty():
+        battery.voltage = 1
+
+    def diffuseManually():
+        battery.diffuse("voltage", 0, 1)
+
+    for name, statement in (("property set", setProperty),
+                            ("diffuse(str, any, any)", diffuseManually)):
+        perNotification = measure(statement, number) / observerCount
+        print("{0:<24} {1:8.1f} ns per notification".format(
+            name, perNotification * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the memory used by each instance, and of a scan of one
+    property across the instances, with and without columns.
+
+Execute from the repository root:
+$ python benchmarks/benchInstanceMemory.py
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable, observable_property  # noqa: E402
+
+
+class Battery(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__voltage = 0
+        self.__level = 0.0
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+    @observable_property
+    def level(self):
+        return self.__level
+
+    @level.setter
+    def level(self, value):
+        self.__level = value
+
+
+class ColumnarBattery(Observable, columns={"voltage": "l", "level": "d"}):
+    pass
+
+
+def measure(cls, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls() for _ in range(count)]
+    for index, instance in enumerate(instances):
+        instance.voltage = 3000 + index
+        instance.level = index / count
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return instances, (after - before) / count
+
+
+def main(count=100000):
+    batteries, perBattery = measure(Battery, count)
+    columnar, perColumnar = measure(ColumnarBattery, count)
+    print("{0:<30} {1:8.1f} bytes".format("per instance", perBattery))
+    print("{0:<30} {1:8.1f} bytes".format("per columnar instance",
+                                         perColumnar))
+
+    def scanInstances():
+        return sum(battery.voltage for battery in batteries)
+
+    def scanColumn():
+        return sum(ColumnarBattery.getColumn("voltage"))
+
+    for name, statement in (("sum of voltages", scanInstances),
+                            ("sum of voltage column", scanColumn)):
+        duration = min(timeit.repeat(statement, number=1, repeat=5))
+        print("{0:<30} {1:8.1f} ms".format(name, duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the memory used by each subscription.
+
+Execute from the repository root:
+$ python benchmarks/benchObserverMemory.py
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable  # noqa: E402
+from observablePy.ObserverStore import ObserverStore  # noqa: E402
+
+
+def voltageHandle(previousValue, value):
+    pass
+
+
+def main(count=100000):
+    # One element by subscription, as spread across many observables
+    elements = ["voltage{0}".format(index) for index in range(count)]
+    observers = ObserverStore(
+        Observable._diffuseActions, Observable._isolatedDiffuseActions)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for element in elements:
+        observers.add(element, voltageHandle)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print("{0:<30} {1:8.1f} bytes".format(
+        "per subscription", (after - before) / count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of a state observer when elements hold large containers.
+
+Execute from the repository root:
+$ python benchmarks/benchStateSnapshot.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable, observable_property  # noqa: E402
+
+
+class Battery(Observable):
+    def __init__(self, size):
+        super().__init__()
+        self.__voltage = 0
+        self.__cells = [[3.7, 3.6, 3.8] for _ in range(size)]
+        self.__history = {index: {"min": 3.2, "max": 4.2}
+                          for index in range(size)}
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+    @observable_property
+    def cells(self):
+        return self.__cells
+
+    @observable_property
+    def history(self):
+        return self.__history
+
+
+def main(size=10000, number=20):
+    for isolate in (False, True):
+        battery = Battery(size)
+        battery.observeState(lambda previous, actual: None, isolate=isolate)
+
+        def setProperty():
+            battery.voltage += 1
+
+        duration = min(timeit.repeat(
+            setProperty, number=number, repeat=5)) / number
+        print("{0:<30} {1:10.1f} us per set".format(
+            "state observer" + (", isolated" if isolate else ""),
+            duration * 1e6))
+
+
+if __name__ == '__main__':
+    main()
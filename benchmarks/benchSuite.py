@@ -0,0 +1,303 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark suite of the diffusion throughput and latency.
+
+Each benchmark gives the best time of one operation, in nanoseconds,
+    among several repeats. Results are written as JSON, and can be
+    compared to a baseline written by a previous run.
+
+Execute from the repository root:
+$ python benchmarks/benchSuite.py --output baseline.json
+$ python benchmarks/benchSuite.py --baseline baseline.json
+
+Options:
+    --output FILE      write the JSON results to FILE, stdout otherwise
+    --baseline FILE    compare to the results of FILE, exit with 1 when
+                       a benchmark is slower than the threshold
+    --threshold RATIO  tolerated slow down, 0.10 (10%) by default
+    --filter TEXT      only run the benchmarks whose name contains TEXT
+    --quick            less iterations, for a rough idea
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable, observable_property  # noqa: E402
+from observablePy import JournalWriter, glob  # noqa: E402
+
+
+class Battery(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__voltage = 0
+        self.__level = 0.0
+        self.__plugged = False
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+    @observable_property
+    def level(self):
+        return self.__level
+
+    @level.setter
+    def level(self, value):
+        self.__level = value
+
+    @observable_property
+    def plugged(self):
+        return self.__plugged
+
+    @plugged.setter
+    def plugged(self, value):
+        self.__plugged = value
+
+
+class CompiledBattery(Battery, compileSetters=True):
+    pass
+
+
+def noop(previous, actual):
+    pass
+
+
+def benchPropertySet(observerCount, cls=Battery):
+    battery = cls()
+    for _ in range(observerCount):
+        battery.observeElement("voltage", noop)
+
+    def run():
+        battery.voltage = 1
+    return run
+
+
+def benchObserverType(what):
+    battery = Battery()
+    if what == "*":
+        battery.observeState(noop)
+    else:
+        battery.observeElements(what, noop)
+
+    def run():
+        battery.voltage = 1
+    return run
+
+
+def benchPatternObserver(elementCount):
+    state = Observable()
+    for cell in range(elementCount):
+        state.addObservableElement("cell{0}_voltage".format(cell))
+    state.observeElements(glob("cell*_voltage"), noop)
+
+    def run():
+        state.diffuseElement("cell0_voltage", 0, 1)
+    return run
+
+
+def benchDiffuseElements():
+    battery = Battery()
+    battery.observeElements(["voltage", "level"], noop)
+    battery.observeState(noop)
+    previous = {"voltage": 0, "level": 0.0, "plugged": False}
+    actual = {"voltage": 1, "level": 0.5, "plugged": True}
+
+    def run():
+        battery.diffuse(previous, actual)
+    return run
+
+
+def benchDiffuseWideState(elementCount, changedCount):
+    state = Observable()
+    names = ["element{0}".format(i) for i in range(elementCount)]
+    for name in names:
+        state.addObservableElement(name)
+        state.observeElement(name, noop)
+    state.observeState(noop)
+    previous = dict.fromkeys(names, 0)
+    actual = dict(previous)
+    for name in names[:changedCount]:
+        actual[name] = 1
+
+    def run():
+        state.diffuse(previous, actual)
+    return run
+
+
+def benchSetState(bulk):
+    battery = Battery()
+    battery.observeElement("voltage", noop)
+    battery.observeElement("level", noop)
+    battery.observeState(noop)
+    values = {"voltage": 1, "level": 0.5, "plugged": True}
+    toggle = [0]
+
+    def run():
+        # alternate values, so each run changes every element
+        toggle[0] ^= 1
+        values["voltage"] = toggle[0]
+        if bulk:
+            battery.setState(values)
+        else:
+            for elementName, value in values.items():
+                setattr(battery, elementName, value)
+    return run
+
+
+def benchJournal():
+    battery = Battery()
+    directory = tempfile.TemporaryDirectory()
+    writer = JournalWriter(directory.name)
+    battery.addDiffusionTap(writer)
+
+    def run():
+        # keep the directory until the benchmark is done
+        directory
+        battery.voltage = 1
+    return run
+
+
+def benchSubscribeChurn(observerCount):
+    battery = Battery()
+    for _ in range(observerCount):
+        battery.observeElement("level", noop)
+
+    def run():
+        battery.observeElement("voltage", noop)
+        battery.unObserve("voltage", noop)
+    return run
+
+
+def benchConstruction():
+    return Battery
+
+
+BENCHMARKS = (
+    ("set/0 observer", lambda: benchPropertySet(0)),
+    ("set/1 observer", lambda: benchPropertySet(1)),
+    ("set/10 observers", lambda: benchPropertySet(10)),
+    ("set/1000 observers", lambda: benchPropertySet(1000)),
+    ("compiled set/0 observer",
+        lambda: benchPropertySet(0, CompiledBattery)),
+    ("compiled set/1 observer",
+        lambda: benchPropertySet(1, CompiledBattery)),
+    ("compiled set/10 observers",
+        lambda: benchPropertySet(10, CompiledBattery)),
+    ("observer/element", lambda: benchObserverType("voltage")),
+    ("observer/listOfElements",
+        lambda: benchObserverType(["voltage", "level"])),
+    ("observer/state", lambda: benchObserverType("*")),
+    ("observer/pattern, 300 elements", lambda: benchPatternObserver(300)),
+    ("diffuse(dict, dict)", benchDiffuseElements),
+    ("diffuse(dict, dict)/200 elements, 3 changed",
+        lambda: benchDiffuseWideState(200, 3)),
+    ("set/3 properties one by one", lambda: benchSetState(False)),
+    ("setState/3 properties", lambda: benchSetState(True)),
+    ("journal/set written to a JournalWriter", benchJournal),
+    ("churn/subscribe+unsubscribe", lambda: benchSubscribeChurn(0)),
+    ("churn/subscribe+unsubscribe, 100 others",
+        lambda: benchSubscribeChurn(100)),
+    ("construction", benchConstruction),
+)
+
+
+def measure(statement, budget, repeat):
+    """
+    Best time of one call of statement, in nanoseconds.
+
+    :param func statement: the function to time
+    :param float budget: the seconds to spend by repeat
+    :param int repeat: the number of repeats
+    """
+    timer = timeit.Timer(statement)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * budget / max(elapsed, 1e-9)))
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def run(filter=None, quick=False):
+    budget, repeat = (0.05, 3) if quick else (0.2, 5)
+    results = {}
+    for name, factory in BENCHMARKS:
+        if filter is not None and filter not in name:
+            continue
+        results[name] = measure(factory(), budget, repeat)
+        print("{0:<42} {1:12.1f} ns".format(name, results[name]),
+              file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "unit": "ns",
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Print the ratio of each result to its baseline.
+
+    :return: the names of the benchmarks slower than the threshold.
+    :rtype: Array
+    """
+    regressions = []
+    for name, value in report["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print("{0:<42} {1:>12}".format(name, "new"))
+            continue
+
+        ratio = value / reference
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  slower"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            mark = "  faster"
+        print("{0:<42} {1:12.1f} ns {2:6.2f}x{3}".format(
+            name, value, ratio, mark))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the diffusion of observablePy.")
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--filter")
+    parser.add_argument("--quick", action="store_true")
+    arguments = parser.parse_args(argv)
+
+    report = run(arguments.filter, arguments.quick)
+
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    elif not arguments.baseline:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baselineFile:
+            baseline = json.load(baselineFile)
+        if compare(report, baseline, arguments.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of a set heavy workload when nobody observes the properties.
+
+Execute from the repository root:
+$ python benchmarks/benchUnobservedSet.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from observablePy import Observable, observable_property  # noqa: E402
+
+
+class Battery(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__voltage = 0
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+
+class PlainBattery(object):
+    def __init__(self):
+        self.__voltage = 0
+
+    @property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+
+def main(number=200000):
+    cases = (("plain property", PlainBattery()),
+             ("observable property, no observer", Battery()),
+             ("observable property, other observed", _otherObserved()))
+
+    for name, battery in cases:
+        def setProperty():
+            battery.voltage = 1
+
+        duration = min(timeit.repeat(
+            setProperty, number=number, repeat=5)) / number
+        print("{0:<38} {1:8.1f} ns per set".format(name, duration * 1e9))
+
+
+def _otherObserved():
+    class SmartBattery(Battery):
+        def __init__(self):
+            super().__init__()
+            self.__level = 0
+
+        @observable_property
+        def level(self):
+            return self.__level
+
+    battery = SmartBattery()
+    battery.observeElement("level", lambda previous, actual: None)
+    return battery
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+from array import array
+from collections import namedtuple
+from time import monotonic
+
+"""
+Keep the last changes diffused by an observable, to debug or to let a
+    late observer catch up.
+
+Changes are written in slots allocated once, overwriting the oldest
+    ones when full. Timestamps come from time.monotonic.
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+battery.enableHistory(capacity=1000)
+...
+for entry in battery.getHistory(element="voltage"):
+    print(entry.timestamp, entry.previous, entry.actual)
+
+# A late observer catches up with the last minute of changes
+battery.observeElement("voltage", voltageHandle)
+battery.replay(voltageHandle, since=time.monotonic() - 60, what="voltage")
+
+"""
+
+
+HistoryEntry = namedtuple(
+    "HistoryEntry", ("element", "previous", "actual", "timestamp"))
+
+
+class ChangeHistory():
+    def __init__(self, capacity=256, elements=None):
+        """
+        :param int capacity: the number of changes kept
+        :param Array elements: the element names to record, None to
+                               record all elements.
+        """
+        if capacity < 1:
+            raise ValueError("capacity should be at least 1")
+
+        self._capacity = capacity
+        self._recorded = frozenset(elements) if elements is not None else None
+        self._elements = [None] * capacity
+        self._previous = [None] * capacity
+        self._actual = [None] * capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        # Count of changes recorded, the next slot is _count % capacity
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, element, previous, actual):
+        """
+        Record a change, called by the observable diffusing it.
+        """
+        if self._recorded is not None and element not in self._recorded:
+            return
+
+        with self._lock:
+            slot = self._count % self._capacity
+            self._elements[slot] = element
+            self._previous[slot] = previous
+            self._actual[slot] = actual
+            self._timestamps[slot] = monotonic()
+            self._count += 1
+
+    def __len__(self):
+        return min(self._count, self._capacity)
+
+    def getEntries(self, since=None, element=None):
+        """
+        Get the recorded changes, oldest first.
+
+        :param float since: only give the changes recorded after this
+                            time.monotonic timestamp.
+        :param str|Array element: only give the changes of this element
+                                  name, or names.
+        :rtype: Array of HistoryEntry
+        """
+        if isinstance(element, str):
+            element = (element,)
+
+        with self._lock:
+            count = self._count
+            slots = range(max(0, count - self._capacity), count)
+            entries = []
+            for position in slots:
+                slot = position % self._capacity
+                if since is not None and self._timestamps[slot] <= since:
+                    continue
+                if element is not None and self._elements[slot] not in element:
+                    continue
+                entries.append(HistoryEntry(
+                    self._elements[slot], self._previous[slot],
+                    self._actual[slot], self._timestamps[slot]))
+        return entries
+
+    def clear(self):
+        """
+        Forget the recorded changes.
+        """
+        with self._lock:
+            for slot in range(self._capacity):
+                self._elements[slot] = None
+                self._previous[slot] = None
+                self._actual[slot] = None
+            self._count = 0
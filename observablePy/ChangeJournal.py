@@ -0,0 +1,255 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import mmap
+import os
+import pickle
+import struct
+import threading
+from collections import namedtuple
+from time import time
+
+"""
+Append only binary journal of the diffused changes, for audit and
+    offline processing.
+
+JournalWriter is a diffusion tap writing each change to segment files
+    of a directory, journal-000001.log, journal-000002.log... using
+    buffered writes. JournalReader memory maps the segments, and reads
+    the changes lazily, or replays them to an observable.
+
+A tap failing, e.g. on a value that can not be pickled, is logged by
+    the observable, and the observers are still called.
+
+Segment format, little endian:
+    header: b"OBSPYJ01"
+    records: length (uint32, of the record after it), element id
+             (uint32), timestamp (float64, time.time), then:
+             - for a change: the pickled (previous, actual) values,
+             - for element id 0xFFFFFFFF: the defined element id (uint32)
+               and the element name, utf-8 encoded. Each segment
+               defines its element ids before using them.
+
+A record truncated by a crash ends the reading of its segment.
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+from observablePy import JournalReader, JournalWriter
+
+writer = JournalWriter("journal")
+battery.addDiffusionTap(writer)
+...
+battery.removeDiffusionTap(writer)
+writer.close()
+
+for record in JournalReader("journal"):
+    print(record.element, record.timestamp, record.actual)
+
+JournalReader("journal").replay(Battery())
+
+"""
+
+
+JournalRecord = namedtuple(
+    "JournalRecord", ("element", "timestamp", "previous", "actual"))
+
+_MAGIC = b"OBSPYJ01"
+_HEADER = struct.Struct("<IId")
+_ELEMENT_ID = struct.Struct("<I")
+_DEFINITION = 0xFFFFFFFF
+_SEGMENT_NAME = "journal-{0:06d}.log"
+
+
+class JournalWriter():
+    def __init__(self, directory, segmentSize=64 * 1024 * 1024,
+                 bufferSize=64 * 1024):
+        """
+        :param str directory: the directory of the segment files,
+                              created when needed. Writing continues
+                              in a new segment after the existing ones.
+        :param int segmentSize: bytes from which a new segment starts
+        :param int bufferSize: bytes buffered before writing them
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._segmentSize = segmentSize
+        self._bufferSize = bufferSize
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        self._file = None
+        self._segment = max(
+            [int(name[8:14]) for name in _segmentNames(directory)],
+            default=0)
+        self._openSegment()
+
+    def __call__(self, element, previous, actual):
+        """
+        Append a change, called by the observable diffusing it.
+
+        :raises pickle.PicklingError: if a value can not be pickled
+        """
+        payload = pickle.dumps((previous, actual), pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._file is None:
+                raise ValueError("The journal is closed.")
+            elementId = self._elementIds.get(element)
+            if elementId is None:
+                elementId = self._define(element)
+            self._append(elementId, time(), payload)
+
+            if len(self._buffer) >= self._bufferSize:
+                self._write()
+                if self._written >= self._segmentSize:
+                    self._file.close()
+                    self._openSegment()
+
+    def flush(self):
+        """
+        Write the buffered changes to the segment file.
+        """
+        with self._lock:
+            self._write()
+
+    def close(self):
+        """
+        Write the buffered changes and close the segment file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._write()
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _openSegment(self):
+        self._segment += 1
+        self._file = open(os.path.join(
+            self._directory, _SEGMENT_NAME.format(self._segment)), "xb",
+            buffering=0)
+        self._buffer += _MAGIC
+        self._written = 0
+        # element name -> id, defined again in each segment
+        self._elementIds = {}
+
+    def _define(self, element):
+        elementId = self._elementIds[element] = len(self._elementIds)
+        self._append(_DEFINITION, 0.0,
+                     _ELEMENT_ID.pack(elementId) + element.encode("utf-8"))
+        return elementId
+
+    def _append(self, elementId, timestamp, payload):
+        self._buffer += _HEADER.pack(
+            _HEADER.size - 4 + len(payload), elementId, timestamp)
+        self._buffer += payload
+
+    def _write(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._written += len(self._buffer)
+            self._buffer = bytearray()
+
+
+class JournalReader():
+    def __init__(self, path):
+        """
+        :param str path: a journal directory, or a segment file
+        """
+        if os.path.isdir(path):
+            self._segments = [os.path.join(path, name)
+                              for name in _segmentNames(path)]
+        else:
+            self._segments = [path]
+
+    def __iter__(self):
+        """
+        Read the changes lazily, in the order they were written.
+
+        :rtype: iter of JournalRecord
+        :raises ValueError: if a file is not a journal segment
+        """
+        for segment in self._segments:
+            yield from self._readSegment(segment)
+
+    def replay(self, observable, coalesce=False):
+        """
+        Set the recorded values to an observable, in the order they
+            were written, each diffusing its change. Elements without a
+            setter, e.g. added using addObservableElement, are diffused
+            using diffuseElement with the recorded values.
+
+        :param Diffusible observable: the observable to set
+        :param bool coalesce: when true, set the values in one batch:
+                              each element is diffused once the journal
+                              is read, with its last value.
+        :return: the number of changes replayed
+        :rtype: int
+        """
+        if coalesce:
+            with observable.batch():
+                return self.replay(observable)
+
+        count = 0
+        cls = type(observable)
+        for record in self:
+            descriptor = getattr(cls, record.element, None)
+            if (isinstance(descriptor, property) and
+                    descriptor.fset is not None):
+                setattr(observable, record.element, record.actual)
+            else:
+                observable.diffuseElement(
+                    record.element, record.previous, record.actual)
+            count += 1
+        return count
+
+    @staticmethod
+    def _readSegment(segment):
+        with open(segment, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                if mapped[:len(_MAGIC)] != _MAGIC:
+                    raise ValueError(
+                        "{0} is not a journal segment".format(segment))
+
+                view = memoryview(mapped)
+                try:
+                    yield from _parseRecords(view, len(_MAGIC))
+                finally:
+                    view.release()
+
+
+def _parseRecords(view, offset):
+    elements = {}
+    end = len(view)
+    while offset + _HEADER.size <= end:
+        length, elementId, timestamp = _HEADER.unpack_from(view, offset)
+        recordEnd = offset + 4 + length
+        if recordEnd > end:
+            # Truncated by a crash while writing
+            return
+
+        start = offset + _HEADER.size
+        offset = recordEnd
+        if elementId == _DEFINITION:
+            definedId = _ELEMENT_ID.unpack_from(view, start)[0]
+            elements[definedId] = bytes(
+                view[start + _ELEMENT_ID.size:recordEnd]).decode("utf-8")
+            continue
+
+        with view[start:recordEnd] as payload:
+            previous, actual = pickle.loads(payload)
+        yield JournalRecord(elements[elementId], timestamp, previous, actual)
+
+
+def _segmentNames(directory):
+    return sorted(name for name in os.listdir(directory)
+                  if name.startswith("journal-") and name.endswith(".log"))
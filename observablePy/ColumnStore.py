@@ -0,0 +1,247 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+import weakref
+from array import array
+from collections import deque
+from itertools import compress, islice
+from operator import itemgetter, lt, ne
+
+"""
+Store the observable properties values of all instances of a class in
+    columns, one array.array by property, indexed by instance row.
+
+Used by the Observable classes declared with columns, refer to
+    Observable. Rows of garbage collected instances are reused, their
+    values set back to zero. Rows are allocated under a lock, instances
+    being created from any thread.
+
+A column view is a memoryview of the array, so reading a full column
+    does not copy it. Columns grow by moving to a larger array: a view
+    shows the column as it was when taken, take a new one after creating
+    instances.
+
+update writes many rows of a column at once. Instances are set one by
+    one only when watched: observed instances, or all of them when a
+    computed property depends on a column.
+"""
+
+
+class _Column():
+    __slots__ = ("typecode", "values", "observers")
+
+    def __init__(self, typecode, capacity):
+        self.typecode = typecode
+        self.values = array(typecode, bytes(
+            array(typecode).itemsize * capacity))
+        # Functions called with the changes made by update
+        self.observers = ()
+
+
+class ColumnStore():
+    def __init__(self, columns, capacity=64):
+        """
+        :param dict columns: the array.array typecode by property name
+        :param int capacity: the rows allocated at first
+        """
+        self._capacity = capacity
+        self._columns = {name: _Column(typecode, capacity)
+                         for name, typecode in columns.items()}
+        # 1 for the rows used by an instance
+        self._alive = bytearray(capacity)
+        self._rowCount = 0
+        self._freeRows = []
+        # Rows released by the garbage collector, freed under the lock
+        self._releasedRows = []
+        self._lock = threading.Lock()
+        # Instances set one by one by update, weak reference by row
+        self._watched = {}
+        # When true, every instance is watched
+        self.watchAll = False
+
+    def getColumnNames(self):
+        """
+        :rtype: Array
+        """
+        return list(self._columns)
+
+    def getColumnObject(self, name):
+        """
+        The column keeping the values array, which is replaced when the
+            column grows.
+        """
+        return self._columns[name]
+
+    def allocate(self):
+        """
+        Give a row to a new instance.
+
+        :rtype: int
+        """
+        with self._lock:
+            self._freeReleasedRows()
+            if self._freeRows:
+                row = self._freeRows.pop()
+            else:
+                row = self._rowCount
+                if row == self._capacity:
+                    self._grow()
+                self._rowCount += 1
+            self._alive[row] = 1
+            return row
+
+    def release(self, row):
+        """
+        Free the row of an instance, to reuse it.
+            Called by the garbage collector, at any time: the row is
+            only queued, and freed by the next store operation.
+
+        :param int row: the row given by allocate
+        """
+        self._releasedRows.append(row)
+
+    def _freeReleasedRows(self):
+        # Called holding the lock
+        released = self._releasedRows
+        while released:
+            row = released.pop()
+            for column in self._columns.values():
+                column.values[row] = 0
+            self._alive[row] = 0
+            self._watched.pop(row, None)
+            self._freeRows.append(row)
+
+    def _freeReleased(self):
+        if self._releasedRows:
+            with self._lock:
+                self._freeReleasedRows()
+
+    def watch(self, row, instance):
+        """
+        Let update set the instance of a row using its property, so its
+            observers are called.
+
+        :param int row: the row of the instance
+        :param instance: the instance, weakly referenced
+        """
+        if row not in self._watched:
+            self._watched[row] = weakref.ref(instance)
+
+    def update(self, name, rows, values, setInstance):
+        """
+        Write values of a column, skipping the ones equal to the column
+            values. No comparator is applied.
+
+        :param str name: the property name
+        :param Array rows: the rows to write
+        :param Array values: the value of each row
+        :param func setInstance: called with the instance and the value
+                                 of a watched row, instead of writing it.
+                                 It should write the value even when an
+                                 observer fails, and not raise.
+        :return: the changed rows, their previous and actual values.
+        :rtype: tuple of 3 array.array
+        :raises KeyError: if the column does not exist
+        :raises ValueError: if a row is not used by an instance, or if
+                            the lengths differ.
+        :raises TypeError: if a value does not match the column type
+        """
+        column = self._columns[name]
+        typecode = column.typecode
+        self._freeReleased()
+        # Converted before writing, so a bad row or value writes nothing
+        rows = array("q", rows).tolist()
+        values = array(typecode, values)
+        if len(rows) != len(values):
+            raise ValueError("rows and values lengths differ")
+        if not rows:
+            return array("q"), array(typecode), array(typecode)
+        if (min(rows) < 0 or max(rows) >= self._rowCount or
+                not all(_pick(self._alive, rows))):
+            raise ValueError("A row is not used by an instance")
+
+        # The loops run in itemgetter, map and compress, not in Python
+        columnValues = column.values
+        previousValues = _pick(columnValues, rows)
+        changed = list(compress(range(len(rows)),
+                                map(ne, previousValues, values)))
+        if len(changed) < len(rows):
+            rows = _pick(rows, changed)
+            previousValues = _pick(previousValues, changed)
+            values = _pick(values, changed)
+        changedRows = array("q", rows)
+        previousValues = array(typecode, previousValues)
+        actualValues = array(typecode, values)
+        if not changedRows:
+            return changedRows, previousValues, actualValues
+
+        first = changedRows[0]
+        if (changedRows[-1] - first == len(changedRows) - 1 and
+                all(map(lt, changedRows, islice(changedRows, 1, None)))):
+            # Consecutive rows, written at once
+            columnValues[first:first + len(changedRows)] = actualValues
+        else:
+            deque(map(columnValues.__setitem__, changedRows, actualValues),
+                  maxlen=0)
+
+        if self._watched:
+            watched = self._watched
+            for index in compress(range(len(changedRows)),
+                                  map(watched.__contains__, changedRows)):
+                row = changedRows[index]
+                instance = watched[row]()
+                if instance is not None:
+                    # Set again by the instance, calling its observers
+                    columnValues[row] = previousValues[index]
+                    setInstance(instance, actualValues[index])
+        return changedRows, previousValues, actualValues
+
+    def __len__(self):
+        """
+        :return: the number of rows in use.
+        """
+        self._freeReleased()
+        return self._rowCount - len(self._freeRows)
+
+    def getColumn(self, name):
+        """
+        Read a column without copying it.
+
+        :param str name: the property name
+        :return: the values of the rows, including the free ones, refer
+                 to getAlive.
+        :rtype: memoryview
+        :raises KeyError: if the column does not exist
+        """
+        self._freeReleased()
+        return memoryview(self._columns[name].values)[:self._rowCount]
+
+    def getAlive(self):
+        """
+        :return: by row, 1 when used by an instance, 0 when free.
+        :rtype: memoryview
+        """
+        self._freeReleased()
+        return memoryview(self._alive)[:self._rowCount]
+
+    def _grow(self):
+        capacity = self._capacity * 2
+        for column in self._columns.values():
+            values = array(column.typecode, column.values)
+            values.extend(array(column.typecode, bytes(
+                values.itemsize * (capacity - self._capacity))))
+            column.values = values
+        alive = bytearray(capacity)
+        alive[:self._capacity] = self._alive
+        self._alive = alive
+        self._capacity = capacity
+
+
+def _pick(values, indexes):
+    # The values at the indexes, as a tuple
+    if not indexes:
+        return ()
+    if len(indexes) == 1:
+        return (values[indexes[0]],)
+    return itemgetter(*indexes)(values)
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Comparators used to detect when a value did not change, so the change
+    is not diffused.
+
+A comparator is a function receiving the previous value and the new
+    value, it returns true when both are considered the same. A
+    comparator raising an exception tells the value changed.
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+from observablePy import Observable, observable_property, tolerance
+
+class Battery(Observable):
+def __init__(self):
+    super().__init__()
+    self.__voltage = 0
+    self.addObservableElement("plugged", compare="equality")
+
+@observable_property(compare=tolerance(0.5))
+def voltage(self):
+    return self.__voltage
+
+"""
+
+
+def equality(previousValue, value):
+    """
+    Same when both values are equal.
+    """
+    return previousValue == value
+
+
+def identity(previousValue, value):
+    """
+    Same when both values are the same object.
+    """
+    return previousValue is value
+
+
+def tolerance(delta):
+    """
+    Build a comparator for numbers.
+
+    :param float delta: the maximal difference considered the same
+    :return: the comparator
+    :rtype: func
+    """
+    def withinTolerance(previousValue, value):
+        if previousValue is None or value is None:
+            return previousValue is value
+        return abs(value - previousValue) <= delta
+
+    return withinTolerance
+
+
+def _isSame(compare, previousValue, value):
+    # A comparator failing, e.g. tolerance given values that are not
+    #  numbers, tells the value changed: the change is diffused.
+    try:
+        return bool(compare(previousValue, value))
+    except Exception:
+        return False
+
+
+_namedComparators = {
+    "equality": equality,
+    "identity": identity
+}
+
+
+def getComparator(compare):
+    """
+    Give the comparator to use.
+
+    :param str|func compare: "equality", "identity", a comparator or None
+    :return: the comparator, or None when changes are not compared.
+    :rtype: func
+    :raises TypeError: if compare is not a known name nor a function
+    """
+    if compare is None or callable(compare):
+        return compare
+
+    if isinstance(compare, str) and compare in _namedComparators:
+        return _namedComparators[compare]
+
+    raise TypeError(
+        "'compare' parameter should be 'equality', 'identity' or " +
+        "a function. Received '{0}'".format(compare))
@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Decorator to set a computed observable property, derived from other
+    observable properties.
+
+The value is computed on first read and cached by instance. Setting one
+    of the properties it depends on, changing in place the observable
+    collection it holds, or diffusing it invalidates the cache:
+    - when the computed property is observed, it is computed again at
+      once, and diffused only if its value changed,
+    - otherwise, it is computed again on next read.
+
+A computed property can depend on other computed properties.
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+from observablePy import Observable, observable_property
+from observablePy import computed_observable_property
+
+class Battery(Observable):
+    ...voltage and current observable properties...
+
+    @computed_observable_property(dependsOn=["voltage", "current"])
+    def power(self):
+        return self.voltage * self.current
+
+battery.observeElement("power", powerHandle)
+battery.voltage = 3392  # powerHandle is called if the power changed
+
+"""
+
+
+from .Comparators import _isSame
+from .ObservableProperty import observable_property
+
+# Cached value of an instance never computed, or invalidated
+_missing = object()
+
+
+class computed_observable_property(observable_property):
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None,
+                 compare="equality", dependsOn=()):
+        """
+        :param compare: the comparator telling if the computed value
+                        changed, "equality" by default.
+                        Refer to Comparators.
+        :param Array dependsOn: the names of the observable properties
+                                the value is computed from, or of
+                                elements added using
+                                addObservableElement.
+        """
+        if fset is not None or fdel is not None:
+            raise TypeError(
+                "A computed observable property can not be set.")
+        super(computed_observable_property, self).__init__(
+            fget, None, None, doc, compare)
+        self.dependsOn = tuple(dependsOn)
+        # The key of the cached value in the instance dict
+        self._cacheKey = "_computed_{0}".format(self.name)
+
+    def setter(self, fset):
+        raise TypeError("A computed observable property can not be set.")
+
+    def deleter(self, fdel):
+        raise TypeError(
+            "A computed observable property can not be deleted.")
+
+    def _withOptions(self, other):
+        other = super(computed_observable_property, self)._withOptions(
+            other)
+        other.dependsOn = self.dependsOn
+        return other
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        cache = obj.__dict__
+        value = cache.get(self._cacheKey, _missing)
+        if value is _missing:
+            value = cache[self._cacheKey] = self.fget(obj)
+        return value
+
+    def __set__(self, obj, value):
+        raise AttributeError(
+            'Can not set the computed property "{0}"'.format(self.name))
+
+    def __delete__(self, obj):
+        raise AttributeError(
+            'Can not delete the computed property "{0}"'.format(self.name))
+
+    def _prepare(self, obj):
+        # Compute the value before a dependency changes, when observed,
+        #  so the previous value can be diffused.
+        if (self._cacheKey not in obj.__dict__ and
+                obj.isObserved(self.name)):
+            self.__get__(obj)
+        self._prepareDependents(obj)
+
+    def _refresh(self, obj, changes=None):
+        # A dependency changed: compute again when observed, otherwise
+        #  forget the cached value.
+        cache = obj.__dict__
+        if obj.isObserved(self.name):
+            previousValue = cache.get(self._cacheKey)
+            value = cache[self._cacheKey] = self.fget(obj)
+            if (self.compare is None or
+                    not _isSame(self.compare, previousValue, value)):
+                if changes is None:
+                    obj._diffuseChange(self.name, previousValue, value)
+                else:
+                    changes[self.name] = (previousValue, value)
+        else:
+            cache.pop(self._cacheKey, None)
+
+        self._refreshDependents(obj, changes)
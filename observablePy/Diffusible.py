@@ -1,28 +1,78 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import asyncio
 import copy
+import logging
+from contextlib import contextmanager
+from functools import partial
+from inspect import isawaitable
+from .Comparators import _isSame, equality
+from .DiffusionExecutor import asDiffusionExecutor
+from .DiffusionMetrics import DiffusionMetrics
+from .DiffusionStats import DiffusionStats
 from .ObserverStore import ObserverStore
 from .ObserverTypeEnum import observerTypeEnum
 from .DiffusingModeEnum import diffusingModeEnum
 
+_logger = logging.getLogger(__name__)
+
 
 class Diffusible(object):
     __diffuseActionsMatrix = {
         diffusingModeEnum.element: {
             observerTypeEnum.element: "_diffuseElement",
             observerTypeEnum.listOfElements: "_diffuseElementsOrState",
+            observerTypeEnum.pattern: "_diffusePatternElement",
             observerTypeEnum.state: "_diffuseElementsOrState",
         },
         diffusingModeEnum.elements: {
             observerTypeEnum.element: "_diffuseElementIn",
             observerTypeEnum.listOfElements: "_diffuseElementsIn",
+            observerTypeEnum.pattern: "_diffusePatternIn",
             observerTypeEnum.state: "_diffuseStateIn",
         }
     }
 
-    def __init__(self):
-        self.__observers = {}
+    # Position of each diffusing mode in the compiled actions.
+    _diffuseModes = (diffusingModeEnum.element, diffusingModeEnum.elements)
+
+    # Depth of nested batches, changes are diffused when it returns to 0.
+    _batchDepth = 0
+    # Count of suppressed diffusions by element name, created when needed.
+    _suppressedDiffusions = None
+    # DiffusionExecutor calling the observers, None to call them inline.
+    _diffusionExecutor = None
+    # DiffusionStats timing the observers, None when not enabled.
+    _diffusionStats = None
+    # Functions receiving each diffused change, refer to addDiffusionTap.
+    _taps = ()
+    # DiffusionMetrics counting the diffusions of the class instances,
+    #  None when not enabled.
+    _diffusionMetrics = None
+
+    def __init_subclass__(cls, **kwargs):
+        super(Diffusible, cls).__init_subclass__(**kwargs)
+        cls._compileDiffuseActions()
+
+    @classmethod
+    def _compileDiffuseActions(cls):
+        """
+        Resolve the action names once per class, honouring overridden
+            actions, so diffusing does not look them up per observer.
+
+        _diffuseActions maps an observer type to its actions, ordered
+            as _diffuseModes. Each observer record receives its actions
+            when registered.
+        """
+        matrix = Diffusible.__diffuseActionsMatrix
+        cls._diffuseActions = {
+            type: tuple(getattr(cls, matrix[mode][type])
+                        for mode in cls._diffuseModes)
+            for type in matrix[diffusingModeEnum.element]}
+        cls._isolatedDiffuseActions = {
+            type: tuple(_isolated(action) for action in actions)
+            for type, actions in cls._diffuseActions.items()}
 
     def getObservableElements(self):
         raise NotImplementedError(
@@ -32,12 +82,70 @@ class Diffusible(object):
         raise NotImplementedError(
             'subclasses must override __getObserversIter()!')
 
+    def getComparator(self, elementName):
+        return None
+
+    def getSuppressedDiffusions(self):
+        """
+        Get how many diffusions were suppressed because the value
+            did not change, by element name.
+
+        :return: count of suppressed diffusions by element name.
+        :rtype: dict
+        """
+        return dict(self._suppressedDiffusions or {})
+
     def diffuse(self, *args):
         """
         this is a dispatcher of diffuse implementation.
         Depending of the arguments used.
+
+        Coroutine functions observing are scheduled on the running
+            event loop, or run to completion when no loop is running.
+        """
+        mode = self._getDiffusingMode(args)
+        self._diffuse(mode, *args)
+        self._onDiffused(args[0] if mode == diffusingModeEnum.elements
+                         else (args[0],))
+
+    async def adiffuse(self, *args):
+        """
+        Same as diffuse, awaiting the coroutine functions observing.
+            They run concurrently, once the other observers are called.
+        """
+        mode = self._getDiffusingMode(args)
+        awaiting = self._dispatch(mode, *args)
+        self._onDiffused(args[0] if mode == diffusingModeEnum.elements
+                         else (args[0],))
+        if awaiting:
+            await asyncio.gather(*awaiting)
+
+    def _onDiffused(self, elements):
+        """
+        Called once changes are diffused using diffuse, adiffuse or
+            diffuseElement, e.g. to refresh the values derived from them.
+
+        :param elements: the diffused element names
         """
+        pass
 
+    def _diffuseChange(self, element, previousValue, value, compare=True):
+        # Diffuse the change of an element made by the observable itself,
+        #  which already handled what _onDiffused would do.
+        awaiting = self._dispatch(
+            diffusingModeEnum.element, element, previousValue, value,
+            compare=compare)
+        if awaiting:
+            _runInBackground(awaiting)
+
+    async def _adiffuseChange(self, element, previousValue, value):
+        awaiting = self._dispatch(
+            diffusingModeEnum.element, element, previousValue, value)
+        if awaiting:
+            await asyncio.gather(*awaiting)
+
+    @staticmethod
+    def _getDiffusingMode(args):
         mode = diffusingModeEnum.unknown
         if (isinstance(args[0], str) and (len(args) == 3)):
             # reveived diffuse(str, any, any)
@@ -54,47 +162,519 @@ class Diffusible(object):
                 " 'dict(str: any), dict(str: any)'."
                 .format(args))
 
-        self._diffuse(mode, *args)
+        return mode
+
+    def diffuseElement(self, element, previousValue, value):
+        """
+        Diffuse the change of a single element.
+            Same as diffuse(str, any, any), without the arguments
+            evaluation.
+
+        :param str element: the changed element name
+        :param previousValue: the value before the change
+        :param value: the actual value
+        """
+        self._diffuse(diffusingModeEnum.element, element, previousValue, value)
+        self._onDiffused((element,))
+
+    def setDiffusionExecutor(self, executor):
+        """
+        Call the observers using an executor, so diffusing returns
+            without waiting for them. Each observer still receives
+            the changes in order.
+
+        :param executor: a DiffusionExecutor, or a
+                         concurrent.futures.Executor to use.
+                         None to call observers inline again.
+        """
+        self._diffusionExecutor = asDiffusionExecutor(executor)
+
+    def flushDiffusion(self, timeout=None):
+        """
+        Wait for the observers called using executors to be done.
+
+        :param float timeout: maximal seconds to wait for each executor,
+                              None to wait until done.
+        :return: true when all calls are done, false on timeout.
+        :rtype: bool
+        :raises Exception: the first error raised by an observer
+        """
+        executors = {}
+        if self._diffusionExecutor is not None:
+            executors[id(self._diffusionExecutor)] = self._diffusionExecutor
+        for observer in self.getObserversIterationGenerator():
+            if observer.executor is not None:
+                executors[id(observer.executor)] = observer.executor
+
+        done = True
+        for executor in executors.values():
+            done = executor.flush(timeout) and done
+        return done
+
+    def enableDiffusionStats(self, budget=None, onSlowObserver=None):
+        """
+        Time each observer call, by observer and element name.
+            Enabling again forgets the recorded durations.
+
+        :param float budget: seconds an observer call may take,
+                             None for no budget.
+        :param func onSlowObserver: called with the observer function,
+                                    the element name and the duration
+                                    when a call exceeds the budget.
+        """
+        self._diffusionStats = DiffusionStats(budget, onSlowObserver)
+
+    def disableDiffusionStats(self):
+        """
+        Stop timing the observer calls.
+        """
+        self._diffusionStats = None
+
+    def getDiffusionStats(self):
+        """
+        Get the timing of the observer calls, slowest total first.
+
+        :return: dicts of observing, call, element, count, and total,
+                 max and p99 durations in seconds. Empty when timing is
+                 not enabled.
+        :rtype: Array
+        """
+        if self._diffusionStats is None:
+            return []
+        return self._diffusionStats.getStats()
+
+    def addDiffusionTap(self, tap):
+        """
+        Give each diffused change to a function, before the observers
+            are called. A tap receives the changes of all elements,
+            observed or not, e.g. to record them. An exception raised
+            by a tap is logged, the observers are still called.
+            The function should have 3 parameters:
+            - element,
+            - previousValue,
+            - actualValue
+
+        :param func tap: the function to call
+        """
+        self._taps += (tap,)
+
+    def removeDiffusionTap(self, tap):
+        """
+        :param func tap: the function given to addDiffusionTap
+        :raises ValueError: if the tap was not added
+        """
+        if tap not in self._taps:
+            raise ValueError("Unknown diffusion tap {0}".format(tap))
+        taps = list(self._taps)
+        taps.remove(tap)
+        self._taps = tuple(taps)
+
+    @classmethod
+    def enableDiffusionMetrics(cls):
+        """
+        Count the diffusions of the class instances, by element name.
+            Subclasses share the counters, unless enabled for them too.
+            Refer to DiffusionMetrics.
+        """
+        if "_diffusionMetrics" not in cls.__dict__ or (
+                cls._diffusionMetrics is None):
+            cls._diffusionMetrics = DiffusionMetrics()
+
+    @classmethod
+    def disableDiffusionMetrics(cls):
+        """
+        Stop counting the diffusions of the class instances, and forget
+            the counters.
+        """
+        cls._diffusionMetrics = None
+
+    @classmethod
+    def getDiffusionMetrics(cls):
+        """
+        Get the diffusion counters of the class instances, by element
+            name. Refer to DiffusionMetrics.
+
+        :return: changes, notifications, suppressed, failed and the
+                 fanOut histogram by element name. Empty when the
+                 metrics are not enabled.
+        :rtype: dict
+        """
+        if cls._diffusionMetrics is None:
+            return {}
+        return cls._diffusionMetrics.snapshot()
+
+    @classmethod
+    def resetDiffusionMetrics(cls):
+        """
+        Set the diffusion counters of the class back to zero.
+        """
+        if cls._diffusionMetrics is not None:
+            cls._diffusionMetrics.reset()
+
+    def beginBatch(self):
+        """
+        Start recording changes instead of diffusing them.
+            Changes are diffused once, by the commit matching the
+            first beginBatch. Batches can be nested.
+        """
+        if self._batchDepth == 0:
+            # element name -> [first previous value, last value]
+            self._batchChanges = {}
+        self._batchDepth += 1
+
+    def commit(self):
+        """
+        End a batch started by beginBatch.
+            When ending the outermost batch, each element observer is
+            called once with the first previous value and the last
+            value, and each elements or state observer is called once
+            with the merged previous and actual values.
+
+        :raises RuntimeError: if no batch is started
+        """
+        if self._batchDepth == 0:
+            raise RuntimeError("commit() called without beginBatch()")
+
+        self._batchDepth -= 1
+        if self._batchDepth == 0:
+            changes = self._batchChanges
+            self._batchChanges = None
+            if changes:
+                _runInBackground(self._diffuseBatch(changes))
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager for beginBatch and commit.
+
+        =================
+        How to use it
+        =================
+        .. code-block:: python
+            with battery.batch():
+                battery.voltage = 3392
+                battery.level = 0.67
+        """
+        self.beginBatch()
+        try:
+            yield self
+        finally:
+            self.commit()
+
+    def _recordBatch(self, mode, *args):
+        if mode == diffusingModeEnum.element:
+            changed = ((args[0], args[1], args[2]),)
+        else:
+            changed = ((element, args[0].get(element), value)
+                       for element, value in args[1].items())
+
+        changes = self._batchChanges
+        for element, previousValue, value in changed:
+            if element in changes:
+                changes[element][1] = value
+            else:
+                changes[element] = [previousValue, value]
+
+    def _diffuseState(self, previousValues, values):
+        # Diffuse the changes of several elements set together, once
+        changed = self._changedElements(previousValues, values)
+        if not changed:
+            return
+
+        if self._batchDepth:
+            self._recordBatch(
+                diffusingModeEnum.elements, previousValues,
+                {element: values[element] for element in changed})
+            return
+
+        _runInBackground(self._diffuseBatch(
+            {element: [previousValues[element], values[element]]
+             for element in changed}))
+
+    def _diffuseBatch(self, changes):
+        changed = tuple(changes)
+        observers = list(self.getObserversIterationGenerator(changed))
+        if not observers and not self._taps:
+            return None
+
+        # Only read the unchanged elements some observer needs
+        needed = {}
+        for observer in observers:
+            if observer.type is observerTypeEnum.state:
+                needed.update(dict.fromkeys(self.getObservableElements()))
+            elif observer.type is observerTypeEnum.listOfElements:
+                needed.update(dict.fromkeys(observer.elements))
+        needed.update(dict.fromkeys(changes))
+
+        values = {}
+        for element in needed:
+            values[element] = (changes[element][1] if element in changes
+                               else getattr(self, element))
+        previousValues = dict(values)
+        for element, change in changes.items():
+            previousValues[element] = change[0]
+
+        modeIndex = self._diffuseModes.index(diffusingModeEnum.elements)
+        return self._notify(
+            modeIndex, observers, previousValues, values, changed=changed)
+
+    def _isUnchanged(self, mode, *args):
+        if mode is diffusingModeEnum.element:
+            compare = self.getComparator(args[0])
+            if compare is None or not _isSame(compare, args[1], args[2]):
+                return False
+            unchanged = (args[0],)
+
+        else:
+            previousValues, values = args
+            for element, value in values.items():
+                compare = self.getComparator(element)
+                if (compare is None or element not in previousValues or
+                        not _isSame(compare, previousValues[element], value)):
+                    return False
+            unchanged = values
+
+        if self._suppressedDiffusions is None:
+            self._suppressedDiffusions = {}
+        for element in unchanged:
+            self._suppressedDiffusions[element] = (
+                self._suppressedDiffusions.get(element, 0) + 1)
+            if self._diffusionMetrics is not None:
+                self._diffusionMetrics.recordSuppressed(element)
+        return True
 
     def _diffuse(self, mode, *args):
-        # Iteration using the diffusing element name.
-        #  When None, use all observers
-        diffusing = None
+        _runInBackground(self._dispatch(mode, *args))
+
+    def _dispatch(self, mode, *args, compare=True):
+        """
+        Call the observers of the change.
+
+        :param bool compare: false to skip the comparators, e.g. for a
+                             collection changed in place, being both
+                             the previous and actual value.
+
+        :return: the awaitables given by coroutine functions observing,
+                 or None.
+        :rtype: list
+        """
         if mode == diffusingModeEnum.element:
+            # Iteration using the diffusing element name
             diffusing = args[0]
+            if (compare and self.getComparator(diffusing) is not None and
+                    self._isUnchanged(mode, *args)):
+                return None
+        else:
+            if self._isUnchanged(mode, *args):
+                return None
+
+            # Iteration using the changed element names only
+            diffusing = self._changedElements(*args)
+            if not diffusing:
+                return None
+
+        if self._batchDepth:
+            if mode == diffusingModeEnum.elements:
+                args = (args[0], {element: args[1][element]
+                                  for element in diffusing})
+            self._recordBatch(mode, *args)
+            return None
+
+        modeIndex = self._diffuseModes.index(mode)
+        if mode == diffusingModeEnum.element:
+            observers = self._getElementObservers(diffusing)
+        else:
+            observers = self.getObserversIterationGenerator(diffusing)
+        return self._notify(modeIndex, observers, *args, changed=diffusing)
+
+    def _getElementObservers(self, element):
+        # The observers of an element, subclasses may avoid a generator
+        return self.getObserversIterationGenerator(element)
+
+    def _changedElements(self, previousValues, values):
+        """
+        Give the names of the elements whose value changed, using their
+            comparator, or else the equality.
+
+        :rtype: tuple
+        """
+        changed = []
+        for element, value in values.items():
+            if element not in previousValues:
+                changed.append(element)
+                continue
+
+            previousValue = previousValues[element]
+            if previousValue is value:
+                continue
+
+            compare = self.getComparator(element)
+            if compare is None:
+                # e.g. arrays, not comparable to a bool, are changed
+                compare = equality
+            if not _isSame(compare, previousValue, value):
+                changed.append(element)
+
+        return tuple(changed)
+
+    def _notify(self, modeIndex, observers, *args, changed=None):
+        """
+        :param tuple changed: the changed element names, when diffusing
+                              several elements.
+        """
+        awaiting = None
+        diffusionExecutor = self._diffusionExecutor
+        stats = self._diffusionStats
+        metrics = self._diffusionMetrics
+        # The changed element name, or names
+        element = args[0] if isinstance(args[0], str) else changed
+        if self._taps:
+            self._callTaps(element, *args)
+        if stats is None and metrics is None:
+            return self._notifyUncounted(
+                modeIndex, observers, diffusionExecutor, *args)
+
+        onFailure = None
+        fanOut = 0
+        notifications = 0
+
+        try:
+            for observer in observers:
+                fanOut += 1
+                action = observer.actions[modeIndex]
+                previous, actual = action(self, observer, *args)
+
+                if observer.limiter is not None:
+                    # delivered by _deliver, once the limiter allows it
+                    observer.limiter.push(previous, actual)
+                    continue
 
-        observers = self.getObserversIterationGenerator(diffusing)
+                notifications += 1
+                executor = observer.executor or diffusionExecutor
+                if executor is not None:
+                    if onFailure is None and metrics is not None:
+                        onFailure = partial(metrics.recordFailure, element)
+                    if stats is None:
+                        executor.submit(
+                            id(observer), _callObserver,
+                            observer.call, previous, actual, onFailure)
+                    else:
+                        executor.submit(
+                            id(observer), stats.measure, observer, element,
+                            _callObserver, observer.call, previous, actual,
+                            onFailure)
+                    continue
+
+                if stats is None:
+                    result = observer.call(previous, actual)
+                else:
+                    result = stats.measure(
+                        observer, element, observer.call, previous, actual)
+                if result is not None and isawaitable(result):
+                    if awaiting is None:
+                        awaiting = []
+                    awaiting.append(result)
+
+        except Exception:
+            if metrics is not None:
+                metrics.recordFailure(element)
+            raise
+
+        finally:
+            if metrics is not None:
+                metrics.recordDiffusion(element, fanOut, notifications)
+
+        return awaiting
+
+    def _notifyUncounted(self, modeIndex, observers, diffusionExecutor,
+                         *args):
+        # _notify without stats nor metrics, the usual case
+        awaiting = None
         for observer in observers:
-            type = observer['type']
-            actionName = Diffusible.__diffuseActionsMatrix[mode][type]
-            action = getattr(self, actionName)
+            previous, actual = observer.actions[modeIndex](
+                self, observer, *args)
+
+            if observer.limiter is not None:
+                observer.limiter.push(previous, actual)
+                continue
+
+            executor = observer.executor or diffusionExecutor
+            if executor is not None:
+                executor.submit(id(observer), _callObserver,
+                                observer.call, previous, actual)
+                continue
+
+            result = observer.call(previous, actual)
+            if result is not None and isawaitable(result):
+                if awaiting is None:
+                    awaiting = []
+                awaiting.append(result)
+        return awaiting
+
+    def _callTaps(self, element, *args):
+        if isinstance(element, str):
+            changes = ((element, args[-2], args[-1]),)
+        else:
+            changes = ((name, args[0].get(name), args[1][name])
+                       for name in element)
 
-            action(observer, *args)
+        taps = self._taps
+        for name, previousValue, value in changes:
+            for tap in taps:
+                try:
+                    tap(name, previousValue, value)
+                except Exception:
+                    _logger.exception(
+                        "Diffusion tap %r failed on %s", tap, name)
+                    if self._diffusionMetrics is not None:
+                        self._diffusionMetrics.recordFailure(name)
+
+    def _deliver(self, observer, previous, actual):
+        # Call an observer outside of the diffusion, e.g. by a limiter
+        executor = observer.executor or self._diffusionExecutor
+        # The element names, "*" for a state observer
+        observed = observer.elements or observer.observing
+        metrics = self._diffusionMetrics
+        onFailure = None
+        if metrics is not None:
+            onFailure = partial(metrics.recordFailure, observed)
+            metrics.recordNotification(observed)
+
+        stats = self._diffusionStats
+        if stats is None:
+            call = (_callObserver, observer.call, previous, actual,
+                    onFailure)
+        else:
+            call = (stats.measure, observer, observed, _callObserver,
+                    observer.call, previous, actual, onFailure)
+
+        if executor is not None:
+            executor.submit(id(observer), *call)
+        else:
+            call[0](*call[1:])
 
     def _diffuseElement(self, observer, *args):
-        call = observer['call']
-        diffusing = args[0]
         previousValue = args[1]
         value = args[2]
 
-        call(previousValue, value)
+        return previousValue, value
 
     def _diffuseElementsOrState(self, observer, *args):
-        call = observer['call']
         diffusing = args[0]
         previousValue = args[1]
-        value = args[2]
 
         values = {}
-        if observer['observing'] == "*":
+        if observer.type is observerTypeEnum.state:
             values = self._getValues(self.getObservableElements())
         else:
-            values = self._getValues(observer['observing'])
+            values = self._getValues(observer.elements)
 
-        previousValues = copy.deepcopy(values)
+        # The previous state shares the unchanged values with the actual
+        #  one, observers asking for isolation receive deep copies.
+        previousValues = dict(values)
         previousValues[diffusing] = previousValue
 
-        call(previousValues, values)
+        return previousValues, values
 
     # TODO: get none attribute observable element
     def _getValues(self, observableElements):
@@ -105,30 +685,105 @@ class Diffusible(object):
         return values
 
     def _diffuseElementIn(self, observer, *args):
-        call = observer['call']
         previousValues = args[0]
         values = args[1]
 
-        call(
-            previousValues[observer["observing"]],
-            values[observer["observing"]])
+        return (previousValues[observer.observing],
+                values[observer.observing])
 
     def _diffuseElementsIn(self, observer, *args):
-        call = observer['call']
         previousValues = args[0]
         values = args[1]
 
         subValues = {}
         previousSubValues = {}
-        for element in observer['observing']:
+        for element in observer.elements:
             subValues[element] = values[element]
             previousSubValues[element] = previousValues[element]
 
-        call(previousSubValues, subValues)
+        return previousSubValues, subValues
+
+    def _diffusePatternElement(self, observer, *args):
+        # Only the diffused element, a pattern can match many of them
+        return {args[0]: args[1]}, {args[0]: args[2]}
+
+    def _diffusePatternIn(self, observer, *args):
+        previousValues = args[0]
+        values = args[1]
+
+        subValues = {}
+        previousSubValues = {}
+        for element in observer.elements:
+            if element in values:
+                subValues[element] = values[element]
+                previousSubValues[element] = previousValues.get(element)
+
+        return previousSubValues, subValues
 
     def _diffuseStateIn(self, observer, *args):
-        call = observer['call']
         previousValues = args[0]
         values = args[1]
 
-        call(previousValues, values)
+        return previousValues, values
+
+
+# Keep a reference to background tasks until they are done.
+_backgroundTasks = set()
+
+
+def _runInBackground(awaiting):
+    if not awaiting:
+        return
+
+    async def gather():
+        await asyncio.gather(*awaiting)
+
+    # asyncio.get_running_loop and asyncio.run need Python 3.7
+    loop = asyncio._get_running_loop()
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(gather())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+    else:
+        task = asyncio.gather(*awaiting, return_exceptions=True)
+        _backgroundTasks.add(task)
+        task.add_done_callback(_onBackgroundDone)
+
+
+def _onBackgroundDone(task):
+    # Nobody awaits the observers scheduled on a running loop: log
+    #  their failures, as for the taps.
+    _backgroundTasks.discard(task)
+    if task.cancelled():
+        return
+    for result in task.result():
+        if isinstance(result, Exception):
+            _logger.error("Coroutine observer failed", exc_info=result)
+
+
+def _callObserver(call, previous, actual, onFailure=None):
+    # Observer called by an executor, a coroutine function is run in
+    #  the executor thread.
+    try:
+        result = call(previous, actual)
+        if result is not None and isawaitable(result):
+            _runInBackground((result,))
+    except Exception:
+        if onFailure is not None:
+            onFailure()
+        raise
+
+
+def _isolated(action):
+    # Give deep copies of the previous and actual values, copied together
+    #  so values shared by both remain shared in the copies.
+    def isolatedAction(self, observer, *args):
+        return copy.deepcopy(action(self, observer, *args))
+
+    return isolatedAction
+
+
+Diffusible._compileDiffuseActions()
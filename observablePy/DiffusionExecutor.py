@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+"""
+Diffuse changes to observers using a pool of threads, so the thread
+    changing an observable element does not wait for the observers.
+
+Each observer receives the changes in the order they happened: calls
+    for the same observer are queued and run one after the other,
+    calls for different observers run concurrently.
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+from observablePy import DiffusionExecutor
+
+battery.setDiffusionExecutor(DiffusionExecutor(maxWorkers=4))
+battery.observeElement("voltage", saveVoltage)
+battery.voltage = 3392  # saveVoltage runs in the pool
+battery.flushDiffusion()  # wait for saveVoltage to be done
+
+"""
+
+
+class DiffusionExecutor():
+    def __init__(self, executor=None, maxWorkers=None):
+        """
+        :param concurrent.futures.Executor executor: the executor running
+            the calls. When not given, a ThreadPoolExecutor is created.
+        :param int maxWorkers: the number of threads of the created
+            ThreadPoolExecutor.
+        """
+        self._ownsExecutor = executor is None
+        self._executor = (ThreadPoolExecutor(maxWorkers)
+                          if executor is None else executor)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # key -> pending calls, present while a call of the key runs.
+        self._queues = {}
+        self._errors = []
+
+    def submit(self, key, call, *args):
+        """
+        Submit a call, running after the calls submitted before
+            with the same key.
+
+        :param key: identify the calls to run in order
+        :param func call: the function to call
+        :raises RuntimeError: if the executor is shut down
+        """
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append((call, args))
+                return
+            self._queues[key] = deque(((call, args),))
+
+        try:
+            self._executor.submit(self._drain, key)
+        except BaseException as error:
+            # e.g. the executor is shut down: nothing drains the key.
+            #  Calls queued meanwhile by other threads are lost, flush
+            #  raises the error for them.
+            with self._lock:
+                queue = self._queues.pop(key)
+                if len(queue) > 1:
+                    self._errors.append(error)
+                self._notifyIfIdle()
+            raise
+
+    def _drain(self, key):
+        drained = False
+        try:
+            while True:
+                with self._lock:
+                    queue = self._queues[key]
+                    if not queue:
+                        # Checked and removed together, so a call
+                        #  submitted meanwhile is never lost.
+                        del self._queues[key]
+                        self._notifyIfIdle()
+                        drained = True
+                        return
+                    call, args = queue.popleft()
+
+                try:
+                    call(*args)
+                except Exception as error:
+                    with self._lock:
+                        self._errors.append(error)
+        finally:
+            if not drained:
+                # A call raised a BaseException: the pending calls of
+                #  the key are dropped, so later calls and flush are not
+                #  stuck.
+                with self._lock:
+                    del self._queues[key]
+                    self._notifyIfIdle()
+
+    def _notifyIfIdle(self):
+        # Called holding the lock
+        if not self._queues:
+            self._idle.notify_all()
+
+    def isIdle(self):
+        """
+        Mention if all submitted calls are done.
+
+        :rtype: bool
+        """
+        with self._lock:
+            return not self._queues
+
+    def flush(self, timeout=None):
+        """
+        Wait for the submitted calls to be done.
+
+        :param float timeout: maximal seconds to wait, None to wait
+                              until done.
+        :return: true when all calls are done, false on timeout.
+        :rtype: bool
+        :raises Exception: the first error raised by a call since the
+                           last flush
+        """
+        with self._idle:
+            done = self._idle.wait_for(lambda: not self._queues, timeout)
+            errors, self._errors = self._errors, []
+
+        if errors:
+            raise errors[0]
+        return done
+
+    def shutdown(self, wait=True):
+        """
+        Wait for the submitted calls, then release the created
+            ThreadPoolExecutor.
+
+        :param bool wait: wait for the submitted calls to be done
+        """
+        if wait:
+            self.flush()
+        if self._ownsExecutor:
+            self._executor.shutdown(wait)
+
+
+def asDiffusionExecutor(executor):
+    """
+    Give a DiffusionExecutor using the executor.
+
+    :param executor: a DiffusionExecutor, a concurrent.futures.Executor
+                     or None
+    :return: the DiffusionExecutor, or None when executor is None.
+    :rtype: DiffusionExecutor
+    """
+    if executor is None or isinstance(executor, DiffusionExecutor):
+        return executor
+    return DiffusionExecutor(executor)
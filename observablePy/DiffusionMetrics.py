@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Diffusion counters by element name, shared by the instances of a class.
+
+Counters are plain integers updated once by diffusion, enabled by class
+    using enableDiffusionMetrics. They are not locked: a count may be
+    lost when several threads diffuse the same element at the same time.
+
+By element name:
+    changes: the changes diffused
+    notifications: the observer calls, a change of several elements
+                   counts for each of them
+    fanOut: histogram of the observers reached by a change, by upper
+            bound: {0: n, 1: n, 3: n, 7: n, ...}
+    suppressed: the changes not diffused because the value is unchanged
+    failed: the changes an observer raised an error for
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+Battery.enableDiffusionMetrics()
+...
+snapshot = Battery.getDiffusionMetrics()
+snapshot["voltage"]["changes"]
+Battery.resetDiffusionMetrics()
+
+"""
+
+
+class _ElementCounters():
+    __slots__ = ("changes", "notifications", "suppressed", "failed",
+                 "fanOut")
+
+    def __init__(self):
+        self.changes = 0
+        self.notifications = 0
+        self.suppressed = 0
+        self.failed = 0
+        # fanOut[n.bit_length()] counts the changes reaching n observers
+        self.fanOut = []
+
+
+class DiffusionMetrics():
+    def __init__(self):
+        # element name -> _ElementCounters
+        self._elements = {}
+
+    def _counters(self, element):
+        counters = self._elements.get(element)
+        if counters is None:
+            counters = self._elements[element] = _ElementCounters()
+        return counters
+
+    def recordDiffusion(self, elements, fanOut, notifications):
+        """
+        Count a diffused change.
+
+        :param str|tuple elements: the changed element name, or names
+        :param int fanOut: the observers reached
+        :param int notifications: the observers called
+        """
+        bucket = fanOut.bit_length()
+        for element in ((elements,) if isinstance(elements, str)
+                        else elements):
+            counters = self._counters(element)
+            counters.changes += 1
+            counters.notifications += notifications
+            histogram = counters.fanOut
+            if bucket >= len(histogram):
+                histogram.extend([0] * (bucket + 1 - len(histogram)))
+            histogram[bucket] += 1
+
+    def recordNotification(self, elements):
+        """
+        Count an observer called after the diffusion, e.g. by a limiter.
+
+        :param str|Array elements: the observed element names
+        """
+        for element in ((elements,) if isinstance(elements, str)
+                        else elements):
+            self._counters(element).notifications += 1
+
+    def recordSuppressed(self, element):
+        self._counters(element).suppressed += 1
+
+    def recordFailure(self, elements):
+        for element in ((elements,) if isinstance(elements, str)
+                        else elements):
+            self._counters(element).failed += 1
+
+    def snapshot(self):
+        """
+        :return: the counters by element name, refer to the module
+                 documentation.
+        :rtype: dict
+        """
+        return {
+            element: {
+                "changes": counters.changes,
+                "notifications": counters.notifications,
+                "suppressed": counters.suppressed,
+                "failed": counters.failed,
+                "fanOut": {(1 << bucket) - 1: count
+                           for bucket, count in enumerate(counters.fanOut)
+                           if count},
+            }
+            for element, counters in list(self._elements.items())}
+
+    def reset(self):
+        """
+        Set all counters back to zero.
+        """
+        self._elements = {}
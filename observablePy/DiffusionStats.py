@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import deque
+from time import perf_counter
+
+"""
+Time the observers calls, to find the observers slowing diffusion.
+
+Timing is opt-in: while disabled, diffusing does not read the clock.
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+def reportSlow(call, element, duration):
+    print("{0} took {1:.1f} ms on {2}".format(
+        call.__qualname__, duration * 1000, element))
+
+battery.enableDiffusionStats(budget=0.01, onSlowObserver=reportSlow)
+battery.voltage = 3392
+for stats in battery.getDiffusionStats():
+    print(stats["call"], stats["element"], stats["count"], stats["p99"])
+
+"""
+
+
+class _Entry():
+    __slots__ = ("observer", "count", "total", "max", "durations")
+
+    def __init__(self, observer, samples):
+        self.observer = observer
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        # The last durations, to compute the percentile
+        self.durations = deque(maxlen=samples)
+
+
+class DiffusionStats():
+    def __init__(self, budget=None, onSlowObserver=None, samples=1000):
+        """
+        :param float budget: seconds an observer call may take,
+                             None for no budget.
+        :param func onSlowObserver: called with the observer function,
+                                    the element name and the duration
+                                    when a call exceeds the budget.
+        :param int samples: the number of last durations kept by
+                            observer, to compute the 99th percentile.
+        """
+        self._budget = budget
+        self._onSlowObserver = onSlowObserver
+        self._samples = samples
+        self._lock = threading.Lock()
+        # (observer id, element name) -> _Entry
+        self._entries = {}
+
+    def measure(self, observer, element, call, *args):
+        """
+        Call a function and record its duration for the observer.
+
+        Coroutine functions are timed until they return the coroutine,
+            when called inline.
+
+        :param ObserverRecord observer: the observer called
+        :param str element: the diffused element name, or the tuple of
+                            names when diffusing several elements. The
+                            duration is recorded for each name.
+        :param func call: the function to time
+        :return: the result of call.
+        """
+        start = perf_counter()
+        try:
+            return call(*args)
+        finally:
+            self._record(observer, element, perf_counter() - start)
+
+    def _record(self, observer, element, duration):
+        names = (element,) if isinstance(element, str) else element
+        with self._lock:
+            for name in names:
+                key = (id(observer), name)
+                entry = self._entries.get(key)
+                if entry is None:
+                    # Keys are bounded by the live observers and their
+                    #  elements: drop the garbage collected ones first.
+                    self._pruneDeadObservers()
+                    entry = self._entries[key] = _Entry(
+                        observer, self._samples)
+                entry.count += 1
+                entry.total += duration
+                if duration > entry.max:
+                    entry.max = duration
+                entry.durations.append(duration)
+
+        if (self._budget is not None and duration > self._budget and
+                self._onSlowObserver is not None):
+            self._onSlowObserver(observer.getCall(), element, duration)
+
+    def getStats(self):
+        """
+        Get the statistics by observer and element, slowest total first.
+
+        :return: dicts of observing, call, element, count, and total,
+                 max and p99 durations in seconds.
+        :rtype: Array
+        """
+        with self._lock:
+            self._pruneDeadObservers()
+            entries = [(entry.observer, element, entry.count, entry.total,
+                        entry.max, sorted(entry.durations))
+                       for (_, element), entry in self._entries.items()]
+
+        stats = []
+        for observer, element, count, total, maximum, durations in entries:
+            stats.append({
+                "observing": observer.observing,
+                "call": observer.getCall(),
+                "element": element,
+                "count": count,
+                "total": total,
+                "max": maximum,
+                "p99": durations[min(len(durations) - 1,
+                                     int(len(durations) * 0.99))],
+            })
+        stats.sort(key=lambda item: item["total"], reverse=True)
+        return stats
+
+    def forget(self, observer):
+        """
+        Forget the recorded durations of an observer, e.g. once it is
+            unsubscribed.
+
+        :param ObserverRecord observer: the observer
+        """
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key[0] == id(observer)]:
+                del self._entries[key]
+
+    def reset(self):
+        """
+        Forget the recorded durations.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _pruneDeadObservers(self):
+        # Weakly referenced observers, garbage collected
+        for key in [key for key, entry in self._entries.items()
+                    if entry.observer.getCall() is None]:
+            del self._entries[key]
@@ -1,10 +1,19 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
-from .Diffusible import Diffusible
+from functools import partial
+from .Diffusible import Diffusible, _runInBackground
+from .DiffusingModeEnum import diffusingModeEnum
+from .DiffusionExecutor import asDiffusionExecutor
+from .ChangeHistory import ChangeHistory
+from .ColumnStore import ColumnStore
+from .ObservableCollections import CollectionChange, ObservableCollection
 from .ObservableProperty import observable_property
 from .ObservableStore import ObservableStore
 from .ObserverStore import ObserverStore
+from .ObserverTypeEnum import observerTypeEnum
+from .RateLimiter import Debounce, Throttle
+from .TimerWheel import TimerWheel
 
 """
 Implement the observable behaviour to a class.
@@ -47,17 +56,344 @@ def voltage(self):
 
 
 class Observable(Diffusible):
+    # Observable properties of the class, discovered once per class.
+    __taggedProperties = []
+    # Comparators of the observable properties comparing changes.
+    __comparators = {}
+    # Observable elements of the class, shared by its instances until
+    #  one adds or removes an element.
+    __observables = ObservableStore([])
+    # Observers store shared by the instances without observer, an
+    #  instance has its own once observed.
+    __noObservers = ObserverStore()
+    __observers = __noObservers
+    # Observers of the collection changes, created when needed
+    __deltaObservers = None
+    # Computed properties by the element name they depend on
+    __computedDependents = {}
+    # ChangeHistory recording the changes, when enabled
+    __history = None
+    # ColumnStore of a class declared with columns, otherwise None
+    _columnStore = None
+
+    def __init_subclass__(cls, columns=None, compileSetters=False,
+                          **kwargs):
+        """
+        :param dict columns: declare observable properties whose values
+                             are stored in columns shared by the class
+                             instances, the array.array typecode by
+                             property name. Refer to ColumnStore.
+        :param bool compileSetters: when true, each observable property
+                                    of the class is replaced by one
+                                    having a setter specialized for it,
+                                    to set it faster. Refer to
+                                    _compiledProperty.
+
+        =================
+        How to use it
+        =================
+        .. code-block:: python
+            class Battery(Observable, columns={"voltage": "l",
+                                               "level": "d"}):
+                pass
+
+            battery = Battery()
+            battery.voltage = 3392
+            Battery.getColumn("voltage")  # memoryview of all voltages
+
+            class Cell(Observable, compileSetters=True):
+                ...observable properties...
+        """
+        super(Observable, cls).__init_subclass__(**kwargs)
+        if columns:
+            cls.__declareColumns(columns)
+        if compileSetters:
+            cls.__compileSetters()
+        # Each subclass discovers its own list, so properties added or
+        #  overridden by a subclass never leak into its parent class.
+        cls.__taggedProperties = cls.__getTaggedProperties()
+        cls.__comparators = {
+            p: getattr(cls, p).compare for p in cls.__taggedProperties
+            if getattr(cls, p).compare is not None}
+        cls.__observables = ObservableStore(
+            cls.__taggedProperties, comparators=cls.__comparators)
+        cls.__registerComputedProperties()
+
     def __init__(self):
+        # The instance state is created when first needed, until then
+        #  the class attributes are shared.
         super(Observable, self).__init__()
-        self.__observers = ObserverStore()
-        # build the list of observable element.
-        self.__observables = ObservableStore(self.__getTaggedProperties())
+
+    @classmethod
+    def __declareColumns(cls, columns):
+        if cls._columnStore is not None:
+            raise TypeError(
+                "{0} inherits columns, they can not be declared again."
+                .format(cls))
+
+        store = cls._columnStore = ColumnStore(columns)
+        for name in columns:
+            setattr(cls, name, _columnProperty(
+                name, store.getColumnObject(name)))
+
+        def __new__(cls, *args, **kwargs):
+            instance = super(Observable, cls).__new__(cls)
+            store = cls._columnStore
+            instance._row = store.allocate()
+            if store.watchAll:
+                store.watch(instance._row, instance)
+            return instance
+
+        def __del__(self):
+            row = self.__dict__.get("_row")
+            if row is not None:
+                type(self)._columnStore.release(row)
+
+        def __getstate__(self):
+            # Copies and unpickled instances get a row of their own from
+            #  __new__: give the column values, not the row.
+            state = dict(self.__dict__)
+            row = state.pop("_row")
+            store = type(self)._columnStore
+            values = {name: store.getColumnObject(name).values[row]
+                      for name in store.getColumnNames()}
+            return state, values
+
+        def __setstate__(self, state):
+            state, values = state
+            row = self._row
+            self.__dict__.update(state)
+            store = type(self)._columnStore
+            for name, value in values.items():
+                store.getColumnObject(name).values[row] = value
+            if self.hasObservers():
+                self.__watchRow()
+
+        cls.__new__ = staticmethod(__new__)
+        cls.__del__ = __del__
+        cls.__getstate__ = __getstate__
+        cls.__setstate__ = __setstate__
+
+    @classmethod
+    def __compileSetters(cls):
+        modeIndex = cls._diffuseModes.index(diffusingModeEnum.element)
+        for name in dir(cls):
+            descriptor = getattr(cls, name)
+            # Computed and other derived properties keep their own set
+            if (type(descriptor) is observable_property and
+                    descriptor.fset is not None):
+                setattr(cls, name, _compiledProperty(descriptor, modeIndex))
+
+    @classmethod
+    def getColumn(cls, name):
+        """
+        Read the values of a column property of all instances, without
+            copying them. Refer to ColumnStore.
+
+        :param str name: the column property name
+        :return: the values by instance row, the row of an instance is
+                 given by getRow.
+        :rtype: memoryview
+        :raises ValueError: if the class does not store this property
+                            in a column
+        """
+        cls.__checkColumn(name)
+        return cls._columnStore.getColumn(name)
+
+    @classmethod
+    def setColumn(cls, name, rows, values):
+        """
+        Set a column property of many instances at once, e.g. to apply
+            a telemetry frame. Values equal to the column ones are
+            skipped: column properties have no comparator, none is
+            applied. The instances having observers are set one by one,
+            so their observers are called; the others are written in
+            the column directly. Then the column observers are called
+            once with all the changes.
+            An instance observer raising does not stop the update: all
+            values are written and the column observers called, then
+            the first error is raised.
+
+        :param str name: the column property name
+        :param Array rows: the rows of the instances, refer to getRow
+        :param Array values: the new value of each row
+        :return: the number of changed instances
+        :rtype: int
+        :raises ValueError: if the class does not store this property
+                            in a column, or if a row has no instance.
+        :raises TypeError: if a value does not match the column type
+        :raises Exception: the first error raised by an instance
+                           observer
+
+        =================
+        How to use it
+        =================
+        .. code-block:: python
+            Battery.setColumn("voltage", rows, voltages)
+        """
+        cls.__checkColumn(name)
+        descriptor = getattr(cls, name)
+        errors = []
+
+        def setInstance(instance, value):
+            try:
+                descriptor.__set__(instance, value)
+            except Exception as error:
+                # Written even when failing before the value was set
+                descriptor.fset(instance, value)
+                errors.append(error)
+
+        changedRows, previous, actual = cls._columnStore.update(
+            name, rows, values, setInstance)
+
+        if changedRows:
+            for call in cls._columnStore.getColumnObject(name).observers:
+                call(changedRows, previous, actual)
+        if errors:
+            raise errors[0]
+        return len(changedRows)
+
+    @classmethod
+    def observeColumn(cls, name, call=None):
+        """
+        Registers an observer to the changes made by setColumn.
+            Changes made to an instance property are diffused to the
+            instance observers only.
+            The function to call should have 3 parameters, each an
+            array.array:
+            - rows,
+            - previousValues,
+            - actualValues
+
+        :param str name: the column property name
+        :param func call: The function to call. When not given,
+                          decorator usage is assumed.
+        :return: the function to call once the column changes.
+        :rtype: func
+        :raises ValueError: if the class does not store this property
+                            in a column
+        :raises TypeError: if the called function is not callable
+        """
+        def _observe(call):
+            if not callable(call):
+                raise TypeError(
+                    '"call" parameter must be a callable function.')
+            column = cls._columnStore.getColumnObject(name)
+            column.observers += (call,)
+            return call
+
+        cls.__checkColumn(name)
+        if call is not None:
+            return _observe(call)
+        else:
+            return _observe
+
+    @classmethod
+    def unObserveColumn(cls, name, call):
+        """
+        unregisters an observer registered using observeColumn
+
+        :raises ValueError: if the observer is not subscribed
+        """
+        cls.__checkColumn(name)
+        column = cls._columnStore.getColumnObject(name)
+        if call not in column.observers:
+            raise ValueError(
+                "No observer of '{0}' calling {1}".format(name, call))
+        observers = list(column.observers)
+        observers.remove(call)
+        column.observers = tuple(observers)
+
+    @classmethod
+    def __checkColumn(cls, name):
+        if cls._columnStore is None or (
+                name not in cls._columnStore.getColumnNames()):
+            msg = 'Could not find column named "{0}" in {1}'
+            raise ValueError(msg.format(name, cls))
+
+    def __watchRow(self):
+        # setColumn sets observed instances one by one
+        if self._columnStore is not None:
+            self._columnStore.watch(self._row, self)
+
+    def getRow(self):
+        """
+        :return: the row of the instance in the columns, None when the
+                 class does not store properties in columns.
+        :rtype: int
+        """
+        return self.__dict__.get("_row")
+
+    def __ownObservables(self):
+        # Copy the class observable elements before changing them
+        if "_Observable__observables" not in self.__dict__:
+            self.__observables = ObservableStore(
+                self.__taggedProperties, copyOnWrite=True,
+                comparators=self.__comparators)
+        return self.__observables
 
     @classmethod
     def __getTaggedProperties(cls):
         return [p for p in dir(cls) if isinstance(
                     getattr(cls, p), observable_property)]
 
+    @classmethod
+    def __registerComputedProperties(cls):
+        # Each property knows the computed properties depending on it,
+        #  to refresh them when it is set. Dependents are kept by class:
+        #  an inherited dependency is copied to the class first, so the
+        #  computed properties of a subclass never reach its parents.
+        #  A dependency can also be an element added later using
+        #  addObservableElement, refreshed once diffused.
+        dependencies = {}
+        for name in cls.__taggedProperties:
+            computed = getattr(cls, name)
+            for dependency in getattr(computed, "dependsOn", ()):
+                descriptor = getattr(cls, dependency, None)
+                if descriptor is not None and not isinstance(
+                        descriptor, observable_property):
+                    msg = ('Computed property "{0}" depends on "{1}", '
+                           'not an observable property of {2}')
+                    raise ValueError(msg.format(name, dependency, cls))
+                dependencies.setdefault(dependency, []).append(name)
+
+        for dependency in dependencies:
+            if not hasattr(cls, dependency):
+                continue
+            if dependency not in cls.__dict__:
+                setattr(cls, dependency, getattr(cls, dependency)._copy())
+            getattr(cls, dependency)._dependents = ()
+
+        cls.__computedDependents = {
+            dependency: tuple(getattr(cls, name) for name in names)
+            for dependency, names in dependencies.items()}
+
+        for dependency, names in dependencies.items():
+            if not hasattr(cls, dependency):
+                continue
+            descriptor = getattr(cls, dependency)
+            for name in names:
+                computed = getattr(cls, name)
+                if computed not in descriptor._dependents:
+                    descriptor._dependents += (computed,)
+            if cls._columnStore is not None and (
+                    dependency in cls._columnStore.getColumnNames()):
+                # Refreshing computed properties needs the instances
+                cls._columnStore.watchAll = True
+
+    def _onDiffused(self, elements):
+        # A change diffused by hand, or made in place to a collection:
+        #  refresh the computed properties depending on it.
+        dependents = self.__computedDependents
+        if not dependents:
+            return
+        computedProperties = {}
+        for element in elements:
+            for computed in dependents.get(element, ()):
+                computedProperties[id(computed)] = computed
+        for computed in computedProperties.values():
+            computed._refresh(self)
+
     def getObservableElements(self):
         """
         get the list of properties that have observable decoration
@@ -99,14 +435,28 @@ class Observable(Diffusible):
         return self.__observables.isObservableElement(
             ElementName)
 
-    def addObservableElement(self, elementName):
+    def addObservableElement(self, elementName, compare=None):
         """
         Add an observale element.
 
         :param str elementName: the element name to add
+        :param compare: "equality", "identity" or a comparator. When set,
+                        a change to the same value is not diffused.
+                        Refer to Comparators.
         :raises RuntimeError: if elementName already exist
         """
-        self.__observables.add(elementName)
+        self.__ownObservables().add(elementName, compare)
+        self.__observers.onElementAdded(elementName)
+
+    def getComparator(self, elementName):
+        """
+        Get the comparator detecting unchanged values of an element.
+
+        :param str elementName: the element name
+        :return: the comparator, or None when changes are not compared.
+        :rtype: func
+        """
+        return self.__observables.getComparator(elementName)
 
     def removeObservableElement(self, elementName):
         """
@@ -114,7 +464,8 @@ class Observable(Diffusible):
 
         :param str elementName: the element name to remove
         """
-        self.__observables.remove(elementName)
+        self.__ownObservables().remove(elementName)
+        self.__observers.onElementRemoved(elementName)
 
     def getObservers(self):
         """
@@ -136,6 +487,9 @@ class Observable(Diffusible):
         """
         return self.__observers.iterationGenerator(filter)
 
+    def _getElementObservers(self, element):
+        return self.__observers.getElementObservers(element)
+
     def hasObservers(self):
         """
         Mention if the observable class has observer.
@@ -145,19 +499,121 @@ class Observable(Diffusible):
         """
         return self.__observers.hasObservers()
 
-    # TODO: mention if the element name is in observation by any observer
-    # def isObserved(cls, fieldName):
-    #     return true when exist other false
+    def isObserved(self, elementName):
+        """
+        Mention if an element is observed, by its own observers
+            or by state observers.
+
+        :param str elementName: the element name to evaluate
+        :return: true if it has observer, otherwise false.
+        :rtype: bool
+        """
+        return (self.__observers.isObserved(elementName) or
+                len(self._taps) > 0 or
+                (self.__deltaObservers is not None and
+                 self.__deltaObservers.isObserved(elementName)))
+
+    async def aset(self, elementName, value):
+        """
+        Set an observable property, awaiting the coroutine functions
+            observing the change.
+
+        :param str elementName: the observable property name
+        :param value: The new value for the property.
+        :raises ValueError: if elementName is not an observable property
+
+        =================
+        How to use it
+        =================
+        .. code-block:: python
+            @battery.observeElement("voltage")
+            async def voltageHandle(previousValue, actualValue):
+                await publish(actualValue)
+
+            await battery.aset("voltage", 3392)
+        """
+        descriptor = getattr(type(self), elementName, None)
+        if not isinstance(descriptor, observable_property):
+            msg = 'Could not find observable property named "{0}" in {1}'
+            raise ValueError(msg.format(elementName, self.__class__))
+
+        await descriptor.aset(self, value)
+
+    def setState(self, values):
+        """
+        Set several observable properties, diffusing the changes once.
+            Observers are called as when ending a batch: each observer
+            once, element observers with the previous and new value,
+            elements and state observers with the merged values.
+            Unchanged values, refer to diffuse(dict, dict), are not
+            diffused.
+
+        :param dict values: the new values by observable property name
+        :raises ValueError: if a name is not an observable property
+
+        =================
+        How to use it
+        =================
+        .. code-block:: python
+            battery.setState({"voltage": 3392, "level": 0.67})
+        """
+        cls = type(self)
+        descriptors = {}
+        for elementName in values:
+            descriptor = getattr(cls, elementName, None)
+            if not isinstance(descriptor, observable_property):
+                msg = 'Could not find observable property named "{0}" in {1}'
+                raise ValueError(msg.format(elementName, self.__class__))
+            descriptors[elementName] = descriptor
+
+        if not self.areObservableElements(list(values)):
+            msg = 'Could not find observable element named "{0}" in {1}'
+            raise ValueError(msg.format(list(values), self.__class__))
+
+        for descriptor in descriptors.values():
+            if descriptor._dependents:
+                descriptor._prepareDependents(self)
+
+        if not any(self.isObserved(e) for e in values):
+            # Nobody to inform, skip the previous values
+            previousValues = {}
+            for elementName, value in values.items():
+                property.__set__(descriptors[elementName], self, value)
+                if isinstance(value, ObservableCollection):
+                    value._bind(self, elementName)
+            values = {}
+        else:
+            previousValues = {e: getattr(self, e) for e in values}
+            for elementName, value in values.items():
+                descriptor = descriptors[elementName]
+                property.__set__(descriptor, self, value)
+                descriptor._resetCollection(
+                    self, previousValues[elementName], value)
+            values = dict(values)
+
+        # Computed properties changes are diffused with the others
+        computedChanges = {}
+        for descriptor in descriptors.values():
+            if descriptor._dependents:
+                descriptor._refreshDependents(self, computedChanges)
+        for elementName, change in computedChanges.items():
+            previousValues[elementName], values[elementName] = change
+
+        if values:
+            self._diffuseState(previousValues, values)
 
-    def observeState(self, call=None):
+    def observeState(self, call=None, **options):
         """
         Registers an observer to the any changes.
             The called function should have 2 parameters:
             - previousState,
             - actualState
+            It can be a coroutine function, refer to adiffuse.
 
         :param func call: The function to call.
                           When not given, decorator usage is assumed.
+        :param options: isolate, executor, weak, throttle, debounce and
+                        timerWheel, refer to observeElements.
         :return: the function to call once state change.
         :rtype: func
         :raises TypeError: if the called function is not callable
@@ -186,7 +642,7 @@ class Observable(Diffusible):
                 def functionName(previousState, actualState):
         """
         def _observe(call):
-            self.__observers.add("*", call)
+            self.__addObserver("*", call, **options)
             return call
 
         if call is not None:
@@ -194,25 +650,46 @@ class Observable(Diffusible):
         else:
             return _observe
 
-    def observeElement(self, what, call=None):
+    def observeElement(self, what, call=None, **options):
         """
         Alias of observeElements method
         """
-        return self.observeElements(what, call)
+        return self.observeElements(what, call, **options)
 
-    def observeElements(self, what, call=None):
+    def observeElements(self, what, call=None, **options):
         """
         Registers an observer function to a specific state field or
             list of state fields.
             The function to call should have 2 parameters:
             - previousValue,
             -actualValue
+            It can be a coroutine function, refer to adiffuse.
 
         :param what: name of the state field or names of the
-                     state field to observe.
-        :type what: str | array
+                     state field to observe, or a pattern: a compiled
+                     regular expression, or glob("cell*_voltage").
+                     A pattern observer receives dicts of the diffused
+                     elements it matches, including the elements added
+                     later.
+        :type what: str | array | re.Pattern
         :param func call: The function to call. When not given,
                           decorator usage is assumed.
+        :param bool isolate: when true, the observer receives deep
+                             copies of the values, otherwise values
+                             are shared with the observable.
+        :param executor: a DiffusionExecutor or concurrent.futures.Executor
+                         calling the observer, refer to
+                         setDiffusionExecutor.
+        :param bool weak: when true, the observer is not kept alive by
+                          the observable. A bound method is removed
+                          once its instance is garbage collected.
+        :param float throttle: when given, the observer is called at most
+                               once by throttle seconds.
+        :param float debounce: when given, the observer is called once no
+                               change happened during debounce seconds.
+        :param TimerWheel timerWheel: the wheel running the throttle and
+                                      debounce timers, a shared one by
+                                      default.
         :return: the function to call once state change.
         :rtype: func
         :raises TypeError: if the called function is not callable
@@ -241,11 +718,14 @@ class Observable(Diffusible):
             def functionName(previousValue, actualValue):
         """
         def _observe(call):
-            self.__observers.add(what, call)
+            self.__addObserver(what, call, **options)
             return call
 
         toEvaluate = []
-        if isinstance(what, str):
+        if observerTypeEnum.typeOf(what) is observerTypeEnum.pattern:
+            # Matching no element yet is fine, they can be added later
+            pass
+        elif isinstance(what, str):
             toEvaluate.append(what)
         else:
             toEvaluate = what
@@ -259,6 +739,204 @@ class Observable(Diffusible):
         else:
             return _observe
 
+    def __addObserver(self, what, call, isolate=False, executor=None,
+                      weak=False, throttle=None, debounce=None,
+                      timerWheel=None):
+        if throttle is not None and debounce is not None:
+            raise ValueError("Use throttle or debounce, not both.")
+
+        limiter = None
+        if throttle is not None or debounce is not None:
+            wheel = (timerWheel if timerWheel is not None
+                     else TimerWheel.getDefault())
+            limiter = (Throttle(throttle, wheel) if throttle is not None
+                       else Debounce(debounce, wheel))
+
+        if self.__observers is Observable.__noObservers:
+            self.__observers = ObserverStore(
+                self._diffuseActions, self._isolatedDiffuseActions)
+            self.__watchRow()
+        elements = None
+        if observerTypeEnum.typeOf(what) is observerTypeEnum.pattern:
+            elements = self.__observables.getMatchingElements(what)
+        observer = self.__observers.add(
+            what, call, isolate, asDiffusionExecutor(executor), weak,
+            limiter, elements)
+        if limiter is not None:
+            limiter.deliver = partial(self._deliver, observer)
+
+    def addDiffusionTap(self, tap):
+        """
+        Refer to Diffusible.addDiffusionTap
+        """
+        super(Observable, self).addDiffusionTap(tap)
+        self.__watchRow()
+
+    def observeDeltas(self, what, call=None, weak=False):
+        """
+        Registers an observer to the changes made in place to the
+            observable collections stored in observable properties.
+            The function to call should have 1 parameter:
+            - change, a CollectionChange
+
+        Refer to ObservableCollections.
+
+        :param what: name of the element or names of the elements
+                     to observe.
+        :type what: str | array
+        :param func call: The function to call. When not given,
+                          decorator usage is assumed.
+        :param bool weak: when true, the observer is not kept alive by
+                          the observable.
+        :return: the function to call once a collection changes.
+        :rtype: func
+        :raises ValueError: if an element is not an observable element
+        :raises TypeError: if the called function is not callable
+
+        =================
+        How to use it
+        =================
+        .. code-block:: python
+            @playlist.observeDeltas("songs")
+            def songsChange(change):
+                if change.action == "insert":
+                    ...
+        """
+        def _observe(call):
+            if self.__deltaObservers is None:
+                self.__deltaObservers = ObserverStore()
+            self.__deltaObservers.add(what, call, weak=weak)
+            return call
+
+        toEvaluate = [what] if isinstance(what, str) else what
+        if not self.areObservableElements(toEvaluate):
+            msg = 'Could not find observable element named "{0}" in {1}'
+            raise ValueError(msg.format(what, self.__class__))
+
+        if call is not None:
+            return _observe(call)
+        else:
+            return _observe
+
+    def unObserveDeltas(self, what, call):
+        """
+        unregisters an observer registered using observeDeltas
+
+        :raises ValueError: if the observer is not subscribed
+        """
+        if self.__deltaObservers is None:
+            raise ValueError(
+                "No observer of '{0}' calling {1}".format(what, call))
+        self.__deltaObservers.remove(what, call)
+
+    def diffuseCollectionChange(self, element, collection, action, key=None,
+                                value=None, previous=None):
+        """
+        Diffuse a change made to an observable collection: the delta
+            observers receive a CollectionChange, the element observers
+            receive the collection as previous and actual value.
+            Called by the observable collections.
+
+        :param str element: the observable property holding collection
+        :param collection: the changed collection
+        :param str action: refer to ObservableCollections
+        :return: false when the property does not hold the collection
+                 anymore, nothing is diffused then.
+        :rtype: bool
+        """
+        if action != "reset" and getattr(self, element) is not collection:
+            return False
+
+        deltaObservers = self.__deltaObservers
+        if deltaObservers is not None and deltaObservers.isObserved(element):
+            change = CollectionChange(element, action, key, value, previous)
+            for observer in deltaObservers.iterationGenerator(element):
+                observer.call(change)
+
+        if action != "reset":
+            if self.__observers.isObserved(element):
+                # The same collection, no comparator can see the change
+                self._diffuseChange(
+                    element, collection, collection, compare=False)
+            self._onDiffused((element,))
+        return True
+
+    def enableHistory(self, capacity=256, elements=None):
+        """
+        Record the last diffused changes, refer to ChangeHistory.
+            Enabling again starts a new history.
+
+        :param int capacity: the number of changes kept
+        :param Array elements: the element names to record, None to
+                               record all elements.
+        :return: the history
+        :rtype: ChangeHistory
+        """
+        self.disableHistory()
+        self.__history = ChangeHistory(capacity, elements)
+        self.addDiffusionTap(self.__history)
+        return self.__history
+
+    def disableHistory(self):
+        """
+        Stop recording the changes, and forget them.
+        """
+        if self.__history is not None:
+            self.removeDiffusionTap(self.__history)
+            self.__history = None
+
+    def getHistory(self, since=None, element=None):
+        """
+        Get the recorded changes, oldest first.
+
+        :param float since: only give the changes recorded after this
+                            time.monotonic timestamp.
+        :param str|Array element: only give the changes of this element
+                                  name, or names.
+        :return: the changes, having element, previous, actual and
+                 timestamp attributes. Empty when history is disabled.
+        :rtype: Array of HistoryEntry
+        """
+        if self.__history is None:
+            return []
+        return self.__history.getEntries(since, element)
+
+    def replay(self, call, since=None, what=None):
+        """
+        Call an observer with the recorded changes, oldest first, so a
+            late observer catches up without reading the whole state.
+
+        :param func call: the observer, called as if observing what:
+                          with the previous and actual value of an
+                          element name, otherwise with the previous and
+                          actual values of the names, or of all
+                          elements, by name.
+        :param float since: only replay the changes recorded after this
+                            time.monotonic timestamp.
+        :param str|Array what: only replay the changes of this element
+                               name, or names. None for all elements.
+        :return: the number of changes replayed.
+        :rtype: int
+        """
+        entries = self.getHistory(since, what)
+        if isinstance(what, str):
+            for entry in entries:
+                call(entry.previous, entry.actual)
+            return len(entries)
+
+        # The values after each change, rebuilt from the actual ones by
+        #  undoing the changes recorded after it.
+        values = self._getValues(
+            what if what is not None else self.getObservableElements())
+        changes = []
+        for entry in reversed(entries):
+            actual = dict(values)
+            values[entry.element] = entry.previous
+            changes.append((dict(values), actual))
+        for previous, actual in reversed(changes):
+            call(previous, actual)
+        return len(entries)
+
     def unObserve(self, what, call):
         """
         unregisters an observer
@@ -270,4 +948,83 @@ class Observable(Diffusible):
             - actualValue
 
         """
-        self.__observers.remove(what, call)
+        observer = self.__observers.remove(what, call)
+        if self._diffusionStats is not None:
+            self._diffusionStats.forget(observer)
+
+
+def _columnProperty(name, column):
+    # An observable property reading and writing a ColumnStore column
+    def fget(self):
+        return column.values[self._row]
+
+    def fset(self, value):
+        column.values[self._row] = value
+
+    fget.__name__ = name
+    return observable_property(fget, fset)
+
+
+def _compiledProperty(descriptor, modeIndex):
+    """
+    Give a copy of an observable property whose setter is generated for
+        it: the element name, get and set functions are bound, and the
+        diffusion of a single element is done inline, without going
+        through isObserved, _diffuseChange and _dispatch.
+
+    Batches, comparators, computed properties and collections use the
+        setter of observable_property.
+    """
+    name = descriptor.name
+    fget = descriptor.fget
+    fset = descriptor.fset
+
+    def __set__(self, obj, value):
+        observers = obj._Observable__observers
+        if self._dependents or obj._Observable__deltaObservers is not None:
+            observable_property.__set__(self, obj, value)
+            return
+
+        if not obj._taps and not observers.isObserved(name):
+            # Nobody to inform, skip the previous value and diffusion
+            fset(obj, value)
+            if isinstance(value, ObservableCollection):
+                value._bind(obj, name)
+            return
+
+        previousValue = fget(obj)
+        fset(obj, value)
+        if (isinstance(value, ObservableCollection) or
+                isinstance(previousValue, ObservableCollection)):
+            self._resetCollection(obj, previousValue, value)
+        if (obj._batchDepth or
+                obj._Observable__observables.getComparator(name)):
+            obj._diffuseChange(name, previousValue, value)
+            return
+
+        _runInBackground(obj._notify(
+            modeIndex, observers.getElementObservers(name),
+            name, previousValue, value))
+
+    # A property built from it, e.g. by a subclass overriding its
+    #  setter, is compiled again so its set uses the new functions.
+    def getter(self, fget):
+        return _compiledProperty(
+            observable_property.getter(self, fget), modeIndex)
+
+    def setter(self, fset):
+        return _compiledProperty(
+            observable_property.setter(self, fset), modeIndex)
+
+    def deleter(self, fdel):
+        return _compiledProperty(
+            observable_property.deleter(self, fdel), modeIndex)
+
+    compiled = type(
+        "compiled_{0}".format(name), (observable_property,),
+        {"__set__": __set__, "getter": getter, "setter": setter,
+         "deleter": deleter, "__slots__": ()})(
+            fget, fset, descriptor.fdel, descriptor.__doc__)
+    descriptor._withOptions(compiled)
+    compiled._dependents = descriptor._dependents
+    return compiled
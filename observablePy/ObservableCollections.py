@@ -0,0 +1,364 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import weakref
+from collections import namedtuple
+
+"""
+Collections diffusing their changes in place, as compact deltas.
+
+Once stored in an observable property, an ObservableList, ObservableDict
+    or ObservableSet informs its owner of each change, without copying
+    the collection:
+    - the observers registered using observeDeltas receive a
+      CollectionChange describing the change,
+    - the observers of the element receive the collection itself, as
+      previous and actual value.
+
+CollectionChange:
+    element: the observable property name
+    action: "insert", "remove", "replace", "clear", "reorder" (sort or
+            reverse) or "reset" (a new collection is set)
+    key: the index or slice of a list, the key of a dict, the item of a
+         set. A slice of a list is relative to the list before the
+         change. None for clear, reorder and reset.
+    value: the inserted or new value, a list of items for a slice
+    previous: the removed or replaced value, a list of items for a slice
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+from observablePy import Observable, ObservableList, observable_property
+
+class Playlist(Observable):
+    def __init__(self):
+        super().__init__()
+        self.songs = ObservableList()
+
+    @observable_property
+    def songs(self):
+        return self.__songs
+
+    @songs.setter
+    def songs(self, value):
+        self.__songs = value
+
+playlist = Playlist()
+playlist.observeDeltas("songs", print)
+playlist.songs.append("Roxanne")
+# CollectionChange(element='songs', action='insert', key=0,
+#                  value='Roxanne', previous=None)
+
+"""
+
+
+CollectionChange = namedtuple(
+    "CollectionChange", ("element", "action", "key", "value", "previous"))
+
+
+class ObservableCollection():
+    """
+    Base of the observable collections, keeping the observables owning
+        the collection.
+    """
+    __slots__ = ()
+    # The builtin type copies and pickles are based on
+    _baseType = None
+
+    def _bind(self, owner, element):
+        """
+        Diffuse the changes to an owner.
+
+        :param Observable owner: the observable owning the collection
+        :param str element: the observable property name
+        """
+        for reference, name in self._bindings:
+            if reference() is owner and name == element:
+                return
+        self._bindings += ((weakref.ref(owner), element),)
+
+    def _diffuse(self, action, key=None, value=None, previous=None):
+        stale = False
+        for reference, element in self._bindings:
+            owner = reference()
+            if owner is None or not owner.diffuseCollectionChange(
+                    element, self, action, key, value, previous):
+                stale = True
+
+        if stale:
+            # Forget the owners gone, or not holding the collection anymore
+            self._bindings = tuple(
+                (reference, element)
+                for reference, element in self._bindings
+                if reference() is not None and
+                getattr(reference(), element) is self)
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles are not bound to the owners
+        return (type(self), (self._baseType(self),))
+
+
+class ObservableList(ObservableCollection, list):
+    __slots__ = ("_bindings",)
+    _baseType = list
+
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self._bindings = ()
+
+    def _index(self, index):
+        return index + len(self) if index < 0 else index
+
+    def __setitem__(self, key, value):
+        if not self._bindings:
+            return list.__setitem__(self, key, value)
+
+        if isinstance(key, slice):
+            value = list(value)
+            previous = list.__getitem__(self, key)
+        else:
+            key = self._index(key)
+            previous = list.__getitem__(self, key)
+        list.__setitem__(self, key, value)
+        self._diffuse("replace", key, value, previous)
+
+    def __delitem__(self, key):
+        if not self._bindings:
+            return list.__delitem__(self, key)
+
+        if not isinstance(key, slice):
+            key = self._index(key)
+        previous = list.__getitem__(self, key)
+        list.__delitem__(self, key)
+        self._diffuse("remove", key, None, previous)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, count):
+        length = len(self)
+        list.__imul__(self, count)
+        if self._bindings and length:
+            if count <= 0:
+                self._diffuse("clear")
+            elif count > 1:
+                self._diffuse("insert", slice(length, len(self)),
+                              list.__getitem__(self, slice(length, None)))
+        return self
+
+    def append(self, value):
+        list.append(self, value)
+        if self._bindings:
+            self._diffuse("insert", len(self) - 1, value)
+
+    def extend(self, values):
+        if not self._bindings:
+            return list.extend(self, values)
+
+        values = list(values)
+        length = len(self)
+        list.extend(self, values)
+        if values:
+            self._diffuse("insert", slice(length, len(self)), values)
+
+    def insert(self, index, value):
+        if not self._bindings:
+            return list.insert(self, index, value)
+
+        index = min(max(self._index(index), 0), len(self))
+        list.insert(self, index, value)
+        self._diffuse("insert", index, value)
+
+    def pop(self, index=-1):
+        if not self._bindings:
+            return list.pop(self, index)
+
+        index = self._index(index)
+        previous = list.pop(self, index)
+        self._diffuse("remove", index, None, previous)
+        return previous
+
+    def remove(self, value):
+        if not self._bindings:
+            return list.remove(self, value)
+
+        index = self.index(value)
+        previous = list.__getitem__(self, index)
+        list.__delitem__(self, index)
+        self._diffuse("remove", index, None, previous)
+
+    def clear(self):
+        length = len(self)
+        list.clear(self)
+        if self._bindings and length:
+            self._diffuse("clear")
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        if self._bindings:
+            self._diffuse("reorder")
+
+    def reverse(self):
+        list.reverse(self)
+        if self._bindings:
+            self._diffuse("reorder")
+
+
+class ObservableDict(ObservableCollection, dict):
+    __slots__ = ("_bindings",)
+    _baseType = dict
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._bindings = ()
+
+    def __setitem__(self, key, value):
+        if not self._bindings:
+            return dict.__setitem__(self, key, value)
+
+        if key in self:
+            previous = dict.__getitem__(self, key)
+            dict.__setitem__(self, key, value)
+            self._diffuse("replace", key, value, previous)
+        else:
+            dict.__setitem__(self, key, value)
+            self._diffuse("insert", key, value)
+
+    def __delitem__(self, key):
+        if not self._bindings:
+            return dict.__delitem__(self, key)
+
+        previous = dict.__getitem__(self, key)
+        dict.__delitem__(self, key)
+        self._diffuse("remove", key, None, previous)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        if not self._bindings or key not in self:
+            return dict.pop(self, key, *default)
+
+        previous = dict.pop(self, key)
+        self._diffuse("remove", key, None, previous)
+        return previous
+
+    def popitem(self):
+        key, previous = dict.popitem(self)
+        if self._bindings:
+            self._diffuse("remove", key, None, previous)
+        return key, previous
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        if not self._bindings:
+            return dict.update(self, *args, **kwargs)
+
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        length = len(self)
+        dict.clear(self)
+        if self._bindings and length:
+            self._diffuse("clear")
+
+
+class ObservableSet(ObservableCollection, set):
+    __slots__ = ("_bindings",)
+    _baseType = set
+
+    def __init__(self, *args):
+        set.__init__(self, *args)
+        self._bindings = ()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+    def add(self, item):
+        if not self._bindings:
+            return set.add(self, item)
+
+        if item not in self:
+            set.add(self, item)
+            self._diffuse("insert", item, item)
+
+    def discard(self, item):
+        if not self._bindings:
+            return set.discard(self, item)
+
+        if item in self:
+            set.discard(self, item)
+            self._diffuse("remove", item, None, item)
+
+    def remove(self, item):
+        if item not in self:
+            raise KeyError(item)
+        self.discard(item)
+
+    def pop(self):
+        item = set.pop(self)
+        if self._bindings:
+            self._diffuse("remove", item, None, item)
+        return item
+
+    def clear(self):
+        length = len(self)
+        set.clear(self)
+        if self._bindings and length:
+            self._diffuse("clear")
+
+    def update(self, *others):
+        if not self._bindings:
+            return set.update(self, *others)
+
+        for other in others:
+            for item in other:
+                self.add(item)
+
+    def difference_update(self, *others):
+        if not self._bindings:
+            return set.difference_update(self, *others)
+
+        for other in others:
+            for item in other:
+                self.discard(item)
+
+    def intersection_update(self, *others):
+        if not self._bindings:
+            return set.intersection_update(self, *others)
+
+        kept = set.intersection(self, *others)
+        for item in [item for item in self if item not in kept]:
+            self.discard(item)
+
+    def symmetric_difference_update(self, other):
+        if not self._bindings:
+            return set.symmetric_difference_update(self, other)
+
+        for item in set(other):
+            if item in self:
+                self.discard(item)
+            else:
+                self.add(item)
@@ -37,10 +37,60 @@ def voltage(self):
 """
 
 
+from .Comparators import getComparator
+from .ObservableCollections import ObservableCollection
+
+
 class observable_property(property):
-    def __init__(self, *args, **kwargs):
-        super(observable_property, self).__init__(*args, **kwargs)
-        self.name = args[0].__name__  # The property get function
+    def __init__(self, fget=None, fset=None, fdel=None, doc=None,
+                 compare=None):
+        """
+        :param compare: "equality", "identity" or a comparator. When set,
+                        a change to the same value is not diffused.
+                        Refer to Comparators.
+        """
+        super(observable_property, self).__init__(fget, fset, fdel, doc)
+        # The property get function gives the name
+        self.name = fget.__name__ if fget is not None else None
+        self.compare = getComparator(compare)
+        # The computed observable properties depending on this one,
+        #  registered by the Observable classes using them.
+        self._dependents = ()
+
+    def __call__(self, fget):
+        """
+        Allow options to be given to the decorator.
+
+        .. code-block:: python
+            @observable_property(compare="equality")
+            def voltage(self):
+                return self.__voltage
+        """
+        return self.getter(fget)
+
+    def getter(self, fget):
+        return self._withOptions(
+            super(observable_property, self).getter(fget))
+
+    def setter(self, fset):
+        return self._withOptions(
+            super(observable_property, self).setter(fset))
+
+    def deleter(self, fdel):
+        return self._withOptions(
+            super(observable_property, self).deleter(fdel))
+
+    def _withOptions(self, other):
+        other.compare = self.compare
+        return other
+
+    def _copy(self):
+        """
+        A copy of the property, without its dependents, so a subclass
+            registers its own.
+        """
+        return self._withOptions(
+            type(self)(self.fget, self.fset, self.fdel, self.__doc__))
 
     def __set__(self, obj, value):
         """
@@ -50,9 +100,73 @@ class observable_property(property):
         :param obj: The instance that owns the property.
         :param value: The new value for the property.
         """
-        previousValue = getattr(obj, self.name)
-        super(observable_property, self).__set__(obj, value)
-        obj.diffuse(self.name, previousValue, value)
+        if self._dependents:
+            self._prepareDependents(obj)
+
+        if not obj.isObserved(self.name):
+            # Nobody to inform, skip the previous value and diffusion
+            property.__set__(self, obj, value)
+            if isinstance(value, ObservableCollection):
+                value._bind(obj, self.name)
+        else:
+            previousValue = getattr(obj, self.name)
+            super(observable_property, self).__set__(obj, value)
+            if (isinstance(value, ObservableCollection) or
+                    isinstance(previousValue, ObservableCollection)):
+                self._resetCollection(obj, previousValue, value)
+            obj._diffuseChange(self.name, previousValue, value)
+
+        if self._dependents:
+            self._refreshDependents(obj)
+
+    def _prepareDependents(self, obj):
+        for computed in self._dependents:
+            computed._prepare(obj)
+
+    def _refreshDependents(self, obj, changes=None):
+        """
+        Refresh the computed properties depending on this one.
+
+        :param dict changes: when given, receives the changes of the
+                             computed properties, (previous, actual) by
+                             name, instead of diffusing them.
+        """
+        for computed in self._dependents:
+            computed._refresh(obj, changes)
+
+    def _resetCollection(self, obj, previousValue, value):
+        # Bind a collection set to the property, and inform the delta
+        #  observers the collection is replaced.
+        if isinstance(value, ObservableCollection):
+            value._bind(obj, self.name)
+        elif not isinstance(previousValue, ObservableCollection):
+            return
+        obj.diffuseCollectionChange(
+            self.name, value, "reset", None, value, previousValue)
+
+    async def aset(self, obj, value):
+        """
+        Same as setting the property, awaiting the coroutine functions
+        observing the change.
+
+        :param obj: The instance that owns the property.
+        :param value: The new value for the property.
+        """
+        if self._dependents:
+            self._prepareDependents(obj)
+
+        if not obj.isObserved(self.name):
+            property.__set__(self, obj, value)
+            if isinstance(value, ObservableCollection):
+                value._bind(obj, self.name)
+        else:
+            previousValue = getattr(obj, self.name)
+            property.__set__(self, obj, value)
+            self._resetCollection(obj, previousValue, value)
+            await obj._adiffuseChange(self.name, previousValue, value)
+
+        if self._dependents:
+            self._refreshDependents(obj)
 
     def __delete__(self, obj):
         """
@@ -61,6 +175,16 @@ class observable_property(property):
 
         :param obj: The instance that owns the property.
         """
-        previousValue = getattr(obj, self.name)
-        super(observable_property, self).__delete__(obj)
-        obj.diffuse(self.name, previousValue, None)
+        if self._dependents:
+            self._prepareDependents(obj)
+
+        if not obj.isObserved(self.name):
+            property.__delete__(self, obj)
+        else:
+            previousValue = getattr(obj, self.name)
+            super(observable_property, self).__delete__(obj)
+            self._resetCollection(obj, previousValue, None)
+            obj._diffuseChange(self.name, previousValue, None)
+
+        if self._dependents:
+            self._refreshDependents(obj)
@@ -2,9 +2,23 @@
 # -*- coding: utf-8 -*-
 
 
+from .Comparators import getComparator
+from .ObserverTypeEnum import observerTypeEnum
+
+
 class ObservableStore():
-    def __init__(self, observables):
+    def __init__(self, observables, copyOnWrite=False, comparators=None):
+        """
+        :param list observables: the observable element names
+        :param bool copyOnWrite: when true, the list and comparators are
+                                 shared and copied before the first add
+                                 or remove.
+        :param dict comparators: comparator by element name, refer to
+                                 Comparators.
+        """
         self._observables = observables
+        self._comparators = comparators if comparators is not None else {}
+        self._shared = copyOnWrite
 
     def getObservableElements(self):
         """
@@ -69,15 +83,43 @@ class ObservableStore():
             result = True
         return result
 
-    def add(self, observableElement):
+    def getMatchingElements(self, pattern):
+        """
+        get the observable elements matching a pattern
+
+        :param re.Pattern pattern: a regular expression, refer to
+                                   ObserverTypeEnum.
+        :return: the matching element names, in the store order.
+        :rtype: Array
+        """
+        return [element for element in self._observables
+                if observerTypeEnum.matches(pattern, element)]
+
+    def getComparator(self, observableElement):
+        """
+        get the comparator detecting unchanged values of an element
+
+        :param str observableElement: the name of the observable element
+        :return: the comparator, or None when changes are not compared.
+        :rtype: func
+        """
+        return self._comparators.get(observableElement)
+
+    def add(self, observableElement, compare=None):
         """
         add an observable element
 
         :param str observableElement: the name of the observable element
+        :param compare: "equality", "identity" or a comparator
         :raises RuntimeError: if element name already exist in the store
+        :raises TypeError: if compare is not a comparator
         """
         if observableElement not in self._observables:
+            comparator = getComparator(compare)
+            self._own()
             self._observables.append(observableElement)
+            if comparator is not None:
+                self._comparators[observableElement] = comparator
         else:
             raise RuntimeError(
                 "{0} is already an observable element"
@@ -90,4 +132,12 @@ class ObservableStore():
         :param str observableElement: the name of the observable element
         """
         if observableElement in self._observables:
+            self._own()
             self._observables.remove(observableElement)
+            self._comparators.pop(observableElement, None)
+
+    def _own(self):
+        if self._shared:
+            self._observables = list(self._observables)
+            self._comparators = dict(self._comparators)
+            self._shared = False
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+import weakref
+from .ObserverTypeEnum import observerTypeEnum
+
+
+class ObserverRecord():
+    """
+    A subscription of an observer, kept by the ObserverStore.
+
+    observing: the element name, "*", the list of element names or a
+               pattern
+    type: the observerTypeEnum of observing
+    elements: the observed element names, without duplicate. Resolved
+              by the ObserverStore for a pattern, empty for "*".
+    call: the function to call
+    actions: the diffusing actions, by diffusing mode, refer to Diffusible
+    executor: the DiffusionExecutor calling the observer, or None
+    limiter: the Throttle or Debounce limiting the calls, or None
+    """
+    __slots__ = ("observing", "type", "elements", "call", "actions",
+                 "executor", "limiter")
+
+    def __init__(self, observing, type, call, actions=None, executor=None,
+                 limiter=None, elements=None):
+        self.observing = observing
+        self.type = type
+        if elements is None:
+            elements = _observedElements(observing, type)
+        self.elements = elements
+        self.call = call
+        self.actions = actions
+        self.executor = executor
+        self.limiter = limiter
+
+    def getCall(self):
+        """
+        :return: the function called, None when it was weakly
+                 referenced and is garbage collected.
+        """
+        if isinstance(self.call, _WeakCall):
+            return self.call.target()
+        return self.call
+
+    def __getitem__(self, key):
+        # Compatibility with the dict records used before
+        if key not in ObserverRecord.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __repr__(self):
+        return "ObserverRecord({0!r}, {1}, {2!r})".format(
+            self.observing, self.type, self.call)
+
+
+def _observedElements(observing, type):
+    if type is observerTypeEnum.element:
+        return (observing,)
+    if type is observerTypeEnum.listOfElements:
+        # dict.fromkeys keeps the order and drops duplicated names
+        return tuple(dict.fromkeys(observing))
+    return ()
+
+
+class _WeakCall():
+    """
+    Call a function without keeping it alive.
+        Bound methods are referenced using WeakMethod, so the observer
+        lives as long as the instance it is bound to.
+    """
+    __slots__ = ("_reference", "__weakref__")
+
+    def __init__(self, call, onDead):
+        def dead(reference):
+            onDead()
+
+        if hasattr(call, "__self__") and hasattr(call, "__func__"):
+            self._reference = weakref.WeakMethod(call, dead)
+        else:
+            self._reference = weakref.ref(call, dead)
+
+    def target(self):
+        return self._reference()
+
+    def __call__(self, *args):
+        call = self._reference()
+        if call is not None:
+            return call(*args)
+
+    def __eq__(self, other):
+        if isinstance(other, _WeakCall):
+            return self._reference == other._reference
+        return self._reference() == other
+
+    __hash__ = None
@@ -1,13 +1,48 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
+from .ObserverRecord import ObserverRecord, _WeakCall
 from .ObserverTypeEnum import observerTypeEnum
 
 
 class ObserverStore():
-    def __init__(self):
+    def __init__(self, actions=None, isolatedActions=None):
+        """
+        :param dict actions: the diffusing actions to bind to each
+                             observer, by observer type.
+        :param dict isolatedActions: the diffusing actions to bind to
+                                     observers asking for isolation.
+        """
+        self._actions = actions
+        self._isolatedActions = isolatedActions
         self._observers = []
+        # Dispatch index: element name -> observers interested by it.
+        #  Each bucket also holds the state observers, in subscription
+        #  order, so dispatching is a single lookup.
+        self._index = {}
+        self._stateObservers = ()
+        # Observers of a pattern, resolved again when elements change
+        self._patternObservers = ()
+        # Set when a weakly referenced observer is garbage collected
+        self._hasDeadObservers = False
+
+    def add(self, what, call, isolate=False, executor=None, weak=False,
+            limiter=None, elements=None):
+        """
+        add an observer
 
-    def add(self, what, call):
+        :param str|Array what: the observed element names, "*" for all,
+                               or a pattern.
+        :param func call: the function to call
+        :param bool isolate: bind the isolated actions
+        :param DiffusionExecutor executor: the executor calling it
+        :param bool weak: do not keep call alive
+        :param limiter: the Throttle or Debounce limiting the calls
+        :param Array elements: for a pattern, the element names it
+                               matches. Keep them up to date using
+                               onElementAdded and onElementRemoved.
+        :return: the observer record
+        :rtype: ObserverRecord
+        """
 
         def isCallableFunction(function):
             return hasattr(function, "__call__")
@@ -19,14 +54,50 @@ class ObserverStore():
         type = observerTypeEnum.typeOf(what)
         if type is observerTypeEnum.unknown:
             raise TypeError(
-                    "'what' parameter should be a str or " +
+                    "'what' parameter should be a str, a pattern or " +
                     " an array of strings. Received '{0}'".format(what))
 
-        self._observers.append(
-                                {"observing": what,
-                                 "type": type,
-                                 "call": call
-                                 })
+        if weak:
+            call = _WeakCall(call, self._onDeadObserver)
+
+        self._pruneDeadObservers()
+        actions = self._isolatedActions if isolate else self._actions
+        if type is observerTypeEnum.pattern:
+            elements = tuple(elements) if elements is not None else ()
+        else:
+            elements = None
+        observer = ObserverRecord(
+            what, type, call,
+            actions[type] if actions is not None else None,
+            executor, limiter, elements)
+        self._observers.append(observer)
+        self._indexObserver(observer)
+        return observer
+
+    def onElementAdded(self, element):
+        """
+        Resolve the patterns again once an element is added, so their
+            observers are called for it.
+
+        :param str element: the added element name
+        """
+        for observer in self._patternObservers:
+            if (element not in observer.elements and
+                    observerTypeEnum.matches(observer.observing, element)):
+                observer.elements += (element,)
+                self._indexElement(element, observer)
+
+    def onElementRemoved(self, element):
+        """
+        Resolve the patterns again once an element is removed.
+
+        :param str element: the removed element name
+        """
+        for observer in self._patternObservers:
+            if element in observer.elements:
+                observer.elements = tuple(
+                    e for e in observer.elements if e != element)
+                self._unindexElement(element, observer)
 
     def remove(self, what, call):
         """
@@ -38,19 +109,32 @@ class ObserverStore():
             - previousValue,
             - actualValue
 
+        :return: the removed observer record
+        :rtype: ObserverRecord
+        :raises ValueError: if the observer is not subscribed
         """
-        type = observerTypeEnum.typeOf(what)
-        self._observers.remove({
-                                    "observing": what,
-                                    "type": type,
-                                    "call": call
-                                 })
+        self._pruneDeadObservers()
+        for observer in self._observers:
+            if observer.observing == what and observer.call == call:
+                self._observers.remove(observer)
+                self._unindexObserver(observer)
+                self._cancelLimiter(observer)
+                return observer
+
+        raise ValueError(
+            "No observer of '{0}' calling {1}".format(what, call))
 
     def removeAll(self):
         """
         remove all observers
         """
+        for observer in self._observers:
+            self._cancelLimiter(observer)
         del self._observers[:]
+        self._index.clear()
+        self._stateObservers = ()
+        self._patternObservers = ()
+        self._hasDeadObservers = False
 
     def getObservers(self):
         """
@@ -59,12 +143,17 @@ class ObserverStore():
         :return: Subscribed Obversers.
         :rtype: Array
         """
+        self._pruneDeadObservers()
         result = []
         for observer in self._observers:
+            call = observer.getCall()
+            if call is None:
+                continue
+
             result.append(
                           {
-                              "observing": observer["observing"],
-                              "call": observer["call"]
+                              "observing": observer.observing,
+                              "call": call
                           })
         return result
 
@@ -75,17 +164,125 @@ class ObserverStore():
         :return: true if it has observer, otherwise false.
         :rtype: bool
         """
+        self._pruneDeadObservers()
         return self._observers.__len__() > 0
 
+    def isObserved(self, element):
+        """
+        Mention if an element is observed by any observer.
+
+        :param str element: the element name
+        :return: true if it has observer, otherwise false.
+        :rtype: bool
+        """
+        return element in self._index or len(self._stateObservers) > 0
+
     def iterationGenerator(self, filter=None):
+        """
+        :param str|Array filter: the element name, or names, to give
+                                 the observers of. An observer of
+                                 several of them is given once.
+                                 None to give all observers.
+        """
+        self._pruneDeadObservers()
         if filter is None:
             obsersers = self._observers
-        else:
+        elif isinstance(filter, str):
             obsersers = self._filter(filter)
+        else:
+            obsersers = self._filterElements(filter)
 
         for observer in obsersers:
             yield observer  # , type
 
+    def getElementObservers(self, element):
+        """
+        Get the observers of an element, including the state observers,
+            in subscription order. Same as iterationGenerator(element),
+            without a generator.
+
+        :param str element: the element name
+        :rtype: tuple
+        """
+        if self._hasDeadObservers:
+            self._pruneDeadObservers()
+        return self._index.get(element, self._stateObservers)
+
     def _filter(self, filter):
-        return ([o for o in self._observers if (
-                "*" == o["observing"] or filter in o["observing"])])
+        return self._index.get(filter, self._stateObservers)
+
+    def _filterElements(self, elements):
+        if len(elements) == 1:
+            return self._filter(elements[0])
+
+        observers = {}
+        for element in elements:
+            for observer in self._filter(element):
+                observers[id(observer)] = observer
+        return observers.values()
+
+    def _onDeadObserver(self):
+        # Called by the garbage collector, at any time: only flag it,
+        #  dead observers are removed by the next store operation.
+        self._hasDeadObservers = True
+
+    def _pruneDeadObservers(self):
+        if not self._hasDeadObservers:
+            return
+
+        self._hasDeadObservers = False
+        for observer in [o for o in self._observers
+                         if o.getCall() is None]:
+            self._observers.remove(observer)
+            self._unindexObserver(observer)
+            self._cancelLimiter(observer)
+
+    @staticmethod
+    def _cancelLimiter(observer):
+        # A removed observer receives no pending change
+        if observer.limiter is not None:
+            observer.limiter.cancel()
+
+    def _indexObserver(self, observer):
+        # Buckets are tuples, rebuilt on change, so a dispatch in progress
+        #  is not disturbed by observers subscribing or unsubscribing.
+        if observer.type is observerTypeEnum.state:
+            self._stateObservers += (observer,)
+            for element, bucket in self._index.items():
+                self._index[element] = bucket + (observer,)
+        else:
+            if observer.type is observerTypeEnum.pattern:
+                self._patternObservers += (observer,)
+            for element in observer.elements:
+                bucket = self._index.get(element, self._stateObservers)
+                self._index[element] = bucket + (observer,)
+
+    def _unindexObserver(self, observer):
+        def without(bucket):
+            return tuple(o for o in bucket if o is not observer)
+
+        if observer.type is observerTypeEnum.state:
+            self._stateObservers = without(self._stateObservers)
+            for element, bucket in self._index.items():
+                self._index[element] = without(bucket)
+        else:
+            if observer.type is observerTypeEnum.pattern:
+                self._patternObservers = without(self._patternObservers)
+            for element in observer.elements:
+                self._unindexElement(element, observer)
+
+    def _indexElement(self, element, observer):
+        # Insert in the bucket keeping the subscription order
+        bucket = self._index.get(element, self._stateObservers)
+        members = {id(o) for o in bucket}
+        members.add(id(observer))
+        self._index[element] = tuple(
+            o for o in self._observers if id(o) in members)
+
+    def _unindexElement(self, element, observer):
+        bucket = tuple(o for o in self._index[element] if o is not observer)
+        if len(bucket) == len(self._stateObservers):
+            # only state observers left, use the shared bucket
+            del self._index[element]
+        else:
+            self._index[element] = bucket
@@ -1,7 +1,9 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import re
 from enum import Enum, unique
+from fnmatch import translate
 
 
 """
@@ -14,8 +16,28 @@ from enum import Enum, unique
     -------------------------------------------------------
     | ["str","str", ...] | observerTypeEnum.listOfElements|
     -------------------------------------------------------
+    | re.compile(...)    | observerTypeEnum.pattern       |
+    | glob("cell*")      |                                |
+    -------------------------------------------------------
+
+A pattern is a compiled regular expression matching the whole element
+    name. glob compiles one from a glob using *, ? and [...], refer to
+    fnmatch. A string is always an element name, even "cell[0]".
 """
 
+# re.Pattern is only defined since Python 3.7
+_PATTERN_TYPE = type(re.compile(""))
+
+
+def glob(pattern):
+    """
+    Give the pattern observing the element names matching a glob.
+
+    :param str pattern: a glob using *, ? and [...], refer to fnmatch
+    :rtype: re.Pattern
+    """
+    return re.compile(translate(pattern))
+
 
 @unique
 class observerTypeEnum(Enum):
@@ -23,6 +45,7 @@ class observerTypeEnum(Enum):
     state = 1
     element = 2
     listOfElements = 3
+    pattern = 4
 
     @classmethod
     def typeOf(cls, what):
@@ -36,11 +59,26 @@ class observerTypeEnum(Enum):
         result = observerTypeEnum.unknown
 
         if isinstance(what, str):
-            result = (observerTypeEnum.state
-                      if (what == "*")
-                      else observerTypeEnum.element)
+            if what == "*":
+                result = observerTypeEnum.state
+            else:
+                result = observerTypeEnum.element
+
+        elif isinstance(what, _PATTERN_TYPE):
+            result = observerTypeEnum.pattern
 
         elif hasattr(what, "__len__"):
             result = observerTypeEnum.listOfElements
 
         return result
+
+    @staticmethod
+    def matches(pattern, elementName):
+        """
+        Mention if an element name matches a pattern.
+
+        :param re.Pattern pattern: a regular expression, refer to glob
+        :param str elementName: the element name to evaluate
+        :rtype: bool
+        """
+        return pattern.fullmatch(elementName) is not None
@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+
+"""
+Limit the rate an observer is called at, using a TimerWheel.
+
+Both limiters merge the changes received while waiting: the observer
+    receives the previous value of the first change and the actual
+    value of the last one.
+
+Throttle: call at most once by interval. The first change is delivered
+    at once, the next ones at the end of the interval.
+Debounce: call once no change happened during the delay.
+"""
+
+
+class _RateLimiter():
+    def __init__(self, wheel):
+        """
+        :param TimerWheel wheel: the wheel running the timers
+        """
+        self._wheel = wheel
+        self._lock = threading.Lock()
+        self._pending = None
+        self._timer = None
+        # Set once the observer is removed, nothing is delivered anymore
+        self._cancelled = False
+        # The function delivering (previous, actual) to the observer
+        self.deliver = None
+
+    def cancel(self):
+        """
+        Forget the pending changes and cancel the timer, called when
+            the observer is removed.
+        """
+        with self._lock:
+            self._cancelled = True
+            self._pending = None
+            if self._timer is not None:
+                self._wheel.cancel(self._timer)
+                self._timer = None
+
+    def _merge(self, previous, actual):
+        if self._pending is None:
+            self._pending = [previous, actual]
+        else:
+            self._pending[1] = actual
+
+    def _fire(self):
+        with self._lock:
+            if self._cancelled:
+                return
+            pending = self._pending
+            self._pending = None
+            self._timer = None
+            self._onFire()
+
+        if pending is not None:
+            self.deliver(*pending)
+
+    def _onFire(self):
+        pass
+
+
+class Throttle(_RateLimiter):
+    def __init__(self, interval, wheel):
+        """
+        :param float interval: minimal seconds between two calls
+        :param TimerWheel wheel: the wheel running the timers
+        """
+        super(Throttle, self).__init__(wheel)
+        self._interval = interval
+        self._last = None
+
+    def push(self, previous, actual):
+        """
+        Receive a change to deliver.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            now = self._wheel.now()
+            if self._timer is None and (
+                    self._last is None or
+                    now - self._last >= self._interval):
+                self._last = now
+                deliverNow = True
+            else:
+                self._merge(previous, actual)
+                if self._timer is None:
+                    self._timer = self._wheel.schedule(
+                        self._last + self._interval - now, self._fire)
+                deliverNow = False
+
+        if deliverNow:
+            self.deliver(previous, actual)
+
+    def _onFire(self):
+        self._last = self._wheel.now()
+
+
+class Debounce(_RateLimiter):
+    def __init__(self, delay, wheel):
+        """
+        :param float delay: seconds without change before calling
+        :param TimerWheel wheel: the wheel running the timers
+        """
+        super(Debounce, self).__init__(wheel)
+        self._delay = delay
+
+    def push(self, previous, actual):
+        """
+        Receive a change to deliver.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            self._merge(previous, actual)
+            if self._timer is not None:
+                self._wheel.cancel(self._timer)
+            self._timer = self._wheel.schedule(self._delay, self._fire)
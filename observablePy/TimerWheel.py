@@ -0,0 +1,244 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import logging
+import math
+import threading
+import time
+
+"""
+Hierarchical timer wheel, running many timers using one thread.
+
+Timers are kept in buckets by expiry tick. The first level has one
+    bucket by tick, each next level has one bucket by turn of the
+    level below. When a level completes a turn, the current bucket of
+    the level above is spread into the levels below, so scheduling,
+    cancelling and expiring a timer cost O(1).
+
+=================
+How to use it
+=================
+
+.. code-block:: python
+from observablePy.TimerWheel import TimerWheel, VirtualClock
+
+wheel = TimerWheel(tick=0.01)
+wheel.start()  # expire timers using a daemon thread
+timer = wheel.schedule(0.5, print, "half a second later")
+wheel.cancel(timer)
+
+# Deterministic tests
+clock = VirtualClock()
+wheel = TimerWheel(tick=0.01, clock=clock)
+wheel.schedule(0.5, print, "half a second later")
+clock.advance(0.5)  # print is called here
+
+"""
+
+
+_logger = logging.getLogger(__name__)
+
+
+class VirtualClock():
+    """
+    A clock advancing only when asked, for deterministic tests.
+        Advancing it expires the due timers of the wheels using it.
+    """
+
+    def __init__(self, now=0.0):
+        self._now = now
+        self._wheels = []
+
+    def __call__(self):
+        return self._now
+
+    def attach(self, wheel):
+        self._wheels.append(wheel)
+
+    def advance(self, seconds):
+        """
+        Move the time forward and expire the due timers.
+
+        :param float seconds: the time to add
+        """
+        self._now += seconds
+        for wheel in self._wheels:
+            wheel.advance()
+
+
+class _Timer():
+    __slots__ = ("expires", "call", "args", "cancelled")
+
+    def __init__(self, expires, call, args):
+        self.expires = expires
+        self.call = call
+        self.args = args
+        self.cancelled = False
+
+
+class TimerWheel():
+    _default = None
+    _defaultLock = threading.Lock()
+
+    def __init__(self, tick=0.01, slotBits=8, levels=4, clock=None):
+        """
+        :param float tick: the resolution of the timers, in seconds
+        :param int slotBits: each level has 2 ** slotBits buckets
+        :param int levels: the number of levels
+        :param func clock: give the time in seconds, time.monotonic
+                           by default. A VirtualClock drives the wheel.
+        """
+        self._tickDuration = tick
+        self._bits = slotBits
+        self._mask = (1 << slotBits) - 1
+        self._wheels = [[[] for _ in range(1 << slotBits)]
+                        for _ in range(levels)]
+        self._clock = clock if clock is not None else time.monotonic
+        self._lock = threading.Lock()
+        self._count = 0
+        self._thread = None
+        self._stopping = threading.Event()
+        self._tick = self._ticksAt(self._clock())
+
+        if hasattr(self._clock, "attach"):
+            self._clock.attach(self)
+
+    @classmethod
+    def getDefault(cls):
+        """
+        Get the wheel shared by default, expiring timers using a
+            daemon thread started on first use.
+
+        :rtype: TimerWheel
+        """
+        with cls._defaultLock:
+            if cls._default is None:
+                cls._default = TimerWheel()
+                cls._default.start()
+            return cls._default
+
+    def now(self):
+        """
+        :return: the time of the wheel clock, in seconds.
+        :rtype: float
+        """
+        return self._clock()
+
+    def schedule(self, delay, call, *args):
+        """
+        Call a function once the delay expired.
+
+        :param float delay: seconds to wait, rounded up to the tick
+        :param func call: the function to call
+        :return: the timer, to use to cancel it.
+        """
+        ticks = max(1, math.ceil(delay / self._tickDuration - 1e-9))
+        with self._lock:
+            timer = _Timer(self._tick + ticks, call, args)
+            self._insert(timer)
+            self._count += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancel a timer not expired yet.
+
+        :param timer: the timer given by schedule
+        """
+        with self._lock:
+            if not timer.cancelled:
+                timer.cancelled = True
+                self._count -= 1
+
+    def __len__(self):
+        return self._count
+
+    def advance(self):
+        """
+        Expire the timers due at the clock time. Called by the thread
+            started by start, or by a VirtualClock. An exception raised
+            by a timer is logged, the other timers are still called.
+        """
+        target = self._ticksAt(self._clock())
+        expired = []
+        with self._lock:
+            while self._tick < target:
+                if self._count == 0:
+                    # Nothing to expire in between
+                    self._tick = target
+                    break
+                self._tick += 1
+                self._cascade()
+                bucket = self._wheels[0][self._tick & self._mask]
+                if bucket:
+                    self._wheels[0][self._tick & self._mask] = []
+                    for timer in bucket:
+                        if timer.cancelled:
+                            continue
+                        if timer.expires > self._tick:
+                            # Beyond the range of the top level
+                            self._insert(timer)
+                            continue
+                        timer.cancelled = True
+                        self._count -= 1
+                        expired.append(timer)
+
+        for timer in expired:
+            # A failing timer neither skips the others nor stops the
+            #  thread running the wheel.
+            try:
+                timer.call(*timer.args)
+            except Exception:
+                _logger.exception("Timer calling %r failed", timer.call)
+
+    def start(self):
+        """
+        Expire timers using a daemon thread.
+        """
+        if self._thread is not None:
+            return
+
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="TimerWheel", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the thread started by start.
+        """
+        if self._thread is None:
+            return
+
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopping.wait(self._tickDuration):
+            self.advance()
+
+    def _ticksAt(self, now):
+        return int(now / self._tickDuration + 1e-9)
+
+    def _insert(self, timer):
+        delta = timer.expires - self._tick
+        for level, wheel in enumerate(self._wheels):
+            if delta < (1 << (self._bits * (level + 1))):
+                break
+        wheel[(timer.expires >> (self._bits * level)) & self._mask].append(
+            timer)
+
+    def _cascade(self):
+        # Once a level completes a turn, spread the current bucket of
+        #  the level above into the levels below.
+        for level in range(1, len(self._wheels)):
+            if self._tick & ((1 << (self._bits * level)) - 1):
+                break
+            index = (self._tick >> (self._bits * level)) & self._mask
+            bucket = self._wheels[level][index]
+            if bucket:
+                self._wheels[level][index] = []
+                for timer in bucket:
+                    if not timer.cancelled:
+                        self._insert(timer)
@@ -2,11 +2,21 @@
 # -*- coding: utf-8 -*-
 
 from .ObservableProperty import observable_property
+from .ComputedObservableProperty import computed_observable_property
 from .Observable import Observable
+from .Comparators import equality, identity, tolerance
+from .DiffusionExecutor import DiffusionExecutor
+from .ObserverTypeEnum import glob
+from .ChangeJournal import JournalReader, JournalWriter
+from .ObservableCollections import (
+    CollectionChange, ObservableDict, ObservableList, ObservableSet)
 
 __author__ = "Frederick Lussier <frederick.lussier@hotmail.com>"
 __status__ = "dev"
 __version__ = "0.2.2"
 __date__ = "october 15th 2017"
 
-__all__ = ["ObservableProperty", "Observable"]
+__all__ = ["ObservableProperty", "Observable", "computed_observable_property",
+           "equality", "identity", "tolerance", "glob", "DiffusionExecutor",
+           "CollectionChange", "ObservableDict", "ObservableList",
+           "ObservableSet", "JournalReader", "JournalWriter"]
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from observablePy.ChangeHistory import ChangeHistory
+
+
+class ChangeHistoryTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.history = ChangeHistory(capacity=3)
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.history = None
+
+    """
+    record
+    """
+
+    def testRecord_ShouldKeepChangesInOrder(self):
+        # Action
+        self.history("voltage", 0, 3392)
+        self.history("level", 0.0, 0.67)
+
+        # Assert
+        entries = self.history.getEntries()
+        self.assertEqual([e[:3] for e in entries],
+                         [("voltage", 0, 3392), ("level", 0.0, 0.67)])
+        self.assertLessEqual(entries[0].timestamp, entries[1].timestamp)
+        self.assertEqual(len(self.history), 2)
+
+    def testRecord_WhenFull_ShouldOverwriteOldest(self):
+        # Action
+        for value in range(1, 6):
+            self.history("voltage", value - 1, value)
+
+        # Assert
+        self.assertEqual([e.actual for e in self.history.getEntries()],
+                         [3, 4, 5])
+        self.assertEqual(len(self.history), 3)
+
+    def testRecord_UsingElements_ShouldOnlyRecordThem(self):
+        # Arrange
+        history = ChangeHistory(capacity=3, elements=["voltage"])
+
+        # Action
+        history("voltage", 0, 3392)
+        history("level", 0.0, 0.67)
+
+        # Assert
+        self.assertEqual([e.element for e in history.getEntries()],
+                         ["voltage"])
+
+    def testInit_WhenNoCapacity_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            ChangeHistory(capacity=0)
+
+    """
+    getEntries
+    """
+
+    def testGetEntries_UsingSinceAndElement_ShouldFilter(self):
+        # Arrange
+        self.history("voltage", 0, 3300)
+        since = self.history.getEntries()[-1].timestamp
+        self.history("level", 0.0, 0.67)
+        self.history("voltage", 3300, 3392)
+
+        # Action
+        entries = self.history.getEntries(since=since, element="voltage")
+
+        # Assert
+        self.assertEqual([e.actual for e in entries], [3392])
+
+    def testClear_ShouldForgetChanges(self):
+        # Arrange
+        self.history("voltage", 0, 3392)
+
+        # Action
+        self.history.clear()
+
+        # Assert
+        self.assertEqual(self.history.getEntries(), [])
+        self.assertEqual(len(self.history), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
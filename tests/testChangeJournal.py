@@ -0,0 +1,226 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from observablePy import Observable, observable_property
+from observablePy.ChangeJournal import JournalReader, JournalWriter
+
+"""
+Battery is the class used for testing the journal
+"""
+
+
+class Battery(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__voltage = 0
+        self.__level = 0.0
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+    @observable_property
+    def level(self):
+        return self.__level
+
+    @level.setter
+    def level(self, value):
+        self.__level = value
+
+
+class ChangeJournalTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def segments(self):
+        return sorted(os.listdir(self.path))
+
+    """
+    JournalWriter
+    """
+
+    def testWrite_WhenNotPicklable_ShouldStillCallObservers(self):
+        # Arrange
+        received = []
+        battery = Battery()
+        battery.observeElement(
+            "voltage", lambda previous, value: received.append(value))
+
+        # Action
+        with JournalWriter(self.path) as writer:
+            battery.addDiffusionTap(writer)
+            with self.assertLogs("observablePy.Diffusible", "ERROR"):
+                battery.voltage = lambda: 3392
+            battery.level = 0.67
+            battery.removeDiffusionTap(writer)
+
+        # Assert
+        self.assertEqual(len(received), 1)
+        self.assertEqual([record.element
+                          for record in JournalReader(self.path)],
+                         ["level"])
+
+    def testWrite_UsingTap_ShouldReadChanges(self):
+        # Arrange
+        battery = Battery()
+
+        # Action
+        with JournalWriter(self.path) as writer:
+            battery.addDiffusionTap(writer)
+            battery.voltage = 3392
+            battery.level = 0.67
+            battery.voltage = {"cell1": 3392, "cell2": 3400}
+            battery.removeDiffusionTap(writer)
+
+        # Assert
+        records = list(JournalReader(self.path))
+        self.assertEqual([record[0:1] + record[2:] for record in records], [
+            ("voltage", 0, 3392),
+            ("level", 0.0, 0.67),
+            ("voltage", 3392, {"cell1": 3392, "cell2": 3400})])
+        self.assertGreater(records[0].timestamp, 0)
+
+    def testWrite_WhenSegmentFull_ShouldStartNewSegment(self):
+        # Action
+        with JournalWriter(self.path, segmentSize=1000,
+                           bufferSize=100) as writer:
+            for value in range(200):
+                writer("voltage", value - 1, value)
+
+        # Assert
+        self.assertGreater(len(self.segments()), 1)
+        self.assertEqual([record.actual
+                          for record in JournalReader(self.path)],
+                         list(range(200)))
+
+    def testWrite_WhenReopened_ShouldAppendSegment(self):
+        # Arrange
+        with JournalWriter(self.path) as writer:
+            writer("voltage", 0, 3300)
+
+        # Action
+        with JournalWriter(self.path) as writer:
+            writer("voltage", 3300, 3392)
+
+        # Assert
+        self.assertEqual(self.segments(),
+                         ["journal-000001.log", "journal-000002.log"])
+        self.assertEqual([record.actual
+                          for record in JournalReader(self.path)],
+                         [3300, 3392])
+
+    def testWrite_WhenClosed_ShouldRaiseError(self):
+        # Arrange
+        writer = JournalWriter(self.path)
+        writer.close()
+
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            writer("voltage", 0, 3392)
+
+    """
+    JournalReader
+    """
+
+    def testRead_WhenRecordTruncated_ShouldStopBeforeIt(self):
+        # Arrange
+        with JournalWriter(self.path) as writer:
+            writer("voltage", 0, 3300)
+            writer("voltage", 3300, 3392)
+        segment = os.path.join(self.path, self.segments()[0])
+        os.truncate(segment, os.path.getsize(segment) - 3)
+
+        # Action
+        records = list(JournalReader(segment))
+
+        # Assert
+        self.assertEqual([record.actual for record in records], [3300])
+
+    def testRead_WhenNotJournal_ShouldRaiseError(self):
+        # Arrange
+        segment = os.path.join(self.path, "journal-000001.log")
+        with open(segment, "wb") as file:
+            file.write(b"not a journal")
+
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            list(JournalReader(self.path))
+
+    def testReplay_ShouldSetValuesAndDiffuseEachChange(self):
+        # Arrange
+        received = []
+        with JournalWriter(self.path) as writer:
+            writer("voltage", 0, 3300)
+            writer("level", 0.0, 0.67)
+            writer("voltage", 3300, 3392)
+        battery = Battery()
+        battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+
+        # Action
+        count = JournalReader(self.path).replay(battery)
+
+        # Assert
+        self.assertEqual(count, 3)
+        self.assertEqual((battery.voltage, battery.level), (3392, 0.67))
+        self.assertEqual(received, [(0, 3300), (3300, 3392)])
+
+    def testReplay_WhenCoalesce_ShouldDiffuseOnce(self):
+        # Arrange
+        received = []
+        with JournalWriter(self.path) as writer:
+            writer("voltage", 0, 3300)
+            writer("voltage", 3300, 3392)
+        battery = Battery()
+        battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+
+        # Action
+        count = JournalReader(self.path).replay(battery, coalesce=True)
+
+        # Assert
+        self.assertEqual(count, 2)
+        self.assertEqual(received, [(0, 3392)])
+
+    def testReplay_WhenAddedElement_ShouldDiffuseIt(self):
+        # Arrange
+        received = []
+        with JournalWriter(self.path) as writer:
+            writer("temperature", 20, 25)
+        battery = Battery()
+        battery.addObservableElement("temperature")
+        battery.observeElement(
+            "temperature", lambda previous, value: received.append(
+                (previous, value)))
+
+        # Action
+        JournalReader(self.path).replay(battery)
+
+        # Assert
+        self.assertEqual(received, [(20, 25)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,308 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import copy
+import gc
+import pickle
+import threading
+import unittest
+from observablePy import Observable, computed_observable_property
+from observablePy.ColumnStore import ColumnStore
+
+"""
+Battery is the class used for testing the columns
+"""
+
+
+class Battery(Observable, columns={"voltage": "l", "level": "d"}):
+    def __init__(self, voltage=0):
+        super().__init__()
+        self.voltage = voltage
+
+
+class Charger(Observable, columns={"voltage": "l", "current": "l"}):
+    @computed_observable_property(dependsOn=["voltage", "current"])
+    def power(self):
+        return self.voltage * self.current
+
+
+class ColumnStoreTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.store = ColumnStore({"voltage": "l", "level": "d"}, capacity=2)
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.store = None
+
+    """
+    ColumnStore
+    """
+
+    def testAllocate_WhenFull_ShouldGrowColumns(self):
+        # Arrange
+        rows = [self.store.allocate() for _ in range(5)]
+
+        # Action
+        self.store.getColumnObject("voltage").values[rows[4]] = 3392
+
+        # Assert
+        self.assertEqual(rows, [0, 1, 2, 3, 4])
+        self.assertEqual(self.store.getColumn("voltage").tolist(),
+                         [0, 0, 0, 0, 3392])
+        self.assertEqual(len(self.store), 5)
+
+    def testRelease_ShouldReuseClearedRow(self):
+        # Arrange
+        row = self.store.allocate()
+        self.store.allocate()
+        self.store.getColumnObject("level").values[row] = 0.67
+
+        # Action
+        self.store.release(row)
+
+        # Assert
+        self.assertEqual(self.store.getAlive().tolist(), [0, 1])
+        self.assertEqual(self.store.getColumn("level").tolist(), [0.0, 0.0])
+        self.assertEqual(self.store.allocate(), row)
+
+    def testAllocate_FromThreads_ShouldGiveEachRowOnce(self):
+        # Arrange
+        rows = [self.store.allocate() for _ in range(100)]
+        allocated = []
+
+        def churn(rows):
+            for row in rows:
+                self.store.release(row)
+                allocated.append(self.store.allocate())
+
+        threads = [threading.Thread(target=churn, args=(rows[i::4],))
+                   for i in range(4)]
+
+        # Action
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(sorted(allocated), rows)
+        self.assertEqual(len(self.store), 100)
+
+    """
+    Observable using columns
+    """
+
+    def testColumns_ShouldBeObservableProperties(self):
+        # Arrange
+        received = []
+        battery = Battery()
+        battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+
+        # Action
+        battery.voltage = 3392
+
+        # Assert
+        self.assertEqual(battery.voltage, 3392)
+        self.assertEqual(received, [(0, 3392)])
+        self.assertEqual(sorted(battery.getObservableElements()),
+                         ["level", "voltage"])
+
+    def testGetColumn_ShouldGiveValuesByRow(self):
+        # Arrange
+        batteries = [Battery(voltage) for voltage in (3300, 3392, 3400)]
+
+        # Action
+        column = Battery.getColumn("voltage")
+
+        # Assert
+        self.assertEqual([column[battery.getRow()] for battery in batteries],
+                         [3300, 3392, 3400])
+
+    def testGetColumn_WhenNotColumn_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            Battery.getColumn("weight")
+
+    def testDelete_ShouldReleaseRow(self):
+        # Arrange
+        battery = Battery(3392)
+        row = battery.getRow()
+
+        # Action
+        del battery
+        gc.collect()
+
+        # Assert
+        self.assertEqual(Battery.getColumn("voltage")[row], 0)
+        self.assertEqual(Battery(3400).getRow(), row)
+
+    def testCopy_ShouldUseOwnRow(self):
+        # Arrange
+        battery = Battery(42)
+        battery.level = 0.67
+
+        for copyFunction in (copy.copy, copy.deepcopy,
+                             lambda b: pickle.loads(pickle.dumps(b))):
+            # Action
+            duplicate = copyFunction(battery)
+            duplicateRow = duplicate.getRow()
+            duplicate.voltage = 7
+
+            # Assert
+            self.assertNotEqual(duplicateRow, battery.getRow())
+            self.assertEqual((duplicate.voltage, duplicate.level), (7, 0.67))
+            del duplicate
+            gc.collect()
+            self.assertEqual(battery.voltage, 42)
+            other = Battery(3)
+            self.assertEqual(battery.voltage, 42)
+            self.assertEqual(other.getRow(), duplicateRow)
+
+    def testSet_WhenBadType_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(TypeError):
+            Battery().voltage = "high"
+
+
+    """
+    setColumn
+    """
+
+    def testSetColumn_ShouldSetInstancesAndSkipUnchanged(self):
+        # Arrange
+        batteries = [Battery(voltage) for voltage in (3300, 3392, 3400)]
+        rows = [battery.getRow() for battery in batteries]
+
+        # Action
+        changed = Battery.setColumn("voltage", rows, [3300, 3500, 3600])
+
+        # Assert
+        self.assertEqual(changed, 2)
+        self.assertEqual([battery.voltage for battery in batteries],
+                         [3300, 3500, 3600])
+
+    def testSetColumn_ShouldCallInstanceObservers(self):
+        # Arrange
+        received = []
+        batteries = [Battery(3300) for _ in range(3)]
+        batteries[1].observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+        rows = [battery.getRow() for battery in batteries]
+
+        # Action
+        Battery.setColumn("voltage", rows[::-1], [3500, 3400, 3300])
+
+        # Assert
+        self.assertEqual(received, [(3300, 3400)])
+        self.assertEqual(batteries[0].voltage, 3300)
+        self.assertEqual(batteries[2].voltage, 3500)
+
+    def testSetColumn_WhenInstanceObserverRaises_ShouldUpdateAll(self):
+        # Arrange
+        received = []
+
+        def fail(previous, value):
+            raise RuntimeError("display unplugged")
+
+        def voltagesHandle(rows, previousValues, actualValues):
+            received.extend(actualValues)
+
+        batteries = [Battery(3300) for _ in range(3)]
+        for battery in batteries:
+            battery.observeElement("voltage", fail)
+        rows = [battery.getRow() for battery in batteries]
+        Battery.observeColumn("voltage", voltagesHandle)
+
+        # Action
+        with self.assertRaises(RuntimeError):
+            Battery.setColumn("voltage", rows, [3400, 3500, 3600])
+        Battery.unObserveColumn("voltage", voltagesHandle)
+
+        # Assert
+        self.assertEqual([battery.voltage for battery in batteries],
+                         [3400, 3500, 3600])
+        self.assertEqual(received, [3400, 3500, 3600])
+
+    def testSetColumn_ShouldCallColumnObserversOnce(self):
+        # Arrange
+        received = []
+
+        def voltagesHandle(rows, previousValues, actualValues):
+            received.append((rows.tolist(), previousValues.tolist(),
+                             actualValues.tolist()))
+
+        batteries = [Battery(3300) for _ in range(3)]
+        rows = [battery.getRow() for battery in batteries]
+        Battery.observeColumn("voltage", voltagesHandle)
+
+        # Action
+        Battery.setColumn("voltage", rows, [3300, 3400, 3500])
+        Battery.setColumn("voltage", rows, [3300, 3400, 3500])
+        Battery.unObserveColumn("voltage", voltagesHandle)
+        Battery.setColumn("voltage", rows, [3600, 3600, 3600])
+
+        # Assert
+        self.assertEqual(received, [
+            (rows[1:], [3300, 3300], [3400, 3500])])
+
+    def testSetColumn_ShouldRefreshComputedProperties(self):
+        # Arrange
+        received = []
+        chargers = [Charger() for _ in range(2)]
+        for charger in chargers:
+            charger.current = 2
+        chargers[0].observeElement(
+            "power", lambda previous, value: received.append(
+                (previous, value)))
+        chargers[1].power
+        rows = [charger.getRow() for charger in chargers]
+
+        # Action
+        Charger.setColumn("voltage", rows, [5, 12])
+
+        # Assert
+        self.assertEqual(received, [(0, 10)])
+        self.assertEqual(chargers[1].power, 24)
+
+    def testSetColumn_WhenRowWithoutInstance_ShouldWriteNothing(self):
+        # Arrange
+        battery = Battery(3300)
+        freed = Battery()
+        row = freed.getRow()
+        del freed
+        gc.collect()
+
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            Battery.setColumn("voltage", [battery.getRow(), row],
+                              [3400, 3400])
+        self.assertEqual(battery.voltage, 3300)
+
+    def testSetColumn_WhenBadValue_ShouldWriteNothing(self):
+        # Arrange
+        battery = Battery(3300)
+
+        # Action and Assert
+        with self.assertRaises(TypeError):
+            Battery.setColumn("voltage", [battery.getRow()], ["high"])
+        self.assertEqual(battery.voltage, 3300)
+
+    def testObserveColumn_WhenNotColumn_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            Battery.observeColumn("weight", print)
+
+
+if __name__ == '__main__':
+    unittest.main()
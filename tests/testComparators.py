@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from observablePy.Comparators import (
+    equality, identity, tolerance, getComparator)
+
+
+class ComparatorsTests(unittest.TestCase):
+
+    """
+    equality
+    """
+
+    def testEquality_WhenEqual_ShouldBeTrue(self):
+        # Action and Assert
+        self.assertTrue(equality([1, 2], [1, 2]))
+        self.assertFalse(equality(1, 2))
+
+    """
+    identity
+    """
+
+    def testIdentity_WhenEqualButNotSame_ShouldBeFalse(self):
+        # Arrange
+        value = [1, 2]
+
+        # Action and Assert
+        self.assertTrue(identity(value, value))
+        self.assertFalse(identity(value, [1, 2]))
+
+    """
+    tolerance
+    """
+
+    def testTolerance_WhenWithinDelta_ShouldBeTrue(self):
+        # Arrange
+        compare = tolerance(0.5)
+
+        # Action and Assert
+        self.assertTrue(compare(3.7, 3.9))
+        self.assertFalse(compare(3.7, 4.3))
+
+    def testTolerance_UsingNone_ShouldCompareIdentity(self):
+        # Arrange
+        compare = tolerance(0.5)
+
+        # Action and Assert
+        self.assertTrue(compare(None, None))
+        self.assertFalse(compare(3.7, None))
+
+    """
+    getComparator
+    """
+
+    def testGetComparator_UsingName_ShouldGiveComparator(self):
+        # Action and Assert
+        self.assertIs(getComparator("equality"), equality)
+        self.assertIs(getComparator("identity"), identity)
+        self.assertIsNone(getComparator(None))
+
+    def testGetComparator_UsingFunction_ShouldGiveFunction(self):
+        # Arrange
+        def compare(previousValue, value):
+            return True
+
+        # Action and Assert
+        self.assertIs(getComparator(compare), compare)
+
+    def testGetComparator_UsingUnknownName_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(TypeError):
+            getComparator("approximately")
+
+
+if __name__ == '__main__':
+    unittest.main()
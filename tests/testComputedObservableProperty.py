@@ -0,0 +1,278 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from observablePy import Observable, observable_property
+from observablePy import computed_observable_property
+from observablePy import ObservableList
+
+"""
+Meter is the class used for testing the computed observable properties
+"""
+
+
+class Meter(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__voltage = 0
+        self.__current = 0
+        self.computeCount = 0
+
+    @observable_property
+    def voltage(self):
+        return self.__voltage
+
+    @voltage.setter
+    def voltage(self, value):
+        self.__voltage = value
+
+    @observable_property
+    def current(self):
+        return self.__current
+
+    @current.setter
+    def current(self, value):
+        self.__current = value
+
+    @computed_observable_property(dependsOn=["voltage", "current"])
+    def power(self):
+        self.computeCount += 1
+        return self.voltage * self.current
+
+    @computed_observable_property(dependsOn=["power"])
+    def overloaded(self):
+        return self.power > 100
+
+
+class SmartMeter(Meter):
+    @computed_observable_property(dependsOn=["voltage", "overloaded"])
+    def alarm(self):
+        return self.overloaded and self.voltage > 200
+
+
+class Playlist(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__songs = ObservableList()
+
+    @observable_property
+    def songs(self):
+        return self.__songs
+
+    @songs.setter
+    def songs(self, value):
+        self.__songs = value
+
+    @computed_observable_property(dependsOn=["songs"])
+    def count(self):
+        return len(self.songs)
+
+    @computed_observable_property(dependsOn=["rating"])
+    def stars(self):
+        return "*" * self.__dict__.get("_rating", 0)
+
+
+class ComputedObservablePropertyTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.meter = Meter()
+        self.received = []
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.meter = None
+
+    def observe(self, elementName):
+        self.meter.observeElement(
+            elementName, lambda previous, value: self.received.append(
+                (elementName, previous, value)))
+
+    """
+    get
+    """
+
+    def testGet_ShouldComputeLazilyOnce(self):
+        # Arrange
+        self.meter.voltage = 10
+        self.meter.current = 2
+        computedBeforeRead = self.meter.computeCount
+
+        # Action
+        power = self.meter.power
+        self.meter.power
+
+        # Assert
+        self.assertEqual(computedBeforeRead, 0)
+        self.assertEqual(power, 20)
+        self.assertEqual(self.meter.computeCount, 1)
+
+    def testGet_WhenDependencySet_ShouldComputeAgain(self):
+        # Arrange
+        self.meter.voltage = 10
+        self.meter.current = 2
+        self.meter.power
+
+        # Action
+        self.meter.current = 3
+
+        # Assert
+        self.assertEqual(self.meter.power, 30)
+        self.assertEqual(self.meter.overloaded, False)
+
+    def testGetObservableElements_ShouldHaveComputedProperties(self):
+        # Action and Assert
+        self.assertTrue(
+            self.meter.areObservableElements(["power", "overloaded"]))
+
+    """
+    Diffusion
+    """
+
+    def testSet_WhenComputedObserved_ShouldEmitChanges(self):
+        # Arrange
+        self.observe("power")
+
+        # Action
+        self.meter.voltage = 10
+        self.meter.current = 2
+        self.meter.current = 5
+
+        # Assert
+        self.assertEqual(self.received,
+                         [("power", 0, 20), ("power", 20, 50)])
+
+    def testSet_WhenComputedUnchanged_ShouldNotEmit(self):
+        # Arrange
+        self.observe("power")
+
+        # Action
+        self.meter.voltage = 10
+
+        # Assert
+        self.assertEqual(self.received, [])
+
+    def testSet_WhenChainedComputedObserved_ShouldEmitChanges(self):
+        # Arrange
+        self.meter.voltage = 10
+        self.observe("overloaded")
+
+        # Action
+        self.meter.current = 5
+        self.meter.current = 20
+        self.meter.current = 30
+
+        # Assert
+        self.assertEqual(self.received, [("overloaded", False, True)])
+
+    def testSetState_ShouldEmitComputedOnce(self):
+        # Arrange
+        received = []
+        self.meter.observeState(
+            lambda previous, state: received.append(
+                (previous["power"], state["power"])))
+
+        # Action
+        self.meter.setState({"voltage": 10, "current": 2})
+
+        # Assert
+        self.assertEqual(received, [(0, 20)])
+
+    def testCollectionChange_ShouldComputeAgain(self):
+        # Arrange
+        playlist = Playlist()
+        playlist.songs = ObservableList()
+        countBefore = playlist.count
+
+        # Action
+        playlist.songs.append("a")
+
+        # Assert
+        self.assertEqual((countBefore, playlist.count), (0, 1))
+
+    def testDiffuse_ShouldComputeAgainAndEmit(self):
+        # Arrange
+        self.observe("power")
+        self.meter.power
+        self.meter._Meter__voltage = 10
+        self.meter._Meter__current = 2
+
+        # Action
+        self.meter.diffuse({"voltage": 0, "current": 0},
+                           {"voltage": 10, "current": 2})
+
+        # Assert
+        self.assertEqual(self.received, [("power", 0, 20)])
+
+    def testDiffuse_WhenAddedElementDependency_ShouldComputeAgain(self):
+        # Arrange
+        playlist = Playlist()
+        playlist.addObservableElement("rating")
+        starsBefore = playlist.stars
+
+        # Action
+        playlist._rating = 3
+        playlist.diffuseElement("rating", 0, 3)
+
+        # Assert
+        self.assertEqual((starsBefore, playlist.stars), ("", "***"))
+
+    def testSet_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(AttributeError):
+            self.meter.power = 20
+
+    """
+    Declaration
+    """
+
+    def testDeclare_WhenDependencyNotObservable_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            class BadMeter(Meter):
+                weight = 0
+
+                @computed_observable_property(dependsOn=["weight"])
+                def energy(self):
+                    return 0
+
+    def testDeclare_UsingSubclass_ShouldNotChangeParentClass(self):
+        # Arrange
+        self.meter.observeState(
+            lambda previous, value: self.received.append(value))
+        smartMeter = SmartMeter()
+        smartMeter.current = 2
+        smartMeter.observeElement(
+            "alarm", lambda previous, value: self.received.append(
+                ("alarm", previous, value)))
+
+        # Action
+        self.meter.voltage = 5
+        smartMeter.voltage = 300
+
+        # Assert
+        self.assertNotIn(SmartMeter.alarm, Meter.voltage._dependents)
+        self.assertNotIn(SmartMeter.alarm, Meter.overloaded._dependents)
+        self.assertEqual(self.received[-1], ("alarm", False, True))
+
+    def testDeclare_UsingSetter_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(TypeError):
+            class BadMeter(Meter):
+                @computed_observable_property(dependsOn=["voltage"])
+                def energy(self):
+                    return 0
+
+                @energy.setter
+                def energy(self, value):
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
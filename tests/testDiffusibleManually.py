@@ -3,7 +3,7 @@
 
 import copy
 import unittest
-from observablePy import Observable
+from observablePy import Observable, tolerance
 
 """
 Battery is the class used for testing the Observable
@@ -141,6 +141,91 @@ class testDiffusibleManuallyTests(unittest.TestCase):
         # Assert
         self.assertTrue(called)
 
+    def testDiffuseElement_WhenFieldObserved_ShouldEmitChanges(self):
+        # Arrange
+        # Battery class, plus
+        received = []
+
+        def pluggedhandle(previousPlugged, plugged):
+            received.append((previousPlugged, plugged))
+
+        self.battery.observeElement("plugged", pluggedhandle)
+
+        # Action
+        self.battery.diffuseElement("plugged", False, True)
+
+        # Assert
+        self.assertEqual(received, [(False, True)])
+
+    def testDiffuse_WhenComparedElementUnchanged_ShouldNotEmit(self):
+        # Arrange
+        received = []
+        self.battery.addObservableElement("model", compare="equality")
+        self.battery.observeElement("model",
+                                    lambda previous, actual: received.append(
+                                        actual))
+
+        # Action
+        self.battery.diffuse("model", "AA", "AA")
+        self.battery.diffuse({"model": "AA"}, {"model": "AA"})
+        self.battery.diffuse("model", "AA", "AAA")
+
+        # Assert
+        self.assertEqual(received, ["AAA"])
+        self.assertEqual(self.battery.getSuppressedDiffusions(), {"model": 2})
+
+    def testDiffuse_WhenComparatorFails_ShouldEmitOnBothPaths(self):
+        # Arrange
+        received = []
+        self.battery.addObservableElement("current", compare=tolerance(5))
+        self.battery.observeElement("current",
+                                    lambda previous, actual: received.append(
+                                        actual))
+
+        # Action
+        self.battery.diffuse("current", 100, "high")
+        self.battery.diffuse({"current": "high"}, {"current": 100})
+
+        # Assert
+        self.assertEqual(received, ["high", 100])
+        self.assertEqual(self.battery.getSuppressedDiffusions(), {})
+
+    def testDiffuse_UsingDicts_ShouldOnlyEmitToChangedElements(self):
+        # Arrange
+        received = []
+        self.battery.observeElement(
+            "voltage", lambda previous, actual: received.append("voltage"))
+        self.battery.observeElement(
+            "plugged", lambda previous, actual: received.append("plugged"))
+        self.battery.observeElements(
+            ["voltage", "level"],
+            lambda previous, actual: received.append("voltage, level"))
+        self.battery.observeState(
+            lambda previous, actual: received.append("*"))
+
+        # Action
+        self.battery.update(3392, False)
+
+        # Assert
+        self.assertEqual(received, ["voltage", "voltage, level", "*"])
+
+    def testDiffuse_UsingUnchangedDicts_ShouldNotEmit(self):
+        # Arrange
+        received = []
+        self.battery.observeState(
+            lambda previous, actual: received.append(actual))
+
+        # Action
+        self.battery.update(0, False)
+
+        # Assert
+        self.assertEqual(received, [])
+
+    def testAddObservableElement_UsingBadComparator_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(TypeError):
+            self.battery.addObservableElement("model", compare="same")
+
     def testDiffuse_BadDiffusingArguments_ShoulRaiseError(self):
         # Arrange
 
@@ -1,9 +1,13 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import asyncio
+import threading
+import time
 import unittest
 from observablePy import Observable
 from observablePy import observable_property
+from observablePy import DiffusionExecutor
 
 """
 Battery is the class used for testing the Observable
@@ -47,6 +51,15 @@ class Battery(Observable):
         self.__plugged = value
 
 
+def runCoroutine(coroutine):
+    # asyncio.run needs Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
 class DiffusibleUsingPropertySetterTests(unittest.TestCase):
 
     """
@@ -55,6 +68,7 @@ class DiffusibleUsingPropertySetterTests(unittest.TestCase):
 
     def setUp(self):
         self.battery = Battery()
+        Battery.enableDiffusionMetrics()
 
     """
     tearDown each test
@@ -62,6 +76,7 @@ class DiffusibleUsingPropertySetterTests(unittest.TestCase):
 
     def tearDown(self):
         self.battery = None
+        Battery.disableDiffusionMetrics()
 
     """
     Diffuse
@@ -194,5 +209,589 @@ class DiffusibleUsingPropertySetterTests(unittest.TestCase):
         # Assert
         self.assertTrue(called)
 
+    def testDiffuse_WhenStateObserved_ShouldShareUnchangedValues(self):
+        # Arrange
+        cells = [[3.7] * 4, [3.6] * 4]
+        self.battery.level = cells
+        received = []
+
+        def statehandle(previousState, actualState):
+            received.append((previousState, actualState))
+
+        self.battery.observeState(statehandle)
+
+        # Action
+        self.battery.voltage = 3392
+
+        # Assert
+        previousState, actualState = received[0]
+        self.assertIs(previousState["level"], cells)
+        self.assertIs(actualState["level"], cells)
+        self.assertEqual(previousState["voltage"], 0)
+
+    def testDiffuse_WhenIsolated_ShouldReceiveCopies(self):
+        # Arrange
+        cells = [[3.7] * 4, [3.6] * 4]
+        self.battery.level = cells
+        received = []
+
+        def statehandle(previousState, actualState):
+            received.append((previousState, actualState))
+
+        self.battery.observeState(statehandle, isolate=True)
+
+        # Action
+        self.battery.voltage = 3392
+
+        # Assert
+        previousState, actualState = received[0]
+        self.assertIsNot(previousState["level"], cells)
+        self.assertEqual(previousState["level"], cells)
+        self.assertIs(previousState["level"], actualState["level"])
+
+    """
+    Async observers
+    """
+
+    def testAset_WhenAsyncObservers_ShouldAwaitThemConcurrently(self):
+        # Arrange
+        received = []
+
+        async def voltagehandle(previousVoltage, voltage):
+            received.append(("started", voltage))
+            await asyncio.sleep(0)
+            received.append(("done", voltage))
+
+        def statehandle(previousState, actualState):
+            received.append(("sync", actualState["voltage"]))
+
+        self.battery.observeElement("voltage", voltagehandle)
+        self.battery.observeElement("voltage", voltagehandle)
+        self.battery.observeState(statehandle)
+
+        # Action
+        runCoroutine(self.battery.aset("voltage", 3392))
+
+        # Assert
+        self.assertEqual(received, [
+            ("sync", 3392),
+            ("started", 3392), ("started", 3392),
+            ("done", 3392), ("done", 3392)])
+        self.assertEqual(self.battery.voltage, 3392)
+
+    def testAset_WhenNotObservableProperty_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            runCoroutine(self.battery.aset("capacity", 12))
+
+    def testAdiffuse_ShouldAwaitAsyncObservers(self):
+        # Arrange
+        received = []
+
+        async def voltagehandle(previousVoltage, voltage):
+            received.append((previousVoltage, voltage))
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        # Action
+        runCoroutine(self.battery.adiffuse("voltage", 0, 3392))
+
+        # Assert
+        self.assertEqual(received, [(0, 3392)])
+
+    def testDiffuse_WhenAsyncObserverAndNoLoop_ShouldRunIt(self):
+        # Arrange
+        received = []
+
+        async def voltagehandle(previousVoltage, voltage):
+            received.append((previousVoltage, voltage))
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        # Action
+        self.battery.voltage = 3392
+
+        # Assert
+        self.assertEqual(received, [(0, 3392)])
+
+    def testDiffuse_WhenAsyncObserverInLoop_ShouldSchedule(self):
+        # Arrange
+        received = []
+
+        async def voltagehandle(previousVoltage, voltage):
+            received.append((previousVoltage, voltage))
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        async def setVoltage():
+            self.battery.voltage = 3392
+            self.assertEqual(received, [])
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        # Action
+        runCoroutine(setVoltage())
+
+        # Assert
+        self.assertEqual(received, [(0, 3392)])
+
+    def testDiffuse_WhenAsyncObserverInLoopFails_ShouldLogIt(self):
+        # Arrange
+        async def voltagehandle(previousVoltage, voltage):
+            raise RuntimeError("display unplugged")
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        async def setVoltage():
+            self.battery.voltage = 3392
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        # Action
+        with self.assertLogs("observablePy.Diffusible", "ERROR") as logs:
+            runCoroutine(setVoltage())
+
+        # Assert
+        self.assertIn("display unplugged", logs.output[0])
+
+    """
+    Executor
+    """
+
+    def testDiffuse_UsingExecutor_ShouldNotWaitObservers(self):
+        # Arrange
+        release = threading.Event()
+        received = []
+
+        def voltagehandle(previousVoltage, voltage):
+            release.wait(5)
+            received.append((previousVoltage, voltage))
+
+        executor = DiffusionExecutor(maxWorkers=2)
+        self.battery.setDiffusionExecutor(executor)
+        self.battery.observeElement("voltage", voltagehandle)
+
+        # Action
+        self.battery.voltage = 3392
+        self.battery.voltage = 3400
+
+        # Assert
+        self.assertEqual(received, [])
+        release.set()
+        self.assertTrue(self.battery.flushDiffusion(5))
+        self.assertEqual(received, [(0, 3392), (3392, 3400)])
+        executor.shutdown()
+
+    def testDiffuse_UsingObserverExecutor_ShouldOnlyDeferIt(self):
+        # Arrange
+        received = []
+        deferred = []
+        executor = DiffusionExecutor(maxWorkers=1)
+
+        self.battery.observeElement(
+            "voltage", lambda previous, actual: received.append(actual))
+        self.battery.observeElement(
+            "voltage", lambda previous, actual: deferred.append(actual),
+            executor=executor)
+
+        # Action
+        for voltage in range(100):
+            self.battery.voltage = voltage
+        self.battery.flushDiffusion()
+
+        # Assert
+        self.assertEqual(received, list(range(100)))
+        self.assertEqual(deferred, list(range(100)))
+        executor.shutdown()
+
+    """
+    Batch
+    """
+
+    def testBatch_WhenElementChangesTwice_ShouldEmitOnce(self):
+        # Arrange
+        received = []
+
+        def voltagehandle(previousVoltage, voltage):
+            received.append((previousVoltage, voltage))
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        # Action
+        with self.battery.batch():
+            self.battery.voltage = 3392
+            self.battery.voltage = 3400
+            self.assertEqual(received, [])
+
+        # Assert
+        self.assertEqual(received, [(0, 3400)])
+
+    def testBatch_WhenStateObserved_ShouldEmitMergedStateOnce(self):
+        # Arrange
+        received = []
+
+        def statehandle(previousState, actualState):
+            received.append((previousState, actualState))
+
+        self.battery.observeState(statehandle)
+
+        # Action
+        with self.battery.batch():
+            self.battery.voltage = 3392
+            self.battery.level = 0.5
+
+        # Assert
+        self.assertEqual(received, [(
+            {"level": 0.0, "plugged": False, "voltage": 0},
+            {"level": 0.5, "plugged": False, "voltage": 3392})])
+
+    def testBatch_WhenElementsObserved_ShouldEmitOnce(self):
+        # Arrange
+        received = []
+
+        def handle(previousValues, values):
+            received.append((previousValues, values))
+
+        self.battery.observeElements(["voltage", "plugged"], handle)
+
+        # Action
+        self.battery.beginBatch()
+        self.battery.voltage = 3392
+        self.battery.level = 0.5
+        self.battery.voltage = 3400
+        self.battery.commit()
+
+        # Assert
+        self.assertEqual(received, [(
+            {"voltage": 0, "plugged": False},
+            {"voltage": 3400, "plugged": False})])
+
+    def testBatch_WhenNotObservedElementChange_ShouldNotEmit(self):
+        # Arrange
+        received = []
+
+        def voltagehandle(previousVoltage, voltage):
+            received.append((previousVoltage, voltage))
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        # Action
+        with self.battery.batch():
+            self.battery.level = 0.5
+
+        # Assert
+        self.assertEqual(received, [])
+
+    def testBatch_WhenNested_ShouldEmitOnOutermostCommit(self):
+        # Arrange
+        received = []
+
+        def voltagehandle(previousVoltage, voltage):
+            received.append((previousVoltage, voltage))
+
+        self.battery.observeElement("voltage", voltagehandle)
+
+        # Action
+        with self.battery.batch():
+            with self.battery.batch():
+                self.battery.voltage = 3392
+            self.assertEqual(received, [])
+            self.battery.voltage = 3400
+
+        # Assert
+        self.assertEqual(received, [(0, 3400)])
+
+    """
+    setState
+    """
+
+    def testSetState_ShouldEmitOnce(self):
+        # Arrange
+        received = []
+        self.battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                ("voltage", previous, value)))
+        self.battery.observeElement(
+            "plugged", lambda previous, value: received.append(
+                ("plugged", previous, value)))
+        self.battery.observeState(
+            lambda previous, state: received.append(("*", previous, state)))
+
+        # Action
+        self.battery.setState({"voltage": 3392, "level": 0.67,
+                               "plugged": False})
+
+        # Assert
+        self.assertEqual(self.battery.voltage, 3392)
+        self.assertEqual(self.battery.level, 0.67)
+        self.assertEqual(received, [
+            ("voltage", 0, 3392),
+            ("*",
+             {"voltage": 0, "level": 0.0, "plugged": False},
+             {"voltage": 3392, "level": 0.67, "plugged": False})])
+
+    def testSetState_WhenNotObserved_ShouldSetValues(self):
+        # Action
+        self.battery.setState({"voltage": 3392, "plugged": True})
+
+        # Assert
+        self.assertEqual(self.battery.voltage, 3392)
+        self.assertTrue(self.battery.plugged)
+
+    def testSetState_InBatch_ShouldEmitOnCommit(self):
+        # Arrange
+        received = []
+        self.battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+
+        # Action
+        with self.battery.batch():
+            self.battery.setState({"voltage": 3300})
+            self.battery.setState({"voltage": 3392})
+
+        # Assert
+        self.assertEqual(received, [(0, 3392)])
+
+    def testSetState_WhenNotObservableProperty_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            self.battery.setState({"voltage": 3392, "weight": 45})
+        self.assertEqual(self.battery.voltage, 0)
+
+    def testCommit_WithoutBatch_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(RuntimeError):
+            self.battery.commit()
+
+    """
+    DiffusionStats
+    """
+
+    def testGetDiffusionStats_WhenNotEnabled_ShouldBeEmpty(self):
+        # Arrange
+        self.battery.observeElement("voltage", lambda previous, value: None)
+
+        # Action
+        self.battery.voltage = 3392
+
+        # Assert
+        self.assertEqual(self.battery.getDiffusionStats(), [])
+
+    def testGetDiffusionStats_WhenEnabled_ShouldTimeObservers(self):
+        # Arrange
+        def voltagehandle(previousVoltage, voltage):
+            pass
+
+        def statehandle(previousState, state):
+            pass
+
+        self.battery.observeElement("voltage", voltagehandle)
+        self.battery.observeState(statehandle)
+        self.battery.enableDiffusionStats()
+
+        # Action
+        self.battery.voltage = 3392
+        self.battery.voltage = 3400
+        self.battery.level = 0.67
+
+        # Assert
+        stats = {(item["call"], item["element"]): item
+                 for item in self.battery.getDiffusionStats()}
+        self.assertEqual(set(stats), {(voltagehandle, "voltage"),
+                                      (statehandle, "voltage"),
+                                      (statehandle, "level")})
+        self.assertEqual(stats[(voltagehandle, "voltage")]["count"], 2)
+        self.assertEqual(stats[(statehandle, "level")]["observing"], "*")
+
+    def testGetDiffusionStats_WhenUnObserved_ShouldForgetObserver(self):
+        # Arrange
+        def voltagehandle(previousVoltage, voltage):
+            pass
+
+        self.battery.observeElement("voltage", voltagehandle)
+        self.battery.enableDiffusionStats()
+        self.battery.voltage = 3392
+
+        # Action
+        self.battery.unObserve("voltage", voltagehandle)
+
+        # Assert
+        self.assertEqual(self.battery.getDiffusionStats(), [])
+
+    def testEnableDiffusionStats_WhenOverBudget_ShouldCallBack(self):
+        # Arrange
+        slow = []
+
+        def voltagehandle(previousVoltage, voltage):
+            time.sleep(0.01)
+
+        self.battery.observeElement("voltage", voltagehandle)
+        self.battery.observeElement("level", lambda previous, value: None)
+        self.battery.enableDiffusionStats(
+            budget=0.005,
+            onSlowObserver=lambda call, element, duration: slow.append(
+                (call, element)))
+
+        # Action
+        self.battery.voltage = 3392
+        self.battery.level = 0.67
+
+        # Assert
+        self.assertEqual(slow, [(voltagehandle, "voltage")])
+
+    """
+    DiffusionMetrics
+    """
+
+    def testGetDiffusionMetrics_ShouldAggregateInstances(self):
+        # Arrange
+        otherBattery = Battery()
+        self.battery.observeElement("voltage", lambda previous, value: None)
+        self.battery.observeState(lambda previous, value: None)
+        otherBattery.observeElement("voltage", lambda previous, value: None)
+
+        # Action
+        self.battery.voltage = 3392
+        self.battery.voltage = 3400
+        otherBattery.voltage = 3392
+
+        # Assert
+        metrics = Battery.getDiffusionMetrics()
+        self.assertEqual(metrics["voltage"], {
+            "changes": 3, "notifications": 5, "suppressed": 0,
+            "failed": 0, "fanOut": {1: 1, 3: 2}})
+
+    def testGetDiffusionMetrics_ShouldCountSuppressedAndFailed(self):
+        # Arrange
+        def failing(previousVoltage, voltage):
+            raise ValueError()
+
+        self.battery.addObservableElement("current", compare="equality")
+        self.battery.current = 0
+        self.battery.observeElement("current", lambda previous, value: None)
+        self.battery.observeElement("voltage", failing)
+
+        # Action
+        self.battery.diffuse("current", 0, 0)
+        with self.assertRaises(ValueError):
+            self.battery.voltage = 3392
+
+        # Assert
+        metrics = Battery.getDiffusionMetrics()
+        self.assertEqual(metrics["current"]["suppressed"], 1)
+        self.assertEqual(metrics["voltage"]["failed"], 1)
+
+    def testResetDiffusionMetrics_ShouldClearCounters(self):
+        # Arrange
+        self.battery.observeElement("voltage", lambda previous, value: None)
+        self.battery.voltage = 3392
+
+        # Action
+        Battery.resetDiffusionMetrics()
+
+        # Assert
+        self.assertEqual(Battery.getDiffusionMetrics(), {})
+
+    def testGetDiffusionMetrics_WhenDisabled_ShouldBeEmpty(self):
+        # Arrange
+        Battery.disableDiffusionMetrics()
+        self.battery.observeElement("voltage", lambda previous, value: None)
+
+        # Action
+        self.battery.voltage = 3392
+
+        # Assert
+        self.assertEqual(Battery.getDiffusionMetrics(), {})
+
+    """
+    History
+    """
+
+    def testEnableHistory_ShouldRecordUnobservedChanges(self):
+        # Arrange
+        self.battery.enableHistory(capacity=10)
+
+        # Action
+        self.battery.voltage = 3392
+        self.battery.setState({"voltage": 3400, "level": 0.67})
+
+        # Assert
+        self.assertEqual(
+            [entry[:3] for entry in self.battery.getHistory()],
+            [("voltage", 0, 3392), ("voltage", 3392, 3400),
+             ("level", 0.0, 0.67)])
+
+    def testDisableHistory_ShouldStopRecording(self):
+        # Arrange
+        self.battery.enableHistory(capacity=10)
+        self.battery.voltage = 3392
+
+        # Action
+        self.battery.disableHistory()
+        self.battery.voltage = 3400
+
+        # Assert
+        self.assertEqual(self.battery.getHistory(), [])
+        self.assertFalse(self.battery.isObserved("voltage"))
+
+    def testReplay_ShouldCatchUpObserver(self):
+        # Arrange
+        received = []
+        self.battery.enableHistory(capacity=10)
+        self.battery.voltage = 3300
+        self.battery.level = 0.67
+        self.battery.voltage = 3392
+
+        # Action
+        count = self.battery.replay(
+            lambda previous, value: received.append((previous, value)),
+            what="voltage")
+
+        # Assert
+        self.assertEqual(count, 2)
+        self.assertEqual(received, [(0, 3300), (3300, 3392)])
+
+    def testReplay_UsingNames_ShouldGiveValuesByName(self):
+        # Arrange
+        received = []
+        self.battery.enableHistory(capacity=10)
+        self.battery.voltage = 3300
+        self.battery.level = 0.67
+        self.battery.voltage = 3392
+
+        # Action
+        count = self.battery.replay(
+            lambda previous, value: received.append((previous, value)),
+            what=["voltage", "level"])
+
+        # Assert
+        self.assertEqual(count, 3)
+        self.assertEqual(received, [
+            ({"voltage": 0, "level": 0.0}, {"voltage": 3300, "level": 0.0}),
+            ({"voltage": 3300, "level": 0.0},
+             {"voltage": 3300, "level": 0.67}),
+            ({"voltage": 3300, "level": 0.67},
+             {"voltage": 3392, "level": 0.67})])
+
+    def testReplay_WhenAllElements_ShouldGiveStates(self):
+        # Arrange
+        received = []
+        self.battery.enableHistory(capacity=10)
+        self.battery.level = 0.67
+
+        # Action
+        self.battery.replay(
+            lambda previous, value: received.append((previous, value)))
+
+        # Assert
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][0],
+                         dict(received[0][1], level=0.0))
+        self.assertEqual(received[0][1], {
+            element: getattr(self.battery, element)
+            for element in self.battery.getObservableElements()})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from observablePy.DiffusionExecutor import (
+    DiffusionExecutor, asDiffusionExecutor)
+
+
+class DiffusionExecutorTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.executor = DiffusionExecutor(maxWorkers=4)
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.executor.shutdown(wait=False)
+        self.executor = None
+
+    """
+    submit
+    """
+
+    def testSubmit_UsingSameKey_ShouldCallInOrder(self):
+        # Arrange
+        received = []
+
+        # Action
+        for index in range(500):
+            self.executor.submit("voltage", received.append, index)
+        self.executor.flush()
+
+        # Assert
+        self.assertEqual(received, list(range(500)))
+
+    def testSubmit_UsingOtherKeys_ShouldCallConcurrently(self):
+        # Arrange
+        release = threading.Event()
+        called = threading.Event()
+
+        # Action
+        self.executor.submit("voltage", release.wait, 5)
+        self.executor.submit("level", called.set)
+
+        # Assert
+        self.assertTrue(called.wait(5))
+        self.assertFalse(self.executor.isIdle())
+        release.set()
+        self.assertTrue(self.executor.flush(5))
+        self.assertTrue(self.executor.isIdle())
+
+    def testSubmit_WhileDraining_ShouldCallEachOnce(self):
+        # Arrange
+        called = []
+
+        def submitMany(thread):
+            for index in range(200):
+                self.executor.submit("voltage", called.append,
+                                     (thread, index))
+
+        threads = [threading.Thread(target=submitMany, args=(thread,))
+                   for thread in range(4)]
+
+        # Action
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertTrue(self.executor.flush(5))
+        self.assertEqual(len(called), 800)
+        for thread in range(4):
+            self.assertEqual([index for t, index in called if t == thread],
+                             list(range(200)))
+
+    def testSubmit_WhenExecutorShutDown_ShouldRaiseAndStayIdle(self):
+        # Arrange
+        pool = ThreadPoolExecutor(1)
+        executor = DiffusionExecutor(pool)
+        pool.shutdown()
+
+        # Action
+        with self.assertRaises(RuntimeError):
+            executor.submit("voltage", print)
+
+        # Assert
+        self.assertTrue(executor.isIdle())
+        self.assertTrue(executor.flush(1))
+
+    def testSubmit_WhenCallRaisesBaseException_ShouldDrainLaterCalls(self):
+        # Arrange
+        class Stop(BaseException):
+            pass
+
+        def stop():
+            raise Stop()
+
+        called = []
+        self.executor.submit("voltage", stop)
+        self.assertTrue(self.executor.flush(1))
+
+        # Action
+        self.executor.submit("voltage", called.append, 3392)
+
+        # Assert
+        self.assertTrue(self.executor.flush(1))
+        self.assertEqual(called, [3392])
+
+    """
+    flush
+    """
+
+    def testFlush_WhenTimeout_ShouldBeFalse(self):
+        # Arrange
+        release = threading.Event()
+        self.executor.submit("voltage", release.wait, 5)
+
+        # Action
+        actualResult = self.executor.flush(0.01)
+
+        # Assert
+        self.assertFalse(actualResult)
+        release.set()
+
+    def testFlush_WhenCallFailed_ShouldRaiseError(self):
+        # Arrange
+        def fail():
+            raise RuntimeError("disk full")
+
+        self.executor.submit("voltage", fail)
+
+        # Action and Assert
+        with self.assertRaises(RuntimeError):
+            self.executor.flush()
+        self.assertTrue(self.executor.flush())
+
+    """
+    asDiffusionExecutor
+    """
+
+    def testAsDiffusionExecutor_ShouldWrapExecutor(self):
+        # Arrange
+        pool = ThreadPoolExecutor(1)
+
+        # Action
+        actualResult = asDiffusionExecutor(pool)
+
+        # Assert
+        self.assertIsInstance(actualResult, DiffusionExecutor)
+        self.assertIs(asDiffusionExecutor(self.executor), self.executor)
+        self.assertIsNone(asDiffusionExecutor(None))
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
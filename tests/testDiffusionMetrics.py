@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from observablePy.DiffusionMetrics import DiffusionMetrics
+
+
+class DiffusionMetricsTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.metrics = DiffusionMetrics()
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.metrics = None
+
+    """
+    recordDiffusion
+    """
+
+    def testRecordDiffusion_ShouldCountByElement(self):
+        # Action
+        self.metrics.recordDiffusion("voltage", 2, 2)
+        self.metrics.recordDiffusion(("voltage", "level"), 1, 1)
+
+        # Assert
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["voltage"]["changes"], 2)
+        self.assertEqual(snapshot["voltage"]["notifications"], 3)
+        self.assertEqual(snapshot["level"]["changes"], 1)
+
+    def testRecordDiffusion_ShouldBuildFanOutHistogram(self):
+        # Action
+        for fanOut in (0, 1, 2, 3, 4, 1000):
+            self.metrics.recordDiffusion("voltage", fanOut, fanOut)
+
+        # Assert
+        self.assertEqual(self.metrics.snapshot()["voltage"]["fanOut"],
+                         {0: 1, 1: 1, 3: 2, 7: 1, 1023: 1})
+
+    """
+    recordSuppressed, recordFailure and recordNotification
+    """
+
+    def testRecord_ShouldCountEvents(self):
+        # Action
+        self.metrics.recordSuppressed("voltage")
+        self.metrics.recordFailure(("voltage", "level"))
+        self.metrics.recordNotification(["level"])
+
+        # Assert
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["voltage"], {
+            "changes": 0, "notifications": 0, "suppressed": 1,
+            "failed": 1, "fanOut": {}})
+        self.assertEqual(snapshot["level"]["failed"], 1)
+        self.assertEqual(snapshot["level"]["notifications"], 1)
+
+    """
+    reset
+    """
+
+    def testReset_ShouldClearCounters(self):
+        # Arrange
+        self.metrics.recordDiffusion("voltage", 1, 1)
+
+        # Action
+        self.metrics.reset()
+
+        # Assert
+        self.assertEqual(self.metrics.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
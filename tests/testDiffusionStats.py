@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import gc
+import unittest
+from observablePy.DiffusionStats import DiffusionStats
+from observablePy.ObserverRecord import ObserverRecord, _WeakCall
+from observablePy.ObserverTypeEnum import observerTypeEnum
+
+
+def voltagehandle(previousVoltage, voltage):
+    return voltage
+
+
+class DiffusionStatsTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.observer = ObserverRecord(
+            "voltage", observerTypeEnum.element, voltagehandle)
+        self.stats = DiffusionStats(samples=100)
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.stats = None
+
+    """
+    measure
+    """
+
+    def testMeasure_ShouldGiveCallResult(self):
+        # Action
+        result = self.stats.measure(
+            self.observer, "voltage", voltagehandle, 0, 3392)
+
+        # Assert
+        self.assertEqual(result, 3392)
+
+    def testMeasure_WhenCallRaises_ShouldRecordAndRaise(self):
+        # Arrange
+        def failing():
+            raise ValueError()
+
+        # Action
+        with self.assertRaises(ValueError):
+            self.stats.measure(self.observer, "voltage", failing)
+
+        # Assert
+        self.assertEqual(self.stats.getStats()[0]["count"], 1)
+
+    """
+    getStats
+    """
+
+    def testGetStats_ShouldAggregateDurations(self):
+        # Arrange
+        for duration in range(1, 201):
+            self.stats._record(self.observer, "voltage", duration / 1000)
+
+        # Action
+        stats = self.stats.getStats()
+
+        # Assert
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]["observing"], "voltage")
+        self.assertIs(stats[0]["call"], voltagehandle)
+        self.assertEqual(stats[0]["element"], "voltage")
+        self.assertEqual(stats[0]["count"], 200)
+        self.assertAlmostEqual(stats[0]["total"], 20.1)
+        self.assertEqual(stats[0]["max"], 0.2)
+        # the percentile is computed on the last 100 durations
+        self.assertEqual(stats[0]["p99"], 0.2)
+
+    def testGetStats_WhenSeveralElements_ShouldRecordEachName(self):
+        # Arrange
+        self.stats._record(self.observer, ("voltage", "level"), 0.1)
+        self.stats._record(self.observer, ("voltage",), 0.2)
+
+        # Action
+        stats = {item["element"]: item for item in self.stats.getStats()}
+
+        # Assert
+        self.assertEqual(set(stats), {"voltage", "level"})
+        self.assertEqual(stats["voltage"]["count"], 2)
+        self.assertEqual(stats["level"]["count"], 1)
+
+    def testGetStats_WhenWeakObserverCollected_ShouldForgetIt(self):
+        # Arrange
+        def statehandle(previousState, state):
+            pass
+
+        weakObserver = ObserverRecord(
+            "*", observerTypeEnum.state, _WeakCall(statehandle, lambda: None))
+        self.stats._record(weakObserver, "voltage", 0.1)
+        self.stats._record(self.observer, "voltage", 0.1)
+
+        # Action
+        del statehandle
+        gc.collect()
+        stats = self.stats.getStats()
+
+        # Assert
+        self.assertEqual([item["call"] for item in stats], [voltagehandle])
+
+    """
+    forget
+    """
+
+    def testForget_ShouldDropObserverDurations(self):
+        # Arrange
+        otherObserver = ObserverRecord(
+            "level", observerTypeEnum.element, voltagehandle)
+        self.stats._record(self.observer, "voltage", 0.1)
+        self.stats._record(otherObserver, "level", 0.1)
+
+        # Action
+        self.stats.forget(self.observer)
+
+        # Assert
+        self.assertEqual([item["element"] for item in self.stats.getStats()],
+                         ["level"])
+
+    """
+    reset
+    """
+
+    def testReset_ShouldForgetDurations(self):
+        # Arrange
+        self.stats.measure(self.observer, "voltage", voltagehandle, 0, 1)
+
+        # Action
+        self.stats.reset()
+
+        # Assert
+        self.assertEqual(self.stats.getStats(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import gc
+import re
 import unittest
-from observablePy import Observable
-from observablePy import observable_property
+from observablePy import Observable, glob
+from observablePy import computed_observable_property, observable_property
 from observablePy.ObserverTypeEnum import observerTypeEnum
+from observablePy.TimerWheel import TimerWheel, VirtualClock
 
 """
 Battery is the class used for testing the Observable
@@ -48,6 +51,30 @@ class Battery(Observable):
         self.__plugged = value
 
 
+class CompiledBattery(Battery, compileSetters=True):
+    def __init__(self):
+        super().__init__()
+        self._capacity = 0
+
+    @observable_property(compare="equality")
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value):
+        self._capacity = value
+
+    @computed_observable_property(dependsOn=["level"])
+    def percent(self):
+        return round(self.level * 100)
+
+
+class ScaledBattery(CompiledBattery):
+    @CompiledBattery.voltage.setter
+    def voltage(self, value):
+        Battery.voltage.fset(self, value * 10)
+
+
 class ObservableTests(unittest.TestCase):
 
     """
@@ -91,6 +118,33 @@ class ObservableTests(unittest.TestCase):
         # Assert
         self.assertEqual(actualValue, ['level', 'plugged', 'voltage'])
 
+    def testGetObservableElements_ShouldShareClassElements(self):
+        # Arrange
+        other = Battery()
+
+        # Action
+        actualValue = self.battery.getObservableElements()
+
+        # Assert
+        self.assertIs(actualValue, other.getObservableElements())
+
+    def testGetObservableElements_UsingSubclass_ShouldGiveOwnElements(self):
+        # Arrange
+        class SmartBattery(Battery):
+            @observable_property
+            def temperature(self):
+                return 20
+
+        # Action
+        actualValue = SmartBattery().getObservableElements()
+
+        # Assert
+        self.assertEqual(
+            actualValue, ['level', 'plugged', 'temperature', 'voltage'])
+        self.assertEqual(
+            self.battery.getObservableElements(),
+            ['level', 'plugged', 'voltage'])
+
     """
     hasObservableElements
     """
@@ -118,6 +172,16 @@ class ObservableTests(unittest.TestCase):
         actualValue = self.battery.isObservableElement("statup")
         self.assertTrue(actualValue)
 
+    def testAddObservableElement_ShouldNotChangeOtherInstances(self):
+        # Arrange
+        other = Battery()
+
+        # Action
+        self.battery.addObservableElement("statup")
+
+        # Assert
+        self.assertFalse(other.isObservableElement("statup"))
+
     """
     removeObservableElement
     """
@@ -131,6 +195,7 @@ class ObservableTests(unittest.TestCase):
         # Assert
         actualValue = self.battery.isObservableElement("level")
         self.assertFalse(actualValue)
+        self.assertTrue(Battery().isObservableElement("level"))
 
     """
     isObservableElement
@@ -253,6 +318,31 @@ class ObservableTests(unittest.TestCase):
         # Assert
         self.assertFalse(actualResult)
 
+    """
+    isObserved
+    """
+    def testIsObserved_WhenElementObserved_ShouldTrue(self):
+        # Arrange
+        def changeStatehandle():
+            print("voltageChange")
+
+        self.battery.observeElements(["voltage", "level"], changeStatehandle)
+
+        # Action and Assert
+        self.assertTrue(self.battery.isObserved("voltage"))
+        self.assertTrue(self.battery.isObserved("level"))
+        self.assertFalse(self.battery.isObserved("plugged"))
+
+    def testIsObserved_WhenStateObserved_ShouldTrue(self):
+        # Arrange
+        def changeStatehandle():
+            print("voltageChange")
+
+        self.battery.observeState(changeStatehandle)
+
+        # Action and Assert
+        self.assertTrue(self.battery.isObserved("plugged"))
+
     """
     observeState
     """
@@ -321,6 +411,17 @@ class ObservableTests(unittest.TestCase):
                              "call": voltagehandle
                          }])
 
+    def testObserveElement_ShouldNotChangeOtherInstances(self):
+        # Arrange
+        otherBattery = Battery()
+
+        # Action
+        self.battery.observeElement("voltage", print)
+
+        # Assert
+        self.assertEqual(otherBattery.getObservers(), [])
+        self.assertFalse(otherBattery.isObserved("voltage"))
+
     def testObserveElement_UsingDecorator_ShouldAppendObserver(self):
         # Arrange
         # Battery class
@@ -356,6 +457,97 @@ class ObservableTests(unittest.TestCase):
             # Error call should be a function not a string
             self.battery.observeElement("voltage", "voltagehandle")
 
+    def testObserveElement_WhenWeakAndDropped_ShouldRemoveObserver(self):
+        # Arrange
+        received = []
+
+        class Widget():
+            def voltagehandle(self, previousValue, value):
+                received.append(value)
+
+        widget = Widget()
+        self.battery.observeElement("voltage", widget.voltagehandle,
+                                    weak=True)
+        self.battery.voltage = 3392
+
+        # Action
+        del widget
+        gc.collect()
+        self.battery.voltage = 3400
+
+        # Assert
+        self.assertEqual(received, [3392])
+        self.assertEqual(self.battery.getObservers(), [])
+
+    def testObserveElement_UsingThrottle_ShouldMergeChanges(self):
+        # Arrange
+        received = []
+        clock = VirtualClock()
+        wheel = TimerWheel(tick=0.01, clock=clock)
+        self.battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)),
+            throttle=0.1, timerWheel=wheel)
+
+        # Action
+        self.battery.voltage = 3300
+        self.battery.voltage = 3350
+        self.battery.voltage = 3392
+        clock.advance(0.1)
+
+        # Assert
+        self.assertEqual(received, [(0, 3300), (3300, 3392)])
+
+    def testObserveElement_UsingDebounce_ShouldDeliverOnceQuiet(self):
+        # Arrange
+        received = []
+        clock = VirtualClock()
+        wheel = TimerWheel(tick=0.01, clock=clock)
+        self.battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)),
+            debounce=0.05, timerWheel=wheel)
+
+        # Action
+        self.battery.voltage = 3300
+        clock.advance(0.03)
+        self.battery.voltage = 3392
+        clock.advance(0.03)
+        receivedWhileChanging = list(received)
+        clock.advance(0.03)
+
+        # Assert
+        self.assertEqual(receivedWhileChanging, [])
+        self.assertEqual(received, [(0, 3392)])
+
+    def testUnObserve_WhenThrottled_ShouldCancelPendingChanges(self):
+        # Arrange
+        received = []
+        clock = VirtualClock()
+        wheel = TimerWheel(tick=0.01, clock=clock)
+
+        def voltageHandle(previous, value):
+            received.append((previous, value))
+
+        self.battery.observeElement("voltage", voltageHandle,
+                                    throttle=0.1, timerWheel=wheel)
+        self.battery.voltage = 3300
+        self.battery.voltage = 3392
+
+        # Action
+        self.battery.unObserve("voltage", voltageHandle)
+        clock.advance(0.1)
+
+        # Assert
+        self.assertEqual(received, [(0, 3300)])
+        self.assertEqual(len(wheel), 0)
+
+    def testObserveElement_UsingThrottleAndDebounce_ShouldRaiseError(self):
+        # Action and assert
+        with self.assertRaises(ValueError):
+            self.battery.observeElement("voltage", print,
+                                        throttle=0.1, debounce=0.1)
+
     """
     observeElements
     """
@@ -409,6 +601,82 @@ class ObservableTests(unittest.TestCase):
             # Error call should be a function not a string
             self.battery.observeElements("voltage", "voltagehandle")
 
+    def testObserveElements_UsingGlob_ShouldObserveMatchingElements(self):
+        # Arrange
+        received = []
+        for cell in range(2):
+            self.battery.addObservableElement(
+                "cell{0}_voltage".format(cell))
+
+        @self.battery.observeElements(glob("cell*_voltage"))
+        def cellsHandle(previousValues, values):
+            received.append((previousValues, values))
+
+        # Action
+        self.battery.diffuseElement("cell1_voltage", 3300, 3392)
+        self.battery.diffuse({"voltage": 0}, {"voltage": 1})
+
+        # Assert
+        self.assertEqual(received, [
+            ({"cell1_voltage": 3300}, {"cell1_voltage": 3392})])
+        self.assertTrue(self.battery.isObserved("cell0_voltage"))
+        self.assertFalse(self.battery.isObserved("voltage"))
+
+    def testObserveElements_UsingRegex_ShouldFollowAddedElements(self):
+        # Arrange
+        received = []
+        self.battery.observeElements(
+            re.compile(r"cell\d+_voltage"),
+            lambda previousValues, values: received.append(values))
+
+        # Action
+        self.battery.addObservableElement("cell0_voltage")
+        self.battery.addObservableElement("cell0_voltage_max")
+        self.battery.diffuseElement("cell0_voltage", 0, 3392)
+        self.battery.diffuseElement("cell0_voltage_max", 0, 4200)
+        self.battery.removeObservableElement("cell0_voltage")
+
+        # Assert
+        self.assertEqual(received, [{"cell0_voltage": 3392}])
+        self.assertFalse(self.battery.isObserved("cell0_voltage"))
+
+    def testObserveElements_UsingGlob_ShouldBeRemovedByUnObserve(self):
+        # Arrange
+        def cellsHandle(previousValues, values):
+            print("cellsChange")
+
+        self.battery.addObservableElement("cell0_voltage")
+        cells = glob("cell*")
+        self.battery.observeElements(cells, cellsHandle)
+
+        # Action
+        self.battery.unObserve(cells, cellsHandle)
+
+        # Assert
+        self.assertEqual(self.battery.getObservers(), [])
+        self.assertFalse(self.battery.isObserved("cell0_voltage"))
+
+    def testObserveElements_WhenNameHasGlobCharacters_ShouldObserveIt(self):
+        # Arrange
+        received = []
+        self.battery.addObservableElement("cell[0]")
+        self.battery.addObservableElement("cell0")
+
+        # Action
+        self.battery.observeElement(
+            "cell[0]", lambda previous, value: received.append(value))
+        self.battery.diffuseElement("cell0", 0, 3300)
+        self.battery.diffuseElement("cell[0]", 0, 3392)
+
+        # Assert
+        self.assertEqual(received, [3392])
+
+    def testObserveElements_WhenUnknownNameHasGlobCharacters_ShouldRaise(
+            self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            self.battery.observeElement("nosuch?", print)
+
     """
     unObserve
     """
@@ -429,5 +697,96 @@ class ObservableTests(unittest.TestCase):
         self.assertEqual(self.battery.getObservers(), [
                          {"observing": "voltage", "call": voltagehandle}])
 
+    """
+    compileSetters
+    """
+
+    def testCompileSetters_ShouldGiveSpecializedProperties(self):
+        # Arrange
+        # CompiledBattery class
+
+        # Action
+        descriptors = [CompiledBattery.__dict__.get(name)
+                       for name in ("voltage", "capacity", "percent")]
+
+        # Assert
+        self.assertIsInstance(descriptors[0], observable_property)
+        self.assertIsNot(type(descriptors[0]), observable_property)
+        self.assertEqual(descriptors[0].name, "voltage")
+        self.assertEqual(descriptors[1].compare.__name__, "equality")
+        self.assertIsInstance(descriptors[2], computed_observable_property)
+        self.assertIs(type(Battery.__dict__["voltage"]), observable_property)
+
+    def testCompileSetters_ShouldDiffuseChanges(self):
+        # Arrange
+        received = []
+        changes = []
+        battery = CompiledBattery()
+        battery.voltage = 3300
+        battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+        battery.observeState(
+            lambda previous, value: received.append(value["voltage"]))
+        battery.addDiffusionTap(
+            lambda element, previous, value: changes.append(element))
+
+        # Action
+        battery.voltage = 3392
+        battery.plugged = True
+
+        # Assert
+        self.assertEqual(received, [(3300, 3392), 3392, 3392])
+        self.assertEqual(changes, ["voltage", "plugged"])
+
+    def testCompileSetters_WhenSetterOverridden_ShouldUseIt(self):
+        # Arrange
+        received = []
+        battery = ScaledBattery()
+
+        # Action
+        battery.voltage = 2
+        battery.observeElement(
+            "voltage", lambda previous, value: received.append(
+                (previous, value)))
+        battery.voltage = 3
+
+        # Assert
+        # observers receive the value given to the setter
+        self.assertEqual(received, [(20, 3)])
+        self.assertEqual(battery.voltage, 30)
+
+    def testCompileSetters_ShouldHonourBatchAndComparator(self):
+        # Arrange
+        received = []
+        battery = CompiledBattery()
+        battery.capacity = 4000
+        battery.observeElements(
+            ["voltage", "capacity"], lambda previous, value: received.append(
+                value))
+
+        # Action
+        battery.capacity = 4000
+        with battery.batch():
+            battery.voltage = 3300
+            battery.voltage = 3392
+
+        # Assert
+        self.assertEqual(received, [{"voltage": 3392, "capacity": 4000}])
+
+    def testCompileSetters_ShouldRefreshComputedProperties(self):
+        # Arrange
+        received = []
+        battery = CompiledBattery()
+        battery.observeElement(
+            "percent", lambda previous, value: received.append(
+                (previous, value)))
+
+        # Action
+        battery.level = 0.67
+
+        # Assert
+        self.assertEqual(received, [(0, 67)])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,263 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import copy
+import unittest
+from observablePy import Observable, observable_property
+from observablePy import (
+    CollectionChange, ObservableDict, ObservableList, ObservableSet)
+
+"""
+Playlist is the class used for testing the observable collections
+"""
+
+
+class Playlist(Observable):
+    def __init__(self):
+        super().__init__()
+        self.songs = ObservableList(["Roxanne", "Message in a Bottle"])
+        self.ratings = ObservableDict({"Roxanne": 4})
+        self.genres = ObservableSet({"rock"})
+
+    @observable_property
+    def songs(self):
+        return self.__songs
+
+    @songs.setter
+    def songs(self, value):
+        self.__songs = value
+
+    @observable_property
+    def ratings(self):
+        return self.__ratings
+
+    @ratings.setter
+    def ratings(self, value):
+        self.__ratings = value
+
+    @observable_property
+    def genres(self):
+        return self.__genres
+
+    @genres.setter
+    def genres(self, value):
+        self.__genres = value
+
+
+class ComparedPlaylist(Observable):
+    def __init__(self):
+        super().__init__()
+        self.songs = ObservableList()
+
+    @observable_property(compare="equality")
+    def songs(self):
+        return self.__songs
+
+    @songs.setter
+    def songs(self, value):
+        self.__songs = value
+
+
+class ObservableCollectionsTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.playlist = Playlist()
+        self.changes = []
+        self.playlist.observeDeltas(
+            ["songs", "ratings", "genres"], self.changes.append)
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.playlist = None
+
+    def actions(self):
+        return [(change.action, change.key, change.value, change.previous)
+                for change in self.changes]
+
+    """
+    ObservableList
+    """
+
+    def testList_WhenAppend_ShouldDiffuseInsert(self):
+        # Action
+        self.playlist.songs.append("Synchronicity")
+
+        # Assert
+        self.assertEqual(self.changes, [CollectionChange(
+            "songs", "insert", 2, "Synchronicity", None)])
+
+    def testList_WhenChanged_ShouldDiffuseDeltas(self):
+        # Arrange
+        songs = self.playlist.songs
+
+        # Action
+        songs.insert(-1, "Synchronicity")
+        songs[0] = "So Lonely"
+        songs.extend(["Every Breath", "King of Pain"])
+        del songs[1:3]
+        songs.pop()
+        songs.remove("So Lonely")
+        songs.reverse()
+        songs.clear()
+
+        # Assert
+        self.assertEqual(self.actions(), [
+            ("insert", 1, "Synchronicity", None),
+            ("replace", 0, "So Lonely", "Roxanne"),
+            ("insert", slice(3, 5), ["Every Breath", "King of Pain"], None),
+            ("remove", slice(1, 3), None,
+                ["Synchronicity", "Message in a Bottle"]),
+            ("remove", 2, None, "King of Pain"),
+            ("remove", 0, None, "So Lonely"),
+            ("reorder", None, None, None),
+            ("clear", None, None, None)])
+
+    def testList_WhenDeltasApplied_ShouldMirrorList(self):
+        # Arrange
+        mirror = list(self.playlist.songs)
+        songs = self.playlist.songs
+
+        # Action
+        songs += ["Every Breath", "King of Pain", "Roxanne"]
+        songs[::2] = ["A", "B", "C"]
+        songs[1:2] = ["D", "E", "F"]
+        del songs[-1]
+        for change in self.changes:
+            if change.action == "remove":
+                del mirror[change.key]
+            elif change.action == "replace":
+                mirror[change.key] = change.value
+            elif isinstance(change.key, slice):
+                mirror[change.key.start:change.key.start] = change.value
+            else:
+                mirror.insert(change.key, change.value)
+
+        # Assert
+        self.assertEqual(mirror, list(songs))
+
+    def testList_WhenElementObserved_ShouldReceiveCollection(self):
+        # Arrange
+        received = []
+        self.playlist.observeElement(
+            "songs", lambda previous, actual: received.append(
+                (previous, actual)))
+
+        # Action
+        self.playlist.songs.append("Synchronicity")
+
+        # Assert
+        self.assertEqual(len(received), 1)
+        self.assertIs(received[0][0], self.playlist.songs)
+        self.assertIs(received[0][1], self.playlist.songs)
+
+    def testList_WhenCompared_ShouldStillDiffuseInPlaceChanges(self):
+        # Arrange
+        received = []
+        playlist = ComparedPlaylist()
+        playlist.observeElement(
+            "songs", lambda previous, actual: received.append(
+                list(actual)))
+
+        # Action
+        playlist.songs.append("Roxanne")
+
+        # Assert
+        self.assertEqual(received, [["Roxanne"]])
+        self.assertEqual(playlist.getSuppressedDiffusions(), {})
+
+    """
+    ObservableDict
+    """
+
+    def testDict_WhenChanged_ShouldDiffuseDeltas(self):
+        # Arrange
+        ratings = self.playlist.ratings
+
+        # Action
+        ratings["Roxanne"] = 5
+        ratings.update({"Synchronicity": 3})
+        ratings.setdefault("Synchronicity", 1)
+        del ratings["Roxanne"]
+        ratings.pop("Synchronicity")
+        ratings.pop("Unknown", None)
+
+        # Assert
+        self.assertEqual(self.actions(), [
+            ("replace", "Roxanne", 5, 4),
+            ("insert", "Synchronicity", 3, None),
+            ("remove", "Roxanne", None, 5),
+            ("remove", "Synchronicity", None, 3)])
+
+    """
+    ObservableSet
+    """
+
+    def testSet_WhenChanged_ShouldDiffuseDeltas(self):
+        # Arrange
+        genres = self.playlist.genres
+
+        # Action
+        genres.add("reggae")
+        genres.add("reggae")
+        genres |= {"punk"}
+        genres -= {"rock"}
+        genres.discard("jazz")
+
+        # Assert
+        self.assertEqual(self.actions(), [
+            ("insert", "reggae", "reggae", None),
+            ("insert", "punk", "punk", None),
+            ("remove", "rock", None, "rock")])
+
+    """
+    Binding
+    """
+
+    def testSet_WhenNewCollection_ShouldDiffuseReset(self):
+        # Arrange
+        previousSongs = self.playlist.songs
+        songs = ObservableList()
+
+        # Action
+        self.playlist.songs = songs
+        previousSongs.append("Roxanne")
+        songs.append("Synchronicity")
+
+        # Assert
+        self.assertEqual(self.actions(), [
+            ("reset", None, songs, previousSongs),
+            ("insert", 0, "Synchronicity", None)])
+
+    def testCopy_ShouldNotBeBound(self):
+        # Action
+        songs = copy.deepcopy(self.playlist.songs)
+        songs.append("Synchronicity")
+
+        # Assert
+        self.assertIsInstance(songs, ObservableList)
+        self.assertEqual(self.changes, [])
+
+    def testUnObserveDeltas_ShouldStopDiffusing(self):
+        # Action
+        self.playlist.unObserveDeltas(
+            ["songs", "ratings", "genres"], self.changes.append)
+        self.playlist.songs.append("Synchronicity")
+
+        # Assert
+        self.assertEqual(self.changes, [])
+
+    def testObserveDeltas_WhenNotObservableElement_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            self.playlist.observeDeltas("duration", print)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@
 import unittest
 from observablePy import Observable
 from observablePy import observable_property
+from observablePy import tolerance
 
 """
 Battery is the class used for testing the Observable
@@ -47,6 +48,33 @@ class Battery(Observable):
         self.__plugged = value
 
 
+class Sensor(Observable):
+    def __init__(self):
+        super().__init__()
+        self.__value = 0.0
+        self.__name = "cell"
+
+    @observable_property(compare=tolerance(0.1))
+    def value(self):
+        return self.__value
+
+    @value.setter
+    def value(self, value):
+        self.__value = value
+
+    @value.deleter
+    def value(self):
+        self.__value = None
+
+    @observable_property(compare="equality")
+    def name(self):
+        return self.__name
+
+    @name.setter
+    def name(self, value):
+        self.__name = value
+
+
 class ObservableTest(unittest.TestCase):
 
     """
@@ -85,6 +113,94 @@ class ObservableTest(unittest.TestCase):
         self.assertTrue(self.battery.hasObservableElements())
         self.assertFalse(self.battery.isObservableElement("capacity"))
 
+    """
+    Setter and deleter
+    """
+
+    def testSet_WhenNotObserved_ShouldSetWithoutReading(self):
+        # Arrange
+        reads = 0
+
+        class Sensor(Observable):
+            def __init__(self):
+                super().__init__()
+                self.__value = 0
+
+            @observable_property
+            def value(self):
+                nonlocal reads
+                reads += 1
+                return self.__value
+
+            @value.setter
+            def value(self, value):
+                self.__value = value
+
+        sensor = Sensor()
+
+        # Action
+        sensor.value = 12
+
+        # Assert
+        self.assertEqual(reads, 0)
+        self.assertEqual(sensor.value, 12)
+
+    def testDelete_WhenNotObserved_ShouldDelete(self):
+        # Arrange
+        self.battery.voltage = 3392
+
+        # Action
+        del(self.battery.voltage)
+
+        # Assert
+        self.assertEqual(self.battery.voltage, 0)
+
+
+    """
+    Compare
+    """
+
+    def testCompare_WhenValueUnchanged_ShouldNotEmit(self):
+        # Arrange
+        sensor = Sensor()
+        received = []
+
+        sensor.observeElements(["value", "name"],
+                               lambda previous, actual: received.append(
+                                   actual))
+
+        # Action
+        sensor.value = 0.05
+        sensor.name = "cell"
+
+        # Assert
+        self.assertEqual(received, [])
+        self.assertEqual(sensor.value, 0.05)
+        self.assertEqual(sensor.getSuppressedDiffusions(),
+                         {"value": 1, "name": 1})
+
+    def testCompare_WhenValueChanged_ShouldEmit(self):
+        # Arrange
+        sensor = Sensor()
+        received = []
+
+        sensor.observeElement("value",
+                              lambda previous, actual: received.append(
+                                  (previous, actual)))
+
+        # Action
+        sensor.value = 0.5
+        del(sensor.value)
+
+        # Assert
+        self.assertEqual(received, [(0.0, 0.5), (0.5, None)])
+        self.assertEqual(sensor.getSuppressedDiffusions(), {})
+
+    def testCompare_WhenDefinedSetterAfter_ShouldKeepComparator(self):
+        # Action and Assert
+        self.assertIsNotNone(Sensor.value.compare)
+        self.assertIsNone(Battery.voltage.compare)
+
 
 if __name__ == '__main__':
     unittest.main()
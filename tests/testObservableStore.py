@@ -3,6 +3,7 @@
 
 import unittest
 from observablePy.ObservableStore import ObservableStore
+from observablePy.ObserverTypeEnum import glob
 
 
 class ObserverStoreTests(unittest.TestCase):
@@ -80,6 +81,19 @@ class ObserverStoreTests(unittest.TestCase):
         # Assert
         self.assertFalse(self.observables.hasObservableElements())
 
+    def testAdd_WhenCopyOnWrite_ShouldNotChangeSharedElements(self):
+        # Arrange
+        shared = ["voltage"]
+        observables = ObservableStore(shared, copyOnWrite=True)
+
+        # Action
+        observables.add("level")
+        observables.remove("voltage")
+
+        # Assert
+        self.assertEqual(observables.getObservableElements(), ["level"])
+        self.assertEqual(shared, ["voltage"])
+
     def testRemove_whenTryingNotExisting_ShouldRemove(self):
         # Arrange
         self.observables.add("voltage")
@@ -161,3 +175,17 @@ class ObserverStoreTests(unittest.TestCase):
         # Action and Assert
         with self.assertRaises(TypeError):
             actualResult = observables.areObservableElements(14)
+
+    """
+    getMatchingElements
+    """
+    def testGetMatchingElements_ShouldGiveMatchingElementsInOrder(self):
+        # Arrange
+        observables = ObservableStore(
+            ["cell1_voltage", "level", "cell0_voltage"])
+
+        # Action
+        actualResult = observables.getMatchingElements(glob("cell*_voltage"))
+
+        # Assert
+        self.assertEqual(actualResult, ["cell1_voltage", "cell0_voltage"])
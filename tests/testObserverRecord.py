@@ -0,0 +1,59 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from observablePy.ObserverRecord import ObserverRecord
+from observablePy.ObserverTypeEnum import observerTypeEnum
+
+
+class ObserverRecordTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.record = ObserverRecord(
+            "voltage", observerTypeEnum.element, print)
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.record = None
+
+    """
+    Init
+    """
+
+    def testInit_ShouldInitiateValue(self):
+        # Assert
+        self.assertEqual(self.record.observing, "voltage")
+        self.assertIs(self.record.type, observerTypeEnum.element)
+        self.assertIs(self.record.call, print)
+        self.assertIsNone(self.record.actions)
+        self.assertIsNone(self.record.executor)
+
+    def testInit_ShouldNotHaveDict(self):
+        # Action and Assert
+        with self.assertRaises(AttributeError):
+            self.record.extra = True
+
+    """
+    getitem
+    """
+
+    def testGetItem_ShouldGiveField(self):
+        # Action and Assert
+        self.assertEqual(self.record["observing"], "voltage")
+        self.assertIs(self.record["call"], print)
+
+    def testGetItem_UsingUnknownKey_ShouldRaiseError(self):
+        # Action and Assert
+        with self.assertRaises(KeyError):
+            self.record["weight"]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,16 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import gc
+import sys
 import unittest
 from observablePy.ObserverStore import ObserverStore
-from observablePy.ObserverTypeEnum import observerTypeEnum
+from observablePy.ObserverTypeEnum import glob, observerTypeEnum
+
+
+class Widget():
+    def voltageHandle(self, previousValue, value):
+        print("Changes")
 
 
 class ObserverStoreTests(unittest.TestCase):
@@ -48,11 +55,10 @@ class ObserverStoreTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(self.observers.hasObservers())
+        observer, = self.observers._observers
         self.assertEqual(
-            self.observers._observers,
-            [{"observing": "voltage",
-              "type": observerTypeEnum.element,
-              "call": changeHandle}])
+            (observer.observing, observer.type, observer.call),
+            ("voltage", observerTypeEnum.element, changeHandle))
 
     def testAdd_UsingMultiElements_ShouldAdd(self):
         # Arrange
@@ -64,11 +70,11 @@ class ObserverStoreTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(self.observers.hasObservers())
+        observer, = self.observers._observers
         self.assertEqual(
-            self.observers._observers,
-            [{"observing": ["voltage", "level"],
-              "type": observerTypeEnum.listOfElements,
-              "call": changeHandle}])
+            (observer.observing, observer.type, observer.call),
+            (["voltage", "level"], observerTypeEnum.listOfElements,
+             changeHandle))
 
     def testAdd_UsingAllElements_ShouldAdd(self):
         # Arrange
@@ -80,11 +86,10 @@ class ObserverStoreTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(self.observers.hasObservers())
+        observer, = self.observers._observers
         self.assertEqual(
-            self.observers._observers,
-            [{"observing": "*",
-              "type": observerTypeEnum.state,
-              "call": changeHandle}])
+            (observer.observing, observer.type, observer.call),
+            ("*", observerTypeEnum.state, changeHandle))
 
     def testAdd_UsingUnknowElement_ShouldRaiseError(self):
         # Arrange
@@ -200,3 +205,206 @@ class ObserverStoreTests(unittest.TestCase):
 
         # Assert
         self.assertEqual(actualResult, 3)
+
+    def testIteration_UsingSimilarElementName_ShouldNotIter(self):
+        # Arrange
+        def changeHandle():
+            print("Changes")
+
+        self.observers.add("voltageMax", changeHandle)
+        self.observers.add(["level", "voltageMax"], changeHandle)
+
+        # Action
+        actualResult = len(list(self.observers.iterationGenerator("voltage")))
+
+        # Assert
+        self.assertEqual(actualResult, 0)
+
+    def testIteration_WhenStateObserverAddedLater_ShouldIterInOrder(self):
+        # Arrange
+        def voltageHandle():
+            print("Changes")
+
+        def stateHandle():
+            print("Changes")
+
+        self.observers.add("voltage", voltageHandle)
+        self.observers.add("*", stateHandle)
+
+        # Action
+        actualResult = [o["call"] for o in
+                        self.observers.iterationGenerator("voltage")]
+
+        # Assert
+        self.assertEqual(actualResult, [voltageHandle, stateHandle])
+        self.assertEqual(
+            len(list(self.observers.iterationGenerator("level"))), 1)
+
+    def testIteration_UsingElementNames_ShouldIterOnce(self):
+        # Arrange
+        def voltageHandle():
+            print("Changes")
+
+        def elementsHandle():
+            print("Changes")
+
+        def stateHandle():
+            print("Changes")
+
+        self.observers.add("voltage", voltageHandle)
+        self.observers.add(["level", "voltage"], elementsHandle)
+        self.observers.add("plugged", print)
+        self.observers.add("*", stateHandle)
+
+        # Action
+        actualResult = [o.call for o in
+                        self.observers.iterationGenerator(
+                            ("voltage", "level"))]
+
+        # Assert
+        self.assertEqual(actualResult,
+                         [voltageHandle, elementsHandle, stateHandle])
+
+    def testIteration_WhenRemoved_ShouldNotIter(self):
+        # Arrange
+        def changeHandle():
+            print("Changes")
+
+        self.observers.add("voltage", changeHandle)
+        self.observers.add(["level", "voltage"], changeHandle)
+        self.observers.add("*", changeHandle)
+
+        # Action
+        self.observers.remove(["level", "voltage"], changeHandle)
+        self.observers.remove("*", changeHandle)
+
+        # Assert
+        self.assertEqual(
+            len(list(self.observers.iterationGenerator("voltage"))), 1)
+        self.assertEqual(
+            len(list(self.observers.iterationGenerator("level"))), 0)
+
+    def testRemove_WhenNotObserving_ShouldRaiseError(self):
+        # Arrange
+        def changeHandle():
+            print("Changes")
+
+        self.observers.add("voltage", changeHandle)
+
+        # Action and Assert
+        with self.assertRaises(ValueError):
+            self.observers.remove("level", changeHandle)
+
+    """
+    weak
+    """
+    def testAdd_WhenWeak_ShouldNotKeepObserverAlive(self):
+        # Arrange
+        widget = Widget()
+        self.observers.add("voltage", widget.voltageHandle, weak=True)
+
+        # Action
+        del widget
+        gc.collect()
+
+        # Assert
+        self.assertFalse(self.observers.hasObservers())
+        self.assertEqual(self.observers.getObservers(), [])
+        self.assertFalse(self.observers.isObserved("voltage"))
+
+    def testAdd_WhenWeak_ShouldGiveAndRemoveObserver(self):
+        # Arrange
+        widget = Widget()
+        self.observers.add("voltage", widget.voltageHandle, weak=True)
+
+        # Action
+        actualResult = self.observers.getObservers()
+        self.observers.remove("voltage", widget.voltageHandle)
+
+        # Assert
+        self.assertEqual(actualResult, [{
+            "observing": "voltage",
+            "call": widget.voltageHandle
+        }])
+        self.assertFalse(self.observers.hasObservers())
+
+    def testIteration_WhenWeakObserverDead_ShouldPruneIt(self):
+        # Arrange
+        widget = Widget()
+        self.observers.add("voltage", widget.voltageHandle, weak=True)
+        self.observers.add("*", print)
+
+        # Action
+        del widget
+        gc.collect()
+        actualResult = len(list(self.observers.iterationGenerator("voltage")))
+
+        # Assert
+        self.assertEqual(actualResult, 1)
+        self.assertEqual(len(self.observers._observers), 1)
+
+    def testAdd_WhenWeakObserversDropped_ShouldKeepMemoryFlat(self):
+        # Arrange
+        def cycle():
+            widget = Widget()
+            self.observers.add("voltage", widget.voltageHandle, weak=True)
+
+        for _ in range(10000):
+            cycle()
+        gc.collect()
+        allocatedBlocks = sys.getallocatedblocks()
+
+        # Action
+        for _ in range(1000000):
+            cycle()
+        gc.collect()
+
+        # Assert
+        self.assertLessEqual(len(self.observers._observers), 1)
+        self.assertLess(sys.getallocatedblocks() - allocatedBlocks, 1000)
+
+    """
+    pattern
+    """
+
+    def testAdd_WhenPattern_ShouldIndexMatchingElements(self):
+        # Arrange
+        self.observers.add("cell0_voltage", print)
+
+        # Action
+        observer = self.observers.add(
+            glob("cell*"), print, elements=["cell0_voltage", "cell1_voltage"])
+
+        # Assert
+        self.assertEqual(observer.type, observerTypeEnum.pattern)
+        self.assertEqual(
+            len(list(self.observers.iterationGenerator("cell0_voltage"))), 2)
+        self.assertTrue(self.observers.isObserved("cell1_voltage"))
+        self.assertFalse(self.observers.isObserved("voltage"))
+
+    def testOnElementAdded_ShouldKeepSubscriptionOrder(self):
+        # Arrange
+        self.observers.add(glob("cell*"), print)
+        self.observers.add("cell0_voltage", max)
+
+        # Action
+        self.observers.onElementAdded("cell0_voltage")
+        self.observers.onElementAdded("voltage")
+
+        # Assert
+        self.assertEqual(
+            [o.call for o in self.observers.iterationGenerator(
+                "cell0_voltage")], [print, max])
+        self.assertFalse(self.observers.isObserved("voltage"))
+
+    def testOnElementRemoved_ShouldUnindexPattern(self):
+        # Arrange
+        observer = self.observers.add(
+            glob("cell*"), print, elements=["cell0_voltage", "cell1_voltage"])
+
+        # Action
+        self.observers.onElementRemoved("cell0_voltage")
+
+        # Assert
+        self.assertEqual(observer.elements, ("cell1_voltage",))
+        self.assertFalse(self.observers.isObserved("cell0_voltage"))
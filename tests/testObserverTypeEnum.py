@@ -1,8 +1,9 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import re
 import unittest
-from observablePy.ObserverTypeEnum import observerTypeEnum
+from observablePy.ObserverTypeEnum import glob, observerTypeEnum
 
 
 class ObserverStoreTests(unittest.TestCase):
@@ -38,6 +39,26 @@ class ObserverStoreTests(unittest.TestCase):
         # Assert
         self.assertEqual(actualValue, observerTypeEnum.listOfElements)
 
+    def testTypeOf_Glob_ShouldReturnPatternEnumValue(self):
+        # Arrange
+
+        # Action
+        actualValues = [observerTypeEnum.typeOf(glob("cell*_voltage")),
+                        observerTypeEnum.typeOf("cell*_voltage")]
+
+        # Assert
+        self.assertEqual(actualValues, [observerTypeEnum.pattern,
+                                        observerTypeEnum.element])
+
+    def testTypeOf_Regex_ShouldReturnPatternEnumValue(self):
+        # Arrange
+
+        # Action
+        actualValue = observerTypeEnum.typeOf(re.compile(r"cell\d+"))
+
+        # Assert
+        self.assertEqual(actualValue, observerTypeEnum.pattern)
+
     def testTypeOf_Unknown_ShouldReturnUnknownEnumValue(self):
         # Arrange
 
@@ -46,3 +67,22 @@ class ObserverStoreTests(unittest.TestCase):
 
         # Assert
         self.assertEqual(actualValue, observerTypeEnum.unknown)
+
+    """
+    matches
+    """
+
+    def testMatches_ShouldMatchWholeName(self):
+        # Arrange
+        regex = re.compile(r"cell\d+_voltage")
+
+        # Action
+        actualValues = [
+            observerTypeEnum.matches(glob("cell?_voltage"), "cell1_voltage"),
+            observerTypeEnum.matches(glob("cell?_voltage"), "cell12_voltage"),
+            observerTypeEnum.matches(regex, "cell12_voltage"),
+            observerTypeEnum.matches(regex, "cell12_voltage_max")]
+
+        # Assert
+        self.assertEqual(actualValues, [True, False, True, False])
+
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import unittest
+from observablePy.RateLimiter import Debounce, Throttle
+from observablePy.TimerWheel import TimerWheel, VirtualClock
+
+
+class RateLimiterTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.wheel = TimerWheel(tick=0.01, clock=self.clock)
+        self.received = []
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.wheel = None
+        self.clock = None
+
+    def deliver(self, previous, actual):
+        self.received.append((previous, actual))
+
+    """
+    Throttle
+    """
+
+    def testThrottle_ShouldDeliverFirstChangeAtOnce(self):
+        # Arrange
+        throttle = Throttle(0.1, self.wheel)
+        throttle.deliver = self.deliver
+
+        # Action
+        throttle.push(0, 1)
+
+        # Assert
+        self.assertEqual(self.received, [(0, 1)])
+
+    def testThrottle_ShouldMergeChangesOfInterval(self):
+        # Arrange
+        throttle = Throttle(0.1, self.wheel)
+        throttle.deliver = self.deliver
+
+        # Action
+        for value in range(1, 21):
+            throttle.push(value - 1, value)
+            self.clock.advance(0.01)
+        self.clock.advance(0.1)
+
+        # Assert
+        self.assertEqual(self.received, [(0, 1), (1, 10), (10, 20)])
+
+    """
+    Debounce
+    """
+
+    def testDebounce_ShouldDeliverOnceQuiet(self):
+        # Arrange
+        debounce = Debounce(0.05, self.wheel)
+        debounce.deliver = self.deliver
+
+        # Action
+        for value in range(1, 11):
+            debounce.push(value - 1, value)
+            self.clock.advance(0.01)
+        deliveredWhileChanging = list(self.received)
+        self.clock.advance(0.05)
+
+        # Assert
+        self.assertEqual(deliveredWhileChanging, [])
+        self.assertEqual(self.received, [(0, 10)])
+
+
+    """
+    cancel
+    """
+
+    def testCancel_ShouldForgetPendingChanges(self):
+        # Arrange
+        debounce = Debounce(0.05, self.wheel)
+        debounce.deliver = self.deliver
+        debounce.push(0, 1)
+
+        # Action
+        debounce.cancel()
+        debounce.push(1, 2)
+        self.clock.advance(0.1)
+
+        # Assert
+        self.assertEqual(self.received, [])
+        self.assertEqual(len(self.wheel), 0)
+
+if __name__ == '__main__':
+    unittest.main()
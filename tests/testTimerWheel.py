@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+from observablePy.TimerWheel import TimerWheel, VirtualClock
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    """
+    setUp each test
+    """
+
+    def setUp(self):
+        self.clock = VirtualClock()
+        self.wheel = TimerWheel(tick=0.01, slotBits=4, levels=3,
+                                clock=self.clock)
+        self.fired = []
+
+    """
+    tearDown each test
+    """
+
+    def tearDown(self):
+        self.wheel = None
+        self.clock = None
+
+    """
+    schedule
+    """
+
+    def testSchedule_ShouldFireOnceExpired(self):
+        # Arrange
+        self.wheel.schedule(0.05, self.fired.append, "voltage")
+
+        # Action
+        self.clock.advance(0.04)
+        firedBefore = list(self.fired)
+        self.clock.advance(0.01)
+
+        # Assert
+        self.assertEqual(firedBefore, [])
+        self.assertEqual(self.fired, ["voltage"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def testSchedule_UsingDelaysAcrossLevels_ShouldFireInOrder(self):
+        # Arrange
+        # 16 slots by level: 0.16s, 2.56s and 40.96s ranges
+        delays = [3.0, 0.02, 41.5, 0.5, 2.56, 0.17, 12.34]
+        for delay in delays:
+            self.wheel.schedule(delay, self.fired.append, delay)
+
+        # Action and Assert
+        elapsed = 0.0
+        while elapsed < 50:
+            self.clock.advance(0.01)
+            elapsed += 0.01
+            for delay in self.fired:
+                self.assertLessEqual(delay, elapsed + 1e-6)
+                self.assertGreater(delay, elapsed - 0.02)
+            del self.fired[:]
+            if len(self.wheel) == 0:
+                break
+
+        self.assertEqual(len(self.wheel), 0)
+
+    def testSchedule_WhenClockJumps_ShouldFireAllDue(self):
+        # Arrange
+        for delay in (0.1, 1.0, 10.0, 100.0):
+            self.wheel.schedule(delay, self.fired.append, delay)
+
+        # Action
+        self.clock.advance(20.0)
+
+        # Assert
+        self.assertEqual(self.fired, [0.1, 1.0, 10.0])
+        self.assertEqual(len(self.wheel), 1)
+
+    """
+    cancel
+    """
+
+    def testCancel_ShouldNotFire(self):
+        # Arrange
+        timer = self.wheel.schedule(0.05, self.fired.append, "voltage")
+        self.wheel.schedule(0.05, self.fired.append, "level")
+
+        # Action
+        self.wheel.cancel(timer)
+        self.wheel.cancel(timer)
+        self.clock.advance(0.1)
+
+        # Assert
+        self.assertEqual(self.fired, ["level"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def testAdvance_WhenTimerRaises_ShouldCallOtherTimers(self):
+        # Arrange
+        def fail():
+            raise RuntimeError("observer failure")
+
+        self.wheel.schedule(0.05, fail)
+        self.wheel.schedule(0.05, self.fired.append, "voltage")
+
+        # Action
+        with self.assertLogs("observablePy.TimerWheel", "ERROR"):
+            self.clock.advance(0.05)
+
+        # Assert
+        self.assertEqual(self.fired, ["voltage"])
+
+    """
+    start
+    """
+
+    def testStart_ShouldFireUsingThread(self):
+        # Arrange
+        wheel = TimerWheel(tick=0.001)
+        fired = threading.Event()
+        wheel.schedule(0.01, fired.set)
+
+        # Action
+        wheel.start()
+
+        # Assert
+        self.assertTrue(fired.wait(5))
+        wheel.stop()
+
+    def testStart_WhenTimerRaises_ShouldKeepThreadRunning(self):
+        # Arrange
+        def fail():
+            raise RuntimeError("observer failure")
+
+        wheel = TimerWheel(tick=0.001)
+        fired = threading.Event()
+        wheel.schedule(0.005, fail)
+
+        # Action
+        with self.assertLogs("observablePy.TimerWheel", "ERROR"):
+            wheel.start()
+            wheel.schedule(0.02, fired.set)
+            fired.wait(5)
+
+        # Assert
+        self.assertTrue(fired.is_set())
+        self.assertTrue(wheel._thread.is_alive())
+        wheel.stop()
+
+    def testGetDefault_ShouldShareWheel(self):
+        # Action and Assert
+        self.assertIs(TimerWheel.getDefault(), TimerWheel.getDefault())
+
+
+if __name__ == '__main__':
+    unittest.main()